@@ -0,0 +1,115 @@
+import logging
+import math
+import time
+
+from telegram.ext import ApplicationHandlerStop
+
+from envio_telegram import CubetaTokens
+
+log = logging.getLogger(__name__)
+
+# Control de admisión de comandos entrantes.
+# Va antes de los CommandHandlers (TypeHandler en el grupo -1). Cada comando
+# paga su coste de dos cubetas de fichas: la del usuario y la del par
+# (usuario, comando). El coste depende del comando (un mes cuesta más que
+# /falta), así que quien pide meses largos en bucle se queda sin fichas mucho
+# antes que el resto. Sin fichas el update se corta ahí con
+# ApplicationHandlerStop y el usuario recibe un aviso con la espera, como mucho
+# uno por cada espera.
+#
+# Las cubetas son por proceso: con varios workers de gunicorn el límite
+# efectivo por usuario se multiplica por el número de workers.
+
+USUARIO = "20/60"    # fichas/segundos: 20 fichas que se recuperan en 60 s
+COMANDO = "5/60"
+MAX_CUBETAS = 10000  # a partir de aquí se olvidan las cubetas llenas
+
+
+def parsear_ritmo(texto):
+    # "20/60" -> (capacidad 20, 20/60 fichas por segundo)
+    capacidad, segundos = (float(x) for x in texto.split("/"))
+    if capacidad <= 0 or segundos <= 0:
+        raise ValueError(f"Ritmo inválido: {texto!r}")
+    return capacidad, capacidad / segundos
+
+
+def parsear_costes(texto):
+    # "buscar=2,Mayo=8" -> {"buscar": 2.0, "mayo": 8.0}
+    costes = {}
+    for parte in texto.split(","):
+        if parte.strip():
+            comando, coste = parte.split("=")
+            costes[comando.strip().lstrip("/").lower()] = float(coste)
+    return costes
+
+
+class Admision:
+    def __init__(self, comandos, enviar, coste=None, usuario=USUARIO, comando=COMANDO):
+        # comandos: los que se controlan (sin "/"); enviar(chat_id, texto): para
+        # los avisos (el planificador de envíos); coste(comando) -> fichas
+        self.comandos = {c.lower() for c in comandos}
+        self.enviar = enviar
+        self.coste = coste or (lambda comando: 1)
+        self.capacidad_usuario, self.ritmo_usuario = parsear_ritmo(usuario)
+        self.capacidad_comando, self.ritmo_comando = parsear_ritmo(comando)
+        self._usuarios = {}        # usuario -> CubetaTokens
+        self._comandos = {}        # (usuario, comando) -> CubetaTokens
+        self._avisado_hasta = {}   # usuario -> time.monotonic() hasta el que no se repite el aviso
+        self.admitidos = 0
+        self.rechazados = 0
+        self.avisos = 0
+
+    def _cubeta(self, cubetas, clave, capacidad, ritmo):
+        cubeta = cubetas.get(clave)
+        if cubeta is None:
+            if len(cubetas) >= MAX_CUBETAS:
+                self._olvidar_llenas(cubetas)
+            cubeta = cubetas[clave] = CubetaTokens(ritmo, capacidad)
+        return cubeta
+
+    def _olvidar_llenas(self, cubetas):
+        # Una cubeta llena es igual que una nueva: se puede tirar
+        for clave in [c for c, cubeta in cubetas.items() if cubeta.llena()]:
+            del cubetas[clave]
+        ahora = time.monotonic()
+        for usuario in [u for u, hasta in self._avisado_hasta.items() if hasta <= ahora]:
+            del self._avisado_hasta[usuario]
+
+    def admitir(self, usuario, comando):
+        # Devuelve 0 si se admite o los segundos que hay que esperar
+        del_usuario = self._cubeta(self._usuarios, usuario, self.capacidad_usuario, self.ritmo_usuario)
+        del_comando = self._cubeta(self._comandos, (usuario, comando),
+                                   self.capacidad_comando, self.ritmo_comando)
+        # Nunca más que la capacidad, o el comando no entraría nunca
+        coste = min(self.coste(comando), self.capacidad_usuario)
+        espera = max(del_usuario.espera(coste), del_comando.espera(1))
+        if espera:
+            self.rechazados += 1
+            return espera
+        del_usuario.intentar(coste)
+        del_comando.intentar(1)
+        self.admitidos += 1
+        return 0
+
+    async def filtrar(self, update, context):
+        # Callback del TypeHandler: deja pasar todo lo que no sea un comando controlado
+        # effective_message: CommandHandler también atiende mensajes editados
+        mensaje = update.effective_message
+        if not mensaje or not mensaje.text or not mensaje.text.startswith("/") or not update.effective_user:
+            return
+        comando = mensaje.text.split(maxsplit=1)[0][1:].split("@", 1)[0].lower()
+        if comando not in self.comandos:
+            return
+        usuario = update.effective_user.id
+        espera = self.admitir(usuario, comando)
+        if not espera:
+            return
+
+        ahora = time.monotonic()
+        if self._avisado_hasta.get(usuario, 0) <= ahora:
+            self._avisado_hasta[usuario] = ahora + espera
+            self.avisos += 1
+            log.info("Comando rechazado por admisión, espera %.1fs", espera,
+                     extra={"usuario_id": usuario, "chat": mensaje.chat_id, "comando": "/" + comando})
+            self.enviar(mensaje.chat_id, f"Vas muy rápido 🙈 Espera {math.ceil(espera)} s y vuelve a intentarlo.")
+        raise ApplicationHandlerStop
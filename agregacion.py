@@ -0,0 +1,52 @@
+import threading
+from datetime import datetime
+
+# Pre-agregación de eventos de analítica antes de mandarlos a Google Sheets.
+# En vez de un evento por comando se llevan contadores por (usuario, comando,
+# ventana de tiempo) y al volcar se emite una fila por contador con su
+# "cantidad". Los comandos que necesitan el evento completo (p. ej. /set, que
+# lleva la fecha de la cita) siguen yendo en crudo.
+#
+# Las cantidades son sumables: si una misma ventana se vuelca varias veces (o
+# desde varios workers) basta con sumar las filas.
+
+VENTANA = 3600
+CRUDOS = ("/set",)
+
+
+class Agregador:
+    def __init__(self, ventana=VENTANA, crudos=CRUDOS):
+        self.ventana = ventana
+        self.crudos = frozenset(crudos)
+        self._lock = threading.Lock()
+        self._contadores = {}   # (usuario, comando, inicio de ventana) -> cantidad
+
+    def registrar(self, usuario, comando, fecha):
+        # Devuelve True si el evento queda agregado y False si hay que
+        # guardarlo en crudo. fecha: ISO del momento del evento.
+        if comando in self.crudos:
+            return False
+        instante = datetime.fromisoformat(fecha).timestamp()
+        inicio = int(instante // self.ventana * self.ventana)
+        clave = (usuario, comando, inicio)
+        with self._lock:
+            self._contadores[clave] = self._contadores.get(clave, 0) + 1
+        return True
+
+    def vaciar(self):
+        # Devuelve las filas agregadas y deja los contadores a cero
+        with self._lock:
+            contadores, self._contadores = self._contadores, {}
+        return [
+            {
+                "usuario": usuario,
+                "comando": comando,
+                "fecha": datetime.fromtimestamp(inicio).isoformat(),
+                "cantidad": cantidad,
+                "ventana": self.ventana,
+            }
+            for (usuario, comando, inicio), cantidad in sorted(contadores.items(), key=lambda x: x[0][2])
+        ]
+
+    def __len__(self):
+        return len(self._contadores)
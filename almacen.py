@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from citas import FORMATO_FECHA
+
+log = logging.getLogger(__name__)
+
+# Capa de persistencia para los handlers async.
+# Los handlers solo encolan en memoria o leen de la caché; una tarea escritora
+# vacía la cola y hace el trabajo de disco en el executor, fuera del loop.
+# Las citas se leen de SQLite la primera vez que se piden para un chat y a
+# partir de ahí se sirven desde la caché.
+
+MAX_LOTE = 512
+MAX_CHATS_CACHE = 10000
+
+
+class AlmacenAsync:
+    def __init__(self, escribir_log, citas, max_chats_cache=MAX_CHATS_CACHE,
+                 comprobar_cambios_cada=None):
+        # escribir_log: función síncrona que hace la E/S del log
+        # citas: AlmacenCitas (SQLite)
+        # comprobar_cambios_cada: con varios procesos, cada cuántos segundos se
+        # mira si otro proceso ha cambiado las citas (y entonces se vacía la caché)
+        self._escribir_log = escribir_log
+        self._citas = citas
+        self.max_chats_cache = max_chats_cache
+        self.comprobar_cambios_cada = comprobar_cambios_cada
+        self._version = None
+        self._ultima_comprobacion = 0.0
+
+        self._cola = None
+        self._tarea = None
+        # chat_id -> ((nombre, datetime), ...), en orden LRU
+        self._cache_citas = OrderedDict()
+
+    async def iniciar(self):
+        loop = asyncio.get_running_loop()
+        self._cola = asyncio.Queue()
+        self._tarea = loop.create_task(self._escritor())
+
+    async def parar(self):
+        if self._tarea is None:
+            return
+        await self._cola.join()
+        self._tarea.cancel()
+        self._tarea = None
+
+    async def añadir_log(self, usuario, comando, fecha=None):
+        # La fecha se fija al encolar, no cuando se escribe
+        fecha = fecha or datetime.now().isoformat()
+        self._cola.put_nowait((self._escribir_log, (usuario, comando, fecha)))
+
+    async def guardar_cita(self, chat_id, fecha, nombre=""):
+        # Todas las escrituras pasan por aquí, así que actualizamos la caché
+        # en el momento y dejamos la escritura en SQLite para el escritor.
+        citas = [c for c in await self.citas(chat_id) if c[0] != nombre]
+        citas.append((nombre, fecha))
+        citas.sort(key=lambda c: c[1])
+        self._cachear(chat_id, tuple(citas))
+        self._cola.put_nowait((self._citas.guardar, (chat_id, fecha.strftime(FORMATO_FECHA), nombre)))
+
+    async def citas(self, chat_id):
+        if self.comprobar_cambios_cada is not None:
+            self._comprobar_cambios()
+        citas = self._cache_citas.get(chat_id)
+        if citas is not None:
+            self._cache_citas.move_to_end(chat_id)
+            return citas
+        loop = asyncio.get_running_loop()
+        citas = await loop.run_in_executor(None, self._citas.listar, chat_id)
+        # Si mientras leíamos alguien guardó una cita, la caché manda
+        return self._cache_citas.get(chat_id) or self._cachear(chat_id, citas)
+
+    def _comprobar_cambios(self):
+        ahora = time.monotonic()
+        if ahora - self._ultima_comprobacion < self.comprobar_cambios_cada:
+            return
+        self._ultima_comprobacion = ahora
+        # PRAGMA data_version no toca disco: se puede hacer desde el loop
+        version = self._citas.version()
+        if version != self._version:
+            self._version = version
+            self._cache_citas.clear()
+
+    def _cachear(self, chat_id, citas):
+        self._cache_citas[chat_id] = citas
+        self._cache_citas.move_to_end(chat_id)
+        while len(self._cache_citas) > self.max_chats_cache:
+            self._cache_citas.popitem(last=False)
+        return citas
+
+    def pendientes(self):
+        return self._cola.qsize() if self._cola else 0
+
+    def _ejecutar(self, lote):
+        for funcion, args in lote:
+            try:
+                funcion(*args)
+            except Exception:
+                log.exception("Error en escritura diferida (%s)", funcion.__name__)
+
+    async def _escritor(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self._cola.get()]
+            while len(lote) < MAX_LOTE and not self._cola.empty():
+                lote.append(self._cola.get_nowait())
+            try:
+                await loop.run_in_executor(None, self._ejecutar, lote)
+            finally:
+                for _ in lote:
+                    self._cola.task_done()
@@ -0,0 +1,51 @@
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+# Fases del arranque con sus tiempos, para ver en qué se va el arranque en frío.
+# Se importa lo primero, así que INICIO es prácticamente el arranque del proceso.
+
+INICIO = time.perf_counter()
+
+
+class Fases:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fases = []   # (nombre, desde el inicio en s, duración en s)
+
+    def medir(self, nombre):
+        return _Fase(self, nombre)
+
+    def marcar(self, nombre):
+        # Un hito sin duración (p. ej. la primera respuesta del webhook)
+        self._apuntar(nombre, time.perf_counter(), 0.0)
+
+    def _apuntar(self, nombre, fin, duracion):
+        with self._lock:
+            self._fases.append((nombre, fin - INICIO, duracion))
+        log.info("%s: %.1f ms (t=%.1f ms)", nombre, duracion * 1000, (fin - INICIO) * 1000,
+                 extra={"fase": nombre, "duracion_ms": round(duracion * 1000, 1)})
+
+    def informe(self):
+        with self._lock:
+            return [{"fase": nombre, "t_ms": round(t * 1000, 1), "duracion_ms": round(d * 1000, 1)}
+                    for nombre, t, d in self._fases]
+
+
+class _Fase:
+    def __init__(self, fases, nombre):
+        self.fases = fases
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        fin = time.perf_counter()
+        self.fases._apuntar(self.nombre, fin, fin - self.inicio)
+
+
+fases = Fases()
@@ -0,0 +1,168 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from urllib.parse import parse_qs
+
+from telegram import Update
+
+import bot
+from bot import TOKEN, application, cola_updates, enrutador, updates_vistos
+from enrutado import cargar_json
+from metricas import TIPO_CONTENIDO, registro
+
+log = logging.getLogger(__name__)
+
+# Punto de entrada ASGI: el servidor HTTP y el bot comparten el mismo event
+# loop, así que no hay hilo aparte ni saltos con run_coroutine_threadsafe.
+#
+#   uvicorn asgi:app --host 0.0.0.0 --port $PORT
+#
+# Sirve las mismas rutas que main.py (la app Flask).
+
+RUTA_WEBHOOK = f"/webhook/{TOKEN}"
+
+
+async def _leer_cuerpo(receive):
+    partes = []
+    while True:
+        mensaje = await receive()
+        partes.append(mensaje.get("body", b""))
+        if not mensaje.get("more_body"):
+            return b"".join(partes)
+
+
+async def _responder(send, estado, cuerpo, tipo="text/plain; charset=utf-8"):
+    if isinstance(cuerpo, str):
+        cuerpo = cuerpo.encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": estado,
+        "headers": [(b"content-type", tipo.encode()),
+                    (b"content-length", str(len(cuerpo)).encode())],
+    })
+    await send({"type": "http.response.body", "body": cuerpo})
+
+
+async def webhook(cuerpo):
+    try:
+        json_update = cargar_json(cuerpo)
+    except ValueError:
+        return 400, "Update inválido"
+    if not isinstance(json_update, dict) or not isinstance(json_update.get("update_id"), int):
+        return 400, "Update inválido"
+    if not enrutador.relevante(json_update):
+        return 200, "ok"
+    if updates_vistos.ya_visto(json_update["update_id"]):
+        return 200, "ok"
+    recibido = time.perf_counter()
+    update = Update.de_json(json_update, application.bot)
+
+    if bot.WEBHOOK_MODO == "inmediato":
+        if not cola_updates.poner((recibido, update)):
+            updates_vistos.olvidar(update.update_id)
+            return 503, "Cola llena"
+        return 200, "ok"
+
+    # shield: si vence el plazo, el update sigue su curso en el despachador
+    tarea = asyncio.ensure_future(bot.despachar(recibido, update))
+    try:
+        await asyncio.wait_for(asyncio.shield(tarea), timeout=10)
+    except asyncio.TimeoutError:
+        if not application.running:
+            # Sin bot arrancado nadie lo va a terminar: que Telegram lo reenvíe
+            tarea.cancel()
+            log.error("Update sin procesar: el bot no está en marcha", extra={"update_id": update.update_id})
+            updates_vistos.olvidar(update.update_id)
+            return 500, "Error"
+        # El id se queda marcado para que el reenvío de Telegram no lo atienda otra vez
+        log.warning("Update lento, se sigue procesando", extra={"update_id": update.update_id})
+        tarea.add_done_callback(bot.fallo_tardio(update.update_id))
+        return 200, "ok"
+    except Exception:
+        log.exception("Error procesando update", extra={"update_id": update.update_id})
+        updates_vistos.olvidar(update.update_id)
+        return 500, "Error"
+    return 200, "ok"
+
+
+async def procesar_logs():
+    # vaciar_logs hace E/S bloqueante (disco y requests): al executor
+    cuerpo, estado = await asyncio.get_running_loop().run_in_executor(None, bot.vaciar_logs)
+    return estado, cuerpo
+
+
+async def set_webhook():
+    webhook_url = f"https://tu-dominio.com/webhook/{TOKEN}"
+    success = await application.bot.set_webhook(url=webhook_url)
+    return 200, f"Webhook {'creado con éxito' if success else 'falló'}"
+
+
+async def home():
+    return 200, "Bot de Valentina y Adrià está vivo 🤍"
+
+
+RUTAS_GET = {
+    "/": home,
+    "/procesar-logs": procesar_logs,
+    "/set-webhook": set_webhook,
+}
+
+
+async def _lifespan(receive, send):
+    while True:
+        mensaje = await receive()
+        if mensaje["type"] == "lifespan.startup":
+            try:
+                await bot.iniciar()
+            except Exception as e:
+                await send({"type": "lifespan.startup.failed", "message": str(e)})
+                return
+            await send({"type": "lifespan.startup.complete"})
+        elif mensaje["type"] == "lifespan.shutdown":
+            await bot.parar()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        return await _lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+
+    ruta, metodo = scope["path"], scope["method"]
+    if ruta == RUTA_WEBHOOK:
+        if metodo != "POST":
+            return await _responder(send, 405, "Method Not Allowed")
+        estado, cuerpo = await webhook(await _leer_cuerpo(receive))
+        return await _responder(send, estado, cuerpo)
+
+    if ruta == "/metrics" and metodo == "GET":
+        return await _responder(send, 200, registro.exponer(), TIPO_CONTENIDO)
+
+    if ruta == "/admin/bloqueos" and metodo == "GET":
+        token = parse_qs(scope.get("query_string", b"").decode()).get("token", [None])[0]
+        if not bot.admin_autorizado(token):
+            return await _responder(send, 403, "Prohibido")
+        return await _responder(send, 200, json.dumps(bot.informe_bloqueos(), ensure_ascii=False),
+                                "application/json")
+
+    if ruta == "/estado-cola" and metodo == "GET":
+        return await _responder(send, 200, json.dumps(cola_updates.estado()),
+                                "application/json")
+
+    funcion = RUTAS_GET.get(ruta)
+    if funcion is None:
+        return await _responder(send, 404, "Not Found")
+    if metodo != "GET":
+        return await _responder(send, 405, "Method Not Allowed")
+    estado, cuerpo = await funcion()
+    return await _responder(send, estado, cuerpo)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 5000)))
@@ -0,0 +1,118 @@
+import http.client
+import itertools
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# Generador de carga: manda updates sintéticos al webhook a un ritmo fijo
+# (modelo abierto) y mide la latencia de cada petición. En modo polling los
+# deja en el stub de Telegram para que el bot los recoja con getUpdates.
+
+MEZCLA = {
+    "/falta": 5,
+    "/start": 2,
+    "/set 2030-06-15 20:00": 1,
+    "/Octubre": 1,
+    "hola": 1,   # texto sin comando: no lo maneja nadie
+}
+
+
+def generar_update(update_id, texto, chat_id):
+    mensaje = {
+        "message_id": update_id,
+        "date": int(time.time()),
+        "chat": {"id": chat_id, "type": "private"},
+        "from": {"id": chat_id, "is_bot": False, "first_name": f"Usuario{chat_id}"},
+        "text": texto,
+    }
+    if texto.startswith("/"):
+        comando = texto.split(maxsplit=1)[0]
+        mensaje["entities"] = [{"type": "bot_command", "offset": 0, "length": len(comando)}]
+    return {"update_id": update_id, "message": mensaje}
+
+
+def percentil(valores, p):
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+
+class _Conexiones(threading.local):
+    # Una conexión keep-alive por hilo
+    def __init__(self, host, puerto):
+        self.conexion = http.client.HTTPConnection(host, puerto, timeout=30)
+
+
+def lanzar(url, tasa, duracion, mezcla=MEZCLA, chats=50, hilos=32, primer_id=1):
+    # Devuelve (latencias en segundos, códigos HTTP, duración real)
+    partes = urlsplit(url)
+    conexiones = _Conexiones(partes.hostname, partes.port)
+    textos, pesos = zip(*mezcla.items())
+    total = int(tasa * duracion)
+    latencias, codigos = [], {}
+    lock = threading.Lock()
+    ids = itertools.count(primer_id)
+
+    def enviar(programado):
+        update = generar_update(next(ids), random.choices(textos, pesos)[0],
+                                random.randint(1, chats))
+        cuerpo = json.dumps(update).encode()
+        espera = programado - time.perf_counter()
+        if espera > 0:
+            time.sleep(espera)
+        try:
+            conexiones.conexion.request("POST", partes.path, cuerpo,
+                                        {"Content-Type": "application/json"})
+            respuesta = conexiones.conexion.getresponse()
+            respuesta.read()
+            codigo = respuesta.status
+        except (OSError, http.client.HTTPException):
+            conexiones.conexion.close()
+            codigo = "error"
+        # Medimos desde el instante programado y no desde el envío real, para
+        # no esconder las colas del lado del cliente (coordinated omission)
+        latencia = time.perf_counter() - programado
+        with lock:
+            latencias.append(latencia)
+            codigos[codigo] = codigos.get(codigo, 0) + 1
+
+    inicio = time.perf_counter() + 0.1
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        for i in range(total):
+            pool.submit(enviar, inicio + i / tasa)
+    return latencias, codigos, time.perf_counter() - inicio
+
+
+def encolar(añadir, tasa, duracion, mezcla=MEZCLA, chats=50, primer_id=1):
+    # Como lanzar, pero para el modo polling: deja cada update en la cola de
+    # getUpdates del stub a su hora. Devuelve ({update_id: instante programado},
+    # duración real); la latencia se mide cuando el stub lo entrega.
+    textos, pesos = zip(*mezcla.items())
+    programados = {}
+    inicio = time.perf_counter() + 0.1
+    for i in range(int(tasa * duracion)):
+        programado = inicio + i / tasa
+        espera = programado - time.perf_counter()
+        if espera > 0:
+            time.sleep(espera)
+        update = generar_update(primer_id + i, random.choices(textos, pesos)[0],
+                                random.randint(1, chats))
+        programados[update["update_id"]] = programado
+        añadir(update)
+    return programados, time.perf_counter() - inicio
+
+
+def resumen(latencias, codigos, duracion):
+    return {
+        "updates": len(latencias),
+        "updates_por_segundo": round(len(latencias) / duracion, 1) if duracion else 0,
+        "p50_ms": round(percentil(latencias, 50) * 1000, 2),
+        "p95_ms": round(percentil(latencias, 95) * 1000, 2),
+        "p99_ms": round(percentil(latencias, 99) * 1000, 2),
+        "max_ms": round(max(latencias, default=0) * 1000, 2),
+        "codigos": codigos,
+    }
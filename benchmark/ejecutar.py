@@ -0,0 +1,142 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from carga import MEZCLA, encolar, lanzar, resumen
+from stubs import StubGoogle, StubTelegram
+
+# Benchmark de extremo a extremo sin red:
+#   carga -> /webhook/<TOKEN> -> application.process_update -> sendMessage (stub)
+#   carga -> getUpdates (stub) -> polling.py -> despachador -> sendMessage (stub)
+#
+#   python benchmark/ejecutar.py --tasa 200 --duracion 20 --servidor asgi --modo inmediato
+#   python benchmark/ejecutar.py --tasa 200 --duracion 20 --servidor polling
+#
+# Arranca los stubs de Telegram y Google, levanta el bot en un subproceso con
+# sus datos en un directorio temporal, lanza la carga y saca un resumen en JSON.
+# Con polling la latencia va del instante programado a la entrega por
+# getUpdates, y no hay /procesar-logs que medir.
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOKEN = "123456:BENCH"
+
+
+def responde(url):
+    try:
+        urllib.request.urlopen(url, timeout=1).read()
+        return True
+    except OSError:
+        return False
+
+
+def esperar_arranque(listo, proceso, timeout=30):
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        if proceso.poll() is not None:
+            raise RuntimeError("El servidor del bot terminó al arrancar")
+        if listo():
+            return
+        time.sleep(0.1)
+    raise RuntimeError("El servidor del bot no arrancó a tiempo")
+
+
+def arrancar_bot(args, telegram, google, directorio):
+    entorno = dict(os.environ,
+                   BOT_TOKEN=TOKEN,
+                   PORT=str(args.puerto),
+                   TELEGRAM_API_URL=telegram.url_base,
+                   GOOGLE_SCRIPT_WEBHOOK=google.url,
+                   WEBHOOK_MODO=args.modo,
+                   ADMISION="1" if args.admision else "0",
+                   PYTHONPATH=RAIZ)
+    if args.servidor == "asgi":
+        orden = [sys.executable, "-m", "uvicorn", "asgi:app", "--port", str(args.puerto),
+                 "--log-level", "warning"]
+    elif args.servidor == "polling":
+        orden = [sys.executable, os.path.join(RAIZ, "polling.py")]
+    else:
+        orden = [sys.executable, os.path.join(RAIZ, "main.py")]
+    salida = open(os.path.join(directorio, "bot.log"), "w")
+    return subprocess.Popen(orden, cwd=directorio, env=entorno, stdout=salida,
+                            stderr=subprocess.STDOUT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del webhook del bot")
+    parser.add_argument("--tasa", type=float, default=100, help="updates por segundo")
+    parser.add_argument("--duracion", type=float, default=10, help="segundos de carga")
+    parser.add_argument("--chats", type=int, default=50)
+    parser.add_argument("--hilos", type=int, default=32)
+    parser.add_argument("--servidor", choices=("flask", "asgi", "polling"), default="flask")
+    parser.add_argument("--modo", choices=("sincrono", "inmediato"), default="sincrono")
+    parser.add_argument("--puerto", type=int, default=18080)
+    parser.add_argument("--latencia-telegram-ms", type=float, default=0)
+    parser.add_argument("--prob-429", type=float, default=0)
+    parser.add_argument("--mezcla", type=json.loads, default=MEZCLA,
+                        help='JSON {"texto": peso}, p. ej. \'{"/falta": 3, "/Mayo": 1}\'')
+    parser.add_argument("--admision", action="store_true",
+                        help="deja activo el control de admisión (por defecto se desactiva "
+                             "para medir el servidor y no los límites por usuario)")
+    parser.add_argument("--drenaje", type=float, default=5,
+                        help="segundos de espera tras la carga para los envíos encolados")
+    args = parser.parse_args()
+
+    telegram = StubTelegram(latencia=args.latencia_telegram_ms / 1000,
+                            prob_429=args.prob_429).iniciar()
+    google = StubGoogle().iniciar()
+    base = f"http://127.0.0.1:{args.puerto}"
+
+    with tempfile.TemporaryDirectory() as directorio:
+        proceso = arrancar_bot(args, telegram, google, directorio)
+        try:
+            if args.servidor == "polling":
+                # Listo cuando ya está pidiendo updates
+                esperar_arranque(lambda: telegram.sondeos > 0, proceso)
+                programados, duracion = encolar(
+                    telegram.añadir_update, args.tasa, args.duracion,
+                    mezcla=args.mezcla, chats=args.chats)
+                time.sleep(args.drenaje)
+                entregados = {i: telegram.entregados[i] for i in programados
+                              if i in telegram.entregados}
+                latencias = [entregados[i] - programados[i] for i in entregados]
+                codigos = {"entregados": len(entregados),
+                           "sin_entregar": len(programados) - len(entregados)}
+                vaciado = None
+            else:
+                esperar_arranque(lambda: responde(base + "/"), proceso)
+                # Damos tiempo a que el bot haga getMe e inicialice
+                time.sleep(1)
+                latencias, codigos, duracion = lanzar(
+                    f"{base}/webhook/{TOKEN}", args.tasa, args.duracion,
+                    mezcla=args.mezcla, chats=args.chats, hilos=args.hilos)
+                time.sleep(args.drenaje)
+
+                inicio = time.perf_counter()
+                urllib.request.urlopen(base + "/procesar-logs", timeout=120).read()
+                vaciado = time.perf_counter() - inicio
+
+            informe = resumen(latencias, codigos, duracion)
+            informe.update({
+                "servidor": args.servidor,
+                "modo": args.modo,
+                "send_message": len(telegram.mensajes),
+                "respuestas_429": telegram.respuestas_429,
+                "logs_en_google": google.logs,
+                "peticiones_google": google.peticiones,
+                "procesar_logs_ms": round(vaciado * 1000, 1) if vaciado is not None else None,
+            })
+            print(json.dumps(informe, indent=2, ensure_ascii=False))
+        finally:
+            proceso.terminate()
+            proceso.wait(timeout=10)
+            telegram.parar()
+            google.parar()
+
+
+if __name__ == "__main__":
+    main()
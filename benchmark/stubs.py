@@ -0,0 +1,155 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+# Servidores falsos para los benchmarks:
+#   StubTelegram: imita la Bot API (getMe, sendMessage, setWebhook, getUpdates...),
+#                 apunta cada sendMessage y puede añadir latencia y respuestas 429.
+#   StubGoogle:   imita el webhook de Google Apps Script y cuenta los logs.
+
+
+class _Servidor:
+    def __init__(self, manejador):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), manejador)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._hilo = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._lock = threading.Lock()
+
+    @property
+    def puerto(self):
+        return self._httpd.server_port
+
+    def iniciar(self):
+        self._hilo.start()
+        return self
+
+    def parar(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class _Manejador(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeceras y cuerpo van en dos escrituras: con Nagle cada petición
+    # keep-alive se retrasa ~40 ms y se mediría el stub en vez del bot
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _leer(self):
+        cuerpo = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            return json.loads(cuerpo or b"{}")
+        # PTB manda los parámetros como formulario con los valores en JSON
+        return {k: v[0] for k, v in parse_qs(cuerpo.decode()).items()}
+
+    def _responder(self, estado, datos):
+        cuerpo = json.dumps(datos).encode()
+        self.send_response(estado)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        try:
+            self.wfile.write(cuerpo)
+        except (BrokenPipeError, ConnectionResetError):
+            # Al parar el bot a mitad de un getUpdates largo
+            pass
+
+
+class _ManejadorTelegram(_Manejador):
+    def do_POST(self):
+        stub = self.server.stub
+        metodo = self.path.rsplit("/", 1)[-1]
+        parametros = self._leer()
+        if stub.latencia:
+            time.sleep(stub.latencia)
+
+        if metodo == "getMe":
+            return self._responder(200, {"ok": True, "result": {
+                "id": 1, "is_bot": True, "first_name": "Bench", "username": "bench_bot"}})
+        if metodo == "sendMessage":
+            if stub.prob_429 and random.random() < stub.prob_429:
+                with stub._lock:
+                    stub.respuestas_429 += 1
+                return self._responder(429, {
+                    "ok": False, "error_code": 429,
+                    "description": f"Too Many Requests: retry after {stub.retry_after}",
+                    "parameters": {"retry_after": stub.retry_after}})
+            chat_id = int(parametros.get("chat_id", 0))
+            with stub._lock:
+                stub.mensajes.append((time.monotonic(), chat_id, parametros.get("text", "")))
+                message_id = len(stub.mensajes)
+            return self._responder(200, {"ok": True, "result": {
+                "message_id": message_id, "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"},
+                "text": parametros.get("text", "")}})
+        if metodo == "getUpdates":
+            # Long-polling: entrega lo encolado con update_id >= offset
+            offset = int(parametros.get("offset") or 0)
+            limite = time.monotonic() + min(float(parametros.get("timeout") or 0), 1.0)
+            while True:
+                with stub._lock:
+                    stub.sondeos += 1
+                    stub.updates = [u for u in stub.updates if u["update_id"] >= offset]
+                    pendientes = stub.updates[:100]
+                    ahora = time.perf_counter()
+                    for update in pendientes:
+                        stub.entregados.setdefault(update["update_id"], ahora)
+                if pendientes or time.monotonic() >= limite:
+                    return self._responder(200, {"ok": True, "result": pendientes})
+                time.sleep(0.01)
+        # setWebhook, deleteWebhook, etc.
+        return self._responder(200, {"ok": True, "result": True})
+
+    do_GET = do_POST
+
+
+class StubTelegram(_Servidor):
+    def __init__(self, latencia=0.0, prob_429=0.0, retry_after=1):
+        super().__init__(_ManejadorTelegram)
+        self.latencia = latencia
+        self.prob_429 = prob_429
+        self.retry_after = retry_after
+        self.mensajes = []      # (instante, chat_id, texto)
+        self.respuestas_429 = 0
+        self.updates = []       # para getUpdates (modo polling)
+        self.entregados = {}    # update_id -> perf_counter de la primera entrega
+        self.sondeos = 0
+
+    def añadir_update(self, update):
+        with self._lock:
+            self.updates.append(update)
+
+    @property
+    def url_base(self):
+        # Valor para TELEGRAM_API_URL (PTB le añade el token)
+        return f"http://127.0.0.1:{self.puerto}/bot"
+
+
+class _ManejadorGoogle(_Manejador):
+    def do_POST(self):
+        stub = self.server.stub
+        datos = self._leer()
+        if stub.latencia:
+            time.sleep(stub.latencia)
+        with stub._lock:
+            stub.peticiones += 1
+            stub.logs += len(datos.get("logs", [datos]))
+        self._responder(200, {"ok": True})
+
+
+class StubGoogle(_Servidor):
+    def __init__(self, latencia=0.0):
+        super().__init__(_ManejadorGoogle)
+        self.latencia = latencia
+        self.peticiones = 0
+        self.logs = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.puerto}/exec"
@@ -0,0 +1,157 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+# Logging estructurado sin bloquear el loop.
+# Los módulos usan logging.getLogger(__name__) y pasan los datos del update en
+# extra (usuario, comando, chat, latencia_ms...). Cada traza se filtra
+# (muestreo y límite por nivel), se encola sin esperar y un hilo aparte la
+# escribe en stdout como una línea JSON. Si la cola se llena, la traza se
+# descarta y se cuenta en vez de frenar a quien la emite.
+#
+# Variables de entorno:
+#   LOG_NIVEL     nivel mínimo (INFO)
+#   LOG_FORMATO   "json" o "texto" (json)
+#   LOG_MUESTREO  fracción que se conserva por nivel, p. ej. "DEBUG=0.1,INFO=0.5"
+#   LOG_LIMITE    trazas por segundo por nivel, p. ej. "INFO=200" (0 = sin límite)
+
+NIVEL = "INFO"
+MUESTREO = "DEBUG=1,INFO=1"
+LIMITE = "DEBUG=100,INFO=500"
+TAMAÑO_COLA = 10000
+
+# Atributos que trae cualquier LogRecord: lo demás viene de extra
+_ESTANDAR = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+def parsear_por_nivel(texto):
+    # "DEBUG=0.1,INFO=1" -> {10: 0.1, 20: 1.0}
+    valores = {}
+    for parte in texto.split(","):
+        if not parte.strip():
+            continue
+        nombre, valor = parte.split("=")
+        nivel = logging.getLevelName(nombre.strip().upper())
+        if not isinstance(nivel, int):
+            raise ValueError(f"Nivel de log desconocido: {nombre!r}")
+        valores[nivel] = float(valor)
+    return valores
+
+
+class FormatoJSON(logging.Formatter):
+    def format(self, record):
+        datos = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "modulo": record.name,
+            "mensaje": record.getMessage(),
+        }
+        for clave, valor in vars(record).items():
+            if clave not in _ESTANDAR:
+                datos[clave] = valor
+        if record.exc_text:
+            datos["error"] = record.exc_text
+        return json.dumps(datos, ensure_ascii=False, default=str)
+
+
+class FiltroMuestreo(logging.Filter):
+    # muestreo: {nivel: fracción que pasa}; limite: {nivel: trazas por segundo}.
+    # Los niveles que no aparecen pasan siempre.
+    def __init__(self, muestreo=None, limite=None):
+        super().__init__()
+        self.muestreo = muestreo or {}
+        self.limite = {nivel: por_segundo for nivel, por_segundo in (limite or {}).items() if por_segundo > 0}
+        self._lock = threading.Lock()
+        self._tokens = dict(self.limite)
+        self._ultimo = {nivel: time.monotonic() for nivel in self.limite}
+        self.descartados = 0
+
+    def filter(self, record):
+        fraccion = self.muestreo.get(record.levelno, 1.0)
+        if fraccion < 1.0 and random.random() >= fraccion:
+            self.descartados += 1
+            return False
+        por_segundo = self.limite.get(record.levelno)
+        if por_segundo is None:
+            return True
+        with self._lock:
+            ahora = time.monotonic()
+            tokens = min(por_segundo, self._tokens[record.levelno]
+                         + (ahora - self._ultimo[record.levelno]) * por_segundo)
+            self._ultimo[record.levelno] = ahora
+            if tokens < 1:
+                self._tokens[record.levelno] = tokens
+                self.descartados += 1
+                return False
+            self._tokens[record.levelno] = tokens - 1
+        return True
+
+
+class _ColaSinEspera(logging.handlers.QueueHandler):
+    def __init__(self, cola):
+        super().__init__(cola)
+        self.descartados = 0
+
+    def prepare(self, record):
+        # Solo lo imprescindible en el hilo que emite; el formato va en el oyente
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.descartados += 1
+
+
+_cola = None
+_filtro = None
+_oyente = None
+
+
+def configurar():
+    # Idempotente: main, asgi y bot la llaman al importarse
+    global _cola, _filtro, _oyente
+    if _oyente is not None:
+        return
+    salida = logging.StreamHandler(sys.stdout)
+    if os.getenv("LOG_FORMATO", "json") == "texto":
+        salida.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    else:
+        salida.setFormatter(FormatoJSON())
+
+    _filtro = FiltroMuestreo(parsear_por_nivel(os.getenv("LOG_MUESTREO", MUESTREO)),
+                             parsear_por_nivel(os.getenv("LOG_LIMITE", LIMITE)))
+    _cola = _ColaSinEspera(queue.Queue(TAMAÑO_COLA))
+    _cola.addFilter(_filtro)
+
+    raiz = logging.getLogger()
+    raiz.setLevel(os.getenv("LOG_NIVEL", NIVEL).upper())
+    raiz.addHandler(_cola)
+    # httpx (PTB) traza cada petición a la API en INFO
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    _oyente = logging.handlers.QueueListener(_cola.queue, salida, respect_handler_level=True)
+    _oyente.start()
+    atexit.register(_oyente.stop)
+
+
+def descartados():
+    # Trazas perdidas por muestreo, límite o cola llena
+    if _oyente is None:
+        return 0
+    return _filtro.descartados + _cola.descartados
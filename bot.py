@@ -0,0 +1,604 @@
+from telegram import InlineQueryResultArticle, InputTextMessageContent, Update
+from telegram.constants import ChatType
+from telegram.ext import Application, CommandHandler, ContextTypes, InlineQueryHandler, TypeHandler
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import os
+import asyncio
+import hmac
+import json
+import logging
+import threading
+import time
+import requests
+
+from admision import COMANDO, USUARIO, Admision, parsear_costes
+from agregacion import CRUDOS, VENTANA, Agregador
+from almacen import AlmacenAsync
+from arranque import fases
+import bitacora
+from buffer_logs import BufferLogs, CursorLogs
+from busqueda import IndiceBusqueda
+from catalogo import CatalogoMensajes, trocear
+from citas import AlmacenCitas
+from coordinacion import Lider, bloqueo_archivo
+from deduplicacion import CacheUpdates, CacheUpdatesCompartida
+from despachador import MAX_CONCURRENTES, MAX_PENDIENTES, DespachadorChats, clave_chat
+from enrutado import Enrutador
+from cola_updates import ColaUpdates
+from envio_logs import ClienteEnvioLogs
+from envio_telegram import GLOBAL_POR_SEGUNDO, PlanificadorEnvios
+from metricas import instrumentar, registro
+from recordatorios import ANTELACIONES, Recordatorios, parsear_antelaciones
+from vigilancia import VigilanteLoop
+
+bitacora.configurar()
+log = logging.getLogger(__name__)
+
+TOKEN = os.getenv("BOT_TOKEN")
+CITAS_DB = os.getenv("CITAS_DB", "citas.db")
+CITA_LEGADO_FILE = "cita.json"  # formato antiguo, una sola cita sin chat
+# Chat al que se asigna la cita de cita.json al migrarla
+CITA_LEGADO_CHAT = os.getenv("CITA_LEGADO_CHAT")
+# Zona horaria en la que se escriben las citas con /set
+ZONA = ZoneInfo(os.getenv("ZONA_HORARIA", "Europe/Madrid"))
+GOOGLE_SCRIPT_WEBHOOK = os.getenv("GOOGLE_SCRIPT_WEBHOOK", "https://script.google.com/macros/s/AKfycbwMrvIWmTHWzGp0UYlu1d0NcSXZT_8Bc3d_ZGbq-h2bLUJ7phsjTwjb7koyCIj56ptD/exec")
+# Para apuntar el bot a otra API (p. ej. el stub de benchmark/): "http://127.0.0.1:8081/bot"
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL")
+LOG_BUFFER_FILE = "log_buffer.json"  # formato antiguo, se migra al arrancar
+LOG_BUFFER_DIR = "log_buffer"
+# Lotes que Google Sheets rechaza con un 4xx: se apartan aquí (JSONL) para no
+# bloquear el resto del buffer
+LOGS_RECHAZADOS = os.path.join(LOG_BUFFER_DIR, ".rechazados")
+# Con ARRANQUE_PEREZOSO=1 los mensajes se leen y trocean al pedirlos por primera vez
+ARRANQUE_PEREZOSO = os.getenv("ARRANQUE_PEREZOSO") == "1"
+MENSAJES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mensajes")
+# Con MULTIPROCESO=1 (varios workers de gunicorn, ver gunicorn.conf.py) el estado
+# compartido pasa a ser seguro entre procesos: deduplicación en SQLite, segmentos
+# del buffer sellados por tiempo, caché de citas que detecta cambios de otros
+# procesos y recordatorios solo en el worker líder.
+MULTIPROCESO = os.getenv("MULTIPROCESO") == "1"
+# Workers que comparten el límite global de envíos de Telegram (por bot, no por
+# proceso); mismo valor por defecto que gunicorn.conf.py
+WORKERS = int(os.getenv("WEB_CONCURRENCY", 2)) if MULTIPROCESO else 1
+# Vaciado automático del buffer de logs (0 lo desactiva y queda solo /procesar-logs)
+LOGS_VACIADO_INTERVALO = float(os.getenv("LOGS_VACIADO_INTERVALO", 60))
+LOGS_VACIADO_BYTES = int(os.getenv("LOGS_VACIADO_BYTES", 1024 * 1024))
+LOGS_BACKOFF_MAXIMO = float(os.getenv("LOGS_BACKOFF_MAXIMO", 600))
+# Las rutas /admin/... piden ?token=<ADMIN_TOKEN>; sin él quedan cerradas
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+lock = threading.Lock()
+
+buffer_logs = BufferLogs(LOG_BUFFER_DIR, max_segundos_segmento=30 if MULTIPROCESO else None)
+buffer_logs.importar_json_legado(LOG_BUFFER_FILE)
+cursor_logs = CursorLogs(os.path.join(LOG_BUFFER_DIR, ".cursor"))
+
+# Mensajes mensuales: un fichero por comando en mensajes/. Cada texto se indexa
+# para /buscar al leerlo (con ARRANQUE_PEREZOSO, en la primera búsqueda).
+indice_busqueda = IndiceBusqueda()
+with fases.medir("catalogo"):
+    catalogo = CatalogoMensajes(MENSAJES_DIR, perezoso=ARRANQUE_PEREZOSO,
+                                al_añadir=indice_busqueda.indexar)
+
+cliente_logs = ClienteEnvioLogs(
+    GOOGLE_SCRIPT_WEBHOOK,
+    tamaño_lote=int(os.getenv("LOG_TAMANO_LOTE", 200)),
+    max_paralelo=int(os.getenv("LOG_MAX_PARALELO", 4)),
+)
+
+# Con AGREGACION=1 los comandos se cuentan por (usuario, comando, ventana) y
+# solo los de AGREGACION_CRUDOS se guardan evento a evento
+agregador = None
+if os.getenv("AGREGACION") == "1":
+    agregador = Agregador(
+        ventana=int(os.getenv("AGREGACION_VENTANA", VENTANA)),
+        crudos=[c for c in os.getenv("AGREGACION_CRUDOS", ",".join(CRUDOS)).split(",") if c],
+    )
+
+def añadir_log_buffer(usuario, comando, fecha=None):
+    fecha = fecha or datetime.now().isoformat()
+    if agregador is not None and agregador.registrar(usuario, comando, fecha):
+        return
+    log = {"usuario": usuario, "comando": comando, "fecha": fecha}
+    buffer_logs.añadir(log)
+
+def volcar_agregados():
+    # Pasa los contadores al buffer, donde quedan a salvo y se envían como el resto
+    if agregador is None:
+        return 0
+    filas = agregador.vaciar()
+    for fila in filas:
+        buffer_logs.añadir(fila)
+    return len(filas)
+
+# Los handlers usan el almacén async; estas funciones hacen la E/S en el executor
+citas_db = AlmacenCitas(CITAS_DB)
+if CITA_LEGADO_CHAT:
+    cita_legada = citas_db.importar_json_legado(CITA_LEGADO_FILE, int(CITA_LEGADO_CHAT))
+    if cita_legada:
+        log.info("Cita de %s migrada al chat %s: %s", CITA_LEGADO_FILE, CITA_LEGADO_CHAT, cita_legada)
+elif os.path.exists(CITA_LEGADO_FILE):
+    log.warning("%s no se ha migrado: define CITA_LEGADO_CHAT con el chat al que pertenece",
+                CITA_LEGADO_FILE)
+almacen = AlmacenAsync(añadir_log_buffer, citas_db,
+                       comprobar_cambios_cada=1.0 if MULTIPROCESO else None)
+
+def registrar_evento(usuario, comando):
+    try:
+        requests.post(GOOGLE_SCRIPT_WEBHOOK,
+                      json={"usuario": usuario, "comando": comando},
+                      timeout=5)
+    except Exception as e:
+        log.warning("Error enviando log a Google Sheets: %s", e,
+                    extra={"usuario": usuario, "comando": comando})
+
+def datos_update(update, user, comando, **campos):
+    # extra de las trazas de los handlers
+    usuario_id = update.effective_user.id if update.effective_user else None
+    chat = update.effective_chat.id if update.effective_chat else None
+    return {"usuario": user, "usuario_id": usuario_id, "chat": chat, "comando": comando, **campos}
+
+def responder(update, texto):
+    # Como reply_text, pero por el planificador de envíos (límites de Telegram
+    # y RetryAfter); en grupos cita el mensaje, igual que reply_text
+    mensaje = update.effective_message
+    if mensaje.chat.type != ChatType.PRIVATE:
+        return planificador.enviar(mensaje.chat_id, texto, reply_to_message_id=mensaje.message_id)
+    return planificador.enviar(mensaje.chat_id, texto)
+
+async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    user = update.effective_user.first_name if update.effective_user else "Usuario desconocido"
+    await almacen.añadir_log(user, "/start")
+    log.info("Inició el bot con /start", extra=datos_update(update, user, "/start"))
+    responder(
+        update,
+        "¡Hola! Soy un bot creado para Valentina y Adrià. A partir de ahora, cada 24 podrás escribir / + el nombre del mes para poder revisar mensajes bonitos, por ejemplo escribe /Junio para disfrutar el de este mes. Además puedes recordar bonitos momentos con /mes y el numero de mes que quieras leer 🤍"
+    )
+
+
+async def set_cita(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    user = update.effective_user.first_name if update.effective_user else "Usuario desconocido"
+    if not context.args:
+        log.info("Usó /set sin argumentos", extra=datos_update(update, user, "/set"))
+        responder(update, "Usa el formato: /set YYYY-MM-DD HH:MM [nombre]")
+        return
+
+    # /set 2025-06-15 20:00 cena -> cita "cena"; sin nombre es la cita por defecto
+    fecha_str = " ".join(context.args[:2])
+    nombre = " ".join(context.args[2:])
+    try:
+        dt = datetime.strptime(fecha_str, "%Y-%m-%d %H:%M")
+        cita_str = dt.replace(second=0).strftime("%Y-%m-%d %H:%M:%S")
+        await almacen.guardar_cita(update.effective_chat.id, dt, nombre)
+        recordatorios.programar(update.effective_chat.id, nombre, dt)
+        await almacen.añadir_log(user, "/set", fecha=cita_str)  # <- Añades fecha de la cita al log
+        cita_str_nombre = f"{cita_str} ({nombre})" if nombre else cita_str
+        log.info("Guardó una cita: %s", cita_str_nombre,
+                 extra=datos_update(update, user, "/set", cita=cita_str, nombre=nombre))
+        responder(update, f"Cita guardada para: {cita_str_nombre}")
+    except ValueError:
+        log.info("Usó /set con formato inválido: %s", fecha_str, extra=datos_update(update, user, "/set"))
+        responder(update, "Formato incorrecto. Usa: /set 2025-06-15 20:00")
+
+def ahora_local():
+    # Hora actual en ZONA, sin tzinfo, comparable con las citas guardadas
+    return datetime.now(ZONA).replace(tzinfo=None)
+
+def elegir_cita(citas, ahora, nombre=None):
+    # Con nombre, esa cita; sin nombre, la próxima (o la última si ya pasaron todas)
+    if nombre is not None:
+        return next((c for c in citas if c[0] == nombre), None)
+    if not citas:
+        return None
+    return next((c for c in citas if c[1] > ahora), citas[-1])
+
+async def cuanto_falta(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    user = update.effective_user.first_name if update.effective_user else "Usuario desconocido"
+    await almacen.añadir_log(user, "/falta")
+    ahora = ahora_local()
+    nombre = " ".join(context.args) if context.args else None
+    elegida = elegir_cita(await almacen.citas(update.effective_chat.id), ahora, nombre)
+    if not elegida:
+        log.info("Usó /falta pero no hay cita guardada", extra=datos_update(update, user, "/falta"))
+        responder(update, "No hay ninguna cita guardada.")
+        return
+
+    nombre, cita = elegida
+    diferencia = cita - ahora
+    para = f"la cita «{nombre}»" if nombre else "la cita"
+
+    if diferencia.total_seconds() <= 0:
+        log.info("Usó /falta: la cita ya pasó o es ahora mismo", extra=datos_update(update, user, "/falta"))
+        responder(update, "¡La cita ya pasó o es ahora mismo! Divertíos")
+    else:
+        total_segundos = int(diferencia.total_seconds())
+        dias = total_segundos // 86400
+        horas = (total_segundos % 86400) // 3600
+        minutos = (total_segundos % 3600) // 60
+        segundos = total_segundos % 60
+        log.info("Usó /falta: faltan %dd %dh %dm %ds", dias, horas, minutos, segundos,
+                 extra=datos_update(update, user, "/falta", segundos_restantes=total_segundos))
+        responder(
+            update,
+            f"Faltan {dias} días, {horas} horas, {minutos} minutos y {segundos} segundos para {para}. ⏳"
+        )
+
+async def mes_mensaje(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    # "/Octubre@bot args" -> "Octubre" (effective_message: también si se editó)
+    comando = update.effective_message.text.split(maxsplit=1)[0][1:].split("@", 1)[0]
+    # Las partes se encolan en el planificador, que las envía en orden
+    # respetando los límites de Telegram
+    for parte in catalogo.partes(comando):
+        planificador.enviar(update.effective_chat.id, parte)
+
+def indexar_catalogo():
+    # Con el catálogo perezoso puede haber meses sin leer todavía
+    for comando in catalogo.comandos():
+        if comando not in indice_busqueda:
+            catalogo.añadir(comando)
+
+async def buscar(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    user = update.effective_user.first_name if update.effective_user else "Usuario desconocido"
+    await almacen.añadir_log(user, "/buscar")
+    if not context.args:
+        log.info("Usó /buscar sin argumentos", extra=datos_update(update, user, "/buscar"))
+        responder(update, "Usa el formato: /buscar palabras")
+        return
+
+    consulta = " ".join(context.args)
+    indexar_catalogo()
+    resultados = indice_busqueda.buscar(consulta, prefijo=False)
+    log.info("Buscó «%s»: %d resultados", consulta, len(resultados),
+             extra=datos_update(update, user, "/buscar", resultados=len(resultados)))
+    if not resultados:
+        responder(update, "No he encontrado nada con esas palabras.")
+        return
+    responder(update, "\n\n".join(
+        f"/{r.comando} (párrafo {r.parrafo}): {r.fragmento}" for r in resultados
+    ))
+
+async def buscar_inline(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    # "@bot palabras" desde cualquier chat: cada resultado envía el párrafo entero
+    consulta = update.inline_query.query.strip()
+    if not consulta:
+        await update.inline_query.answer([])
+        return
+    indexar_catalogo()
+    await update.inline_query.answer([
+        InlineQueryResultArticle(
+            id=f"{r.comando}-{r.parrafo}",
+            title=f"{r.comando} · párrafo {r.parrafo}",
+            description=r.fragmento,
+            input_message_content=InputTextMessageContent(trocear(r.texto)[0]),
+        )
+        for r in indice_busqueda.buscar(consulta, limite=10)
+    ], cache_time=300)
+
+# Creamos la aplicación
+builder = Application.builder().token(TOKEN)
+if TELEGRAM_API_URL:
+    builder = builder.base_url(TELEGRAM_API_URL)
+application = builder.build()
+planificador = PlanificadorEnvios(application.bot, global_por_segundo=GLOBAL_POR_SEGUNDO / WORKERS)
+recordatorios = Recordatorios(
+    planificador.enviar, ZONA,
+    parsear_antelaciones(os.getenv("RECORDATORIOS", ANTELACIONES)),
+)
+# Comando -> handler; los comandos de los meses salen del catálogo
+HANDLERS = (
+    ("start", start),
+    ("set", set_cita),
+    ("falta", cuanto_falta),
+    ("buscar", buscar),
+    (catalogo.comandos(), mes_mensaje),
+)
+for comando, callback in HANDLERS:
+    application.add_handler(CommandHandler(comando, callback))
+application.add_handler(InlineQueryHandler(buscar_inline))
+instrumentar(application)
+COMANDOS = [c for comandos, _ in HANDLERS for c in ([comandos] if isinstance(comandos, str) else comandos)]
+# El webhook contesta sin más a los updates que no atiende ningún handler
+enrutador = Enrutador(COMANDOS, inline=True)
+
+# Control de admisión antes de los handlers (ADMISION=0 lo desactiva).
+# Un mes cuesta COSTE_PARTE_MES fichas por cada mensaje que envía; el resto de
+# comandos 1, salvo lo que diga ADMISION_COSTES ("buscar=2,Mayo=8").
+COSTE_PARTE_MES = 2
+COSTES_ADMISION = parsear_costes(os.getenv("ADMISION_COSTES", ""))
+
+def coste_comando(comando):
+    if comando in COSTES_ADMISION:
+        return COSTES_ADMISION[comando]
+    if comando in catalogo:
+        return COSTE_PARTE_MES * len(catalogo.partes(comando))
+    return 1
+
+admision = None
+if os.getenv("ADMISION", "1") != "0":
+    admision = Admision(
+        COMANDOS,
+        planificador.enviar,
+        coste=coste_comando,
+        usuario=os.getenv("ADMISION_USUARIO", USUARIO),
+        comando=os.getenv("ADMISION_COMANDO", COMANDO),
+    )
+    application.add_handler(TypeHandler(Update, admision.filtrar), group=-1)
+
+# "sincrono": el webhook espera a que se procese el update (comportamiento original)
+# "inmediato": el webhook encola el update y responde 200 al momento
+WEBHOOK_MODO = os.getenv("WEBHOOK_MODO", "sincrono")
+# update_id ya recibidos: los reenvíos de Telegram se contestan sin procesarlos
+if MULTIPROCESO:
+    updates_vistos = CacheUpdatesCompartida(CITAS_DB)
+else:
+    updates_vistos = CacheUpdates(
+        capacidad=int(os.getenv("DEDUP_CAPACIDAD", 10000)),
+        ruta=os.getenv("DEDUP_ARCHIVO") or None,
+    )
+# Los updates se procesan en paralelo entre chats y en orden dentro de cada chat
+despachador = DespachadorChats(
+    lambda item: procesar_update(*item),
+    max_concurrentes=int(os.getenv("DESPACHO_MAX_CONCURRENTES", MAX_CONCURRENTES)),
+    max_pendientes=int(os.getenv("DESPACHO_MAX_PENDIENTES", MAX_PENDIENTES)),
+)
+cola_updates = ColaUpdates(
+    tamaño_maximo=int(os.getenv("COLA_TAMANO_MAXIMO", 1000)),
+    politica=os.getenv("COLA_POLITICA", "rechazar"),
+)
+
+# Vigilante de bloqueos del loop del bot (VIGILANCIA=0 lo desactiva)
+loop_retraso = registro.histograma(
+    "bot_loop_retraso_segundos", "Retraso de cada latido del event loop sobre lo previsto",
+    cubetas=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5))
+vigilante = None
+if os.getenv("VIGILANCIA", "1") != "0":
+    vigilante = VigilanteLoop(umbral=float(os.getenv("VIGILANCIA_UMBRAL_MS", 100)) / 1000,
+                              al_latir=loop_retraso.observar)
+
+def admin_autorizado(token):
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token or "", ADMIN_TOKEN)
+
+def informe_bloqueos():
+    if vigilante is None:
+        return {"activo": False}
+    return {"activo": True, **vigilante.informe()}
+
+# Métricas (se exponen en /metrics)
+webhook_espera = registro.histograma(
+    "bot_webhook_espera_segundos",
+    "Tiempo desde que llega el update al webhook hasta que el loop del bot empieza a procesarlo")
+logs_duracion = registro.histograma(
+    "bot_procesar_logs_duracion_segundos", "Duración de cada vaciado del buffer de logs",
+    cubetas=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120))
+logs_enviados = registro.contador("bot_logs_enviados_total", "Logs entregados a Google Sheets")
+logs_fallidos = registro.contador("bot_logs_fallidos_total", "Logs que no se pudieron entregar")
+registro.medidor("bot_log_buffer_bytes", "Tamaño en disco del buffer de logs", buffer_logs.tamaño_total)
+registro.medidor("bot_log_segmentos_pendientes", "Segmentos sellados sin confirmar",
+                 buffer_logs.segmentos_pendientes)
+espera_vaciado_logs = LOGS_VACIADO_INTERVALO
+registro.medidor("bot_log_vaciado_espera_segundos", "Espera actual entre vaciados (crece con el backoff)",
+                 lambda: espera_vaciado_logs)
+registro.medidor("bot_webhook_cola_profundidad", "Updates esperando en la cola del webhook",
+                 cola_updates.profundidad)
+registro.medidor("bot_webhook_cola_descartados_total", "Updates descartados por cola llena",
+                 lambda: cola_updates.descartados + cola_updates.rechazados, tipo="counter")
+registro.medidor("bot_updates_repetidos_total", "Reenvíos de Telegram ignorados",
+                 lambda: updates_vistos.repetidos, tipo="counter")
+registro.medidor("bot_despacho_pendientes", "Updates esperando su turno en el despachador",
+                 despachador.pendientes)
+registro.medidor("bot_despacho_chats_activos", "Chats con updates en curso o pendientes",
+                 despachador.chats_activos)
+registro.medidor("bot_escrituras_pendientes", "Escrituras en cola del almacén", almacen.pendientes)
+registro.medidor("bot_envios_pendientes", "Mensajes esperando en el planificador de envíos",
+                 planificador.pendientes)
+registro.medidor("bot_envios_total", "Mensajes enviados a Telegram",
+                 lambda: planificador.enviados, tipo="counter")
+registro.medidor("bot_envios_reintentos_total", "Reintentos de envío (RetryAfter o red)",
+                 lambda: planificador.reintentos, tipo="counter")
+registro.medidor("bot_envios_fallidos_total", "Mensajes que no se pudieron enviar",
+                 lambda: planificador.fallidos, tipo="counter")
+registro.medidor("bot_recordatorios_pendientes", "Recordatorios en el heap", recordatorios.pendientes)
+registro.medidor("bot_webhook_ignorados_total", "Updates que ningún handler atiende, contestados sin procesar",
+                 lambda: enrutador.ignorados, tipo="counter")
+if admision is not None:
+    registro.medidor("bot_admision_admitidos_total", "Comandos admitidos por el control de admisión",
+                     lambda: admision.admitidos, tipo="counter")
+    registro.medidor("bot_admision_rechazados_total", "Comandos rechazados por falta de fichas",
+                     lambda: admision.rechazados, tipo="counter")
+    registro.medidor("bot_admision_avisos_total", "Avisos de espera enviados a usuarios",
+                     lambda: admision.avisos, tipo="counter")
+registro.medidor("bot_trazas_descartadas_total", "Trazas descartadas por muestreo, límite o cola llena",
+                 bitacora.descartados, tipo="counter")
+
+async def procesar_update(recibido, update):
+    # recibido: time.perf_counter() del momento en que llegó al webhook
+    webhook_espera.observar(time.perf_counter() - recibido)
+    await application.process_update(update)
+
+async def despachar(recibido, update):
+    # Webhook síncrono: vuelve cuando el update está procesado
+    await despachador.ejecutar(clave_chat(update), (recibido, update))
+
+def fallo_tardio(update_id):
+    # Callback para un update que terminó después de contestar al webhook
+    # (main.py y asgi.py, cuando vence el plazo del webhook síncrono)
+    def comprobar(futuro):
+        if not futuro.cancelled() and futuro.exception() is not None:
+            log.error("Error procesando update", exc_info=futuro.exception(),
+                      extra={"update_id": update_id})
+    return comprobar
+
+# Tareas que viven mientras el bot está arrancado
+tareas_fondo = []
+
+def vaciar_logs():
+    # Envía los logs del buffer a Google Sheets; devuelve (respuesta, código HTTP).
+    # lock evita dos vaciados a la vez en este proceso y el flock entre workers;
+    # ninguno de los dos bloquea a quien escribe en el buffer.
+    with lock, bloqueo_archivo(os.path.join(LOG_BUFFER_DIR, ".vaciando"), esperar=False) as conseguido:
+        if not conseguido:
+            return "Otro worker está procesando los logs", 202
+        return _vaciar_logs()
+
+def _fila_log(log):
+    fila = {
+        "usuario": log["usuario"],
+        "comando": log["comando"],
+        "fecha": log["fecha"]  # <-- enviar fecha del log (la cita si es /set)
+    }
+    if "cantidad" in log:
+        # Fila agregada: "fecha" es el inicio de la ventana
+        fila["cantidad"] = log["cantidad"]
+        fila["ventana"] = log["ventana"]
+    return fila
+
+def _apartar_rechazados(lotes):
+    with open(LOGS_RECHAZADOS, "a") as f:
+        for _, lote in lotes:
+            for fila in lote:
+                f.write(json.dumps(fila, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+def _vaciar_logs():
+    inicio = time.perf_counter()
+    try:
+        volcar_agregados()
+        # Sellamos el segmento activo: los nuevos eventos van a otro segmento
+        # mientras leemos estos en streaming.
+        segmentos = buffer_logs.sellar()
+        leidos = 0
+        for segmento in segmentos:
+            lineas = []
+
+            def logs():
+                for n, log in BufferLogs.leer_segmento(segmento, cursor_logs.posicion(segmento)):
+                    lineas.append(n)
+                    yield _fila_log(log)
+
+            # Enviar logs en lotes por una sesión keep-alive
+            enviados, fallidos, rechazados = cliente_logs.enviar(logs())
+            leidos += len(lineas)
+            logs_enviados.inc(cantidad=enviados)
+            # Los rechazados se apartan y el cursor los salta; los que van
+            # detrás del primer fallido se volverán a enviar de todos modos
+            if fallidos:
+                rechazados = [(i, lote) for i, lote in rechazados if i < fallidos[0][0]]
+            n_rechazados = sum(len(lote) for _, lote in rechazados)
+            if rechazados:
+                _apartar_rechazados(rechazados)
+                logs_fallidos.inc(cantidad=n_rechazados)
+                log.error("Google Sheets rechazó %d logs; apartados en %s",
+                          n_rechazados, LOGS_RECHAZADOS)
+            if fallidos:
+                # Confirmamos hasta el primer lote fallido; desde ahí se
+                # reenvía en el próximo vaciado y no seguimos con el resto
+                primero = fallidos[0][0] * cliente_logs.tamaño_lote
+                cursor_logs.guardar(segmento, lineas[primero])
+                pendientes = len(lineas) - enviados - n_rechazados
+                logs_fallidos.inc(cantidad=pendientes)
+                log.warning("No se pudieron enviar %d logs a Google Sheets, se reintentará",
+                            pendientes)
+                return "Google Sheets no responde, se reintentará", 502
+            # Segmento confirmado entero
+            BufferLogs.descartar([segmento])
+
+        if not leidos:
+            return "No logs", 200
+        return "Logs procesados", 200
+    finally:
+        logs_duracion.observar(time.perf_counter() - inicio)
+
+async def vaciar_logs_periodicamente():
+    # Vacía el buffer cada LOGS_VACIADO_INTERVALO segundos, o antes si pasa de
+    # LOGS_VACIADO_BYTES. Si Google Sheets falla, la espera se duplica hasta
+    # LOGS_BACKOFF_MAXIMO. El envío va en el executor: el loop sigue libre.
+    global espera_vaciado_logs
+    loop = asyncio.get_running_loop()
+    espera = LOGS_VACIADO_INTERVALO
+    ultimo = time.monotonic()
+    while True:
+        await asyncio.sleep(1)
+        if time.monotonic() - ultimo < espera:
+            if espera > LOGS_VACIADO_INTERVALO:
+                continue
+            if await loop.run_in_executor(None, buffer_logs.tamaño_total) < LOGS_VACIADO_BYTES:
+                continue
+        ultimo = time.monotonic()
+        try:
+            _, estado = await loop.run_in_executor(None, vaciar_logs)
+        except Exception:
+            log.exception("Error vaciando el buffer de logs")
+            estado = 500
+        if estado >= 500:
+            espera = min(espera * 2, LOGS_BACKOFF_MAXIMO)
+        else:
+            espera = LOGS_VACIADO_INTERVALO
+        espera_vaciado_logs = espera
+
+async def leer_todas_las_citas():
+    return await asyncio.get_running_loop().run_in_executor(None, lambda: list(citas_db.todas()))
+
+async def liderar_recordatorios():
+    # Solo el worker líder envía recordatorios. Si el líder muere, otro coge el
+    # flock y los reconstruye. El líder vuelve a leer las citas cuando otro
+    # worker las cambia.
+    lider = Lider(os.path.join(LOG_BUFFER_DIR, ".recordatorios"))
+    version = None
+    try:
+        while True:
+            if lider.intentar():
+                # En el hilo del loop, como AlmacenAsync._comprobar_cambios: data_version
+                # solo se puede comparar consigo mismo en una misma conexión
+                nueva = citas_db.version()
+                if not recordatorios.activo():
+                    recordatorios.iniciar(await leer_todas_las_citas())
+                elif nueva != version:
+                    recordatorios.sincronizar(await leer_todas_las_citas())
+                version = nueva
+            await asyncio.sleep(5)
+    finally:
+        lider.soltar()
+
+async def volcar_agregados_periodicamente(intervalo):
+    # Cada worker vuelca sus contadores aunque no sea él quien vacíe el buffer
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(intervalo)
+        await loop.run_in_executor(None, volcar_agregados)
+
+async def iniciar():
+    if vigilante is not None:
+        vigilante.iniciar()
+    await almacen.iniciar()
+    with fases.medir("initialize"):
+        await application.initialize()  # Inicializa internamente el bot también
+    enrutador.usuario_bot = application.bot.username
+    await application.start()
+    if MULTIPROCESO:
+        tareas_fondo.append(asyncio.create_task(liderar_recordatorios()))
+    else:
+        # Reconstruimos los recordatorios a partir de las citas guardadas
+        recordatorios.iniciar(await leer_todas_las_citas())
+    if LOGS_VACIADO_INTERVALO > 0:
+        tareas_fondo.append(asyncio.create_task(vaciar_logs_periodicamente()))
+    if agregador is not None:
+        intervalo = float(os.getenv("AGREGACION_VOLCADO", 60))
+        tareas_fondo.append(asyncio.create_task(volcar_agregados_periodicamente(intervalo)))
+    if WEBHOOK_MODO == "inmediato":
+        tareas_fondo.append(asyncio.create_task(cola_updates.consumir(
+            lambda item: despachador.poner(clave_chat(item[1]), item))))
+
+async def parar():
+    for tarea in tareas_fondo:
+        tarea.cancel()
+    tareas_fondo.clear()
+    recordatorios.parar()
+    if vigilante is not None:
+        vigilante.parar()
+    await application.stop()
+    await almacen.parar()
+    volcar_agregados()
+    # fsync y sellado del segmento activo: lo que queda se envía en el próximo arranque
+    buffer_logs.cerrar()
+    await application.shutdown()
@@ -0,0 +1,236 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from coordinacion import bloqueo_archivo, proceso_vivo
+
+log = logging.getLogger(__name__)
+
+# Buffer de logs append-only en formato JSONL.
+# Cada evento es una línea; se escribe al final del segmento activo (O(1)) y el
+# fsync se hace por grupos desde un hilo aparte. Cuando el segmento supera
+# MAX_BYTES_SEGMENTO (o lleva abierto más de max_segundos_segmento) se sella y
+# se abre uno nuevo.
+#
+# Cada proceso escribe en su propio segmento activo ("<ns>-<pid>.jsonl.abierto");
+# al sellarlo se renombra a ".jsonl". Así varios workers pueden compartir el
+# directorio sin pisarse, y quien vacía el buffer solo lee segmentos sellados.
+
+MAX_BYTES_SEGMENTO = 4 * 1024 * 1024
+FSYNC_CADA = 256          # eventos pendientes que fuerzan un fsync
+FSYNC_INTERVALO = 1.0     # segundos máximos entre fsyncs
+EXTENSION = ".jsonl"
+ABIERTO = ".abierto"
+
+
+class BufferLogs:
+    def __init__(self, directorio, max_bytes_segmento=MAX_BYTES_SEGMENTO,
+                 fsync_cada=FSYNC_CADA, fsync_intervalo=FSYNC_INTERVALO,
+                 max_segundos_segmento=None):
+        self.directorio = directorio
+        self.max_bytes_segmento = max_bytes_segmento
+        self.fsync_cada = fsync_cada
+        self.fsync_intervalo = fsync_intervalo
+        self.max_segundos_segmento = max_segundos_segmento
+
+        self._lock = threading.Lock()
+        self._hay_pendientes = threading.Condition(self._lock)
+        self._pendientes = 0
+        self._cerrado = False
+
+        os.makedirs(directorio, exist_ok=True)
+        self._sellar_huerfanos()
+        self._abrir_segmento()
+
+        self._hilo_fsync = threading.Thread(target=self._bucle_fsync, daemon=True)
+        self._hilo_fsync.start()
+
+    def _sellar_huerfanos(self):
+        # Segmentos activos de procesos que ya no existen (caída o reinicio)
+        with bloqueo_archivo(os.path.join(self.directorio, ".lock")):
+            for nombre in os.listdir(self.directorio):
+                if not nombre.endswith(EXTENSION + ABIERTO):
+                    continue
+                try:
+                    pid = int(nombre.split("-")[1].split(".")[0])
+                except (IndexError, ValueError):
+                    continue
+                if not proceso_vivo(pid) or pid == os.getpid():
+                    ruta = os.path.join(self.directorio, nombre)
+                    try:
+                        os.replace(ruta, ruta[:-len(ABIERTO)])
+                    except FileNotFoundError:
+                        pass
+
+    def _abrir_segmento(self):
+        nombre = f"{time.time_ns():020d}-{os.getpid()}{EXTENSION}{ABIERTO}"
+        self._ruta_activa = os.path.join(self.directorio, nombre)
+        self._f = open(self._ruta_activa, "ab")
+        self._tamaño = 0
+        self._abierto_desde = time.monotonic()
+
+    def segmentos(self):
+        # Segmentos sellados de todos los procesos, en orden de creación
+        nombres = [n for n in os.listdir(self.directorio) if n.endswith(EXTENSION)]
+        return [os.path.join(self.directorio, n) for n in sorted(nombres)]
+
+    def tamaño_total(self):
+        # Bytes en disco entre todos los segmentos
+        total = 0
+        rutas = [os.path.join(self.directorio, n) for n in os.listdir(self.directorio)
+                 if n.endswith(EXTENSION) or n.endswith(EXTENSION + ABIERTO)]
+        for ruta in rutas:
+            try:
+                total += os.path.getsize(ruta)
+            except FileNotFoundError:
+                pass
+        return total
+
+    def añadir(self, evento):
+        linea = json.dumps(evento, ensure_ascii=False).encode("utf-8") + b"\n"
+        with self._lock:
+            if self._cerrado:
+                raise RuntimeError("BufferLogs cerrado")
+            self._f.write(linea)
+            self._tamaño += len(linea)
+            self._pendientes += 1
+            if self._tamaño >= self.max_bytes_segmento or self._caducado():
+                self._rotar()
+            elif self._pendientes >= self.fsync_cada:
+                self._hay_pendientes.notify()
+
+    def _caducado(self):
+        return (self.max_segundos_segmento is not None and self._tamaño
+                and time.monotonic() - self._abierto_desde >= self.max_segundos_segmento)
+
+    def _rotar(self):
+        # Se llama con self._lock adquirido
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._f.close()
+        os.replace(self._ruta_activa, self._ruta_activa[:-len(ABIERTO)])
+        self._pendientes = 0
+        self._abrir_segmento()
+
+    def _bucle_fsync(self):
+        while True:
+            with self._lock:
+                if self._pendientes < self.fsync_cada and not self._cerrado:
+                    self._hay_pendientes.wait(self.fsync_intervalo)
+                if self._cerrado:
+                    return
+                if self._caducado():
+                    # Sellamos aunque no lleguen eventos, para que otro worker
+                    # pueda vaciarlo
+                    self._rotar()
+                    continue
+                if not self._pendientes:
+                    continue
+                self._f.flush()
+                # Duplicamos el descriptor para hacer el fsync sin bloquear a
+                # los escritores, aunque mientras tanto se rote el segmento.
+                fd = os.dup(self._f.fileno())
+                self._pendientes = 0
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def sellar(self):
+        # Cierra el segmento activo (si tiene datos) y devuelve los segmentos
+        # sellados, que ya no recibirán más escrituras.
+        with self._lock:
+            if self._tamaño and not self._cerrado:
+                self._rotar()
+            return self.segmentos()
+
+    @staticmethod
+    def leer_segmento(ruta, desde=0):
+        # (número de línea, evento) a partir de la línea desde
+        with open(ruta, "rb") as f:
+            for n, linea in enumerate(f):
+                if not linea.endswith(b"\n"):
+                    # Línea a medio escribir tras una caída
+                    break
+                if n < desde:
+                    continue
+                try:
+                    yield n, json.loads(linea)
+                except ValueError:
+                    log.warning("Línea corrupta en %s, se ignora", ruta)
+
+    @staticmethod
+    def descartar(segmentos):
+        for ruta in segmentos:
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+
+    def segmentos_pendientes(self):
+        # Número de segmentos sellados por enviar
+        return sum(1 for n in os.listdir(self.directorio) if n.endswith(EXTENSION))
+
+    def importar_json_legado(self, ruta_json):
+        # Migra el antiguo log_buffer.json (una lista JSON) al nuevo formato.
+        # Con bloqueo, para que no lo importen dos workers a la vez.
+        with bloqueo_archivo(os.path.join(self.directorio, ".lock")):
+            if not os.path.exists(ruta_json):
+                return 0
+            with open(ruta_json) as f:
+                try:
+                    logs = json.load(f)
+                except ValueError:
+                    logs = []
+            for log in logs:
+                self.añadir(log)
+            os.remove(ruta_json)
+            return len(logs)
+
+    def cerrar(self):
+        with self._lock:
+            if self._cerrado:
+                return
+            self._cerrado = True
+            self._f.flush()
+            os.fsync(self._f.fileno())
+            self._f.close()
+            if self._tamaño:
+                os.replace(self._ruta_activa, self._ruta_activa[:-len(ABIERTO)])
+            else:
+                os.remove(self._ruta_activa)
+            self._hay_pendientes.notify()
+        self._hilo_fsync.join(timeout=self.fsync_intervalo + 1)
+
+
+class CursorLogs:
+    # Posición confirmada del envío: (segmento, línea). Los segmentos se envían
+    # en orden y se borran al confirmarse enteros, así que solo el primero
+    # puede estar a medias. Se guarda en disco (escritura atómica) para no
+    # reenviar lo ya confirmado tras un reinicio; lo no confirmado se reenvía
+    # (entrega al menos una vez).
+    def __init__(self, ruta):
+        self.ruta = ruta
+
+    def leer(self):
+        try:
+            with open(self.ruta) as f:
+                datos = json.load(f)
+            return datos["segmento"], int(datos["linea"])
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None, 0
+
+    def posicion(self, segmento):
+        # Primera línea sin confirmar del segmento
+        nombre, linea = self.leer()
+        return linea if nombre == os.path.basename(segmento) else 0
+
+    def guardar(self, segmento, linea):
+        temporal = self.ruta + ".tmp"
+        with open(temporal, "w") as f:
+            json.dump({"segmento": os.path.basename(segmento), "linea": linea}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self.ruta)
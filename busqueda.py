@@ -0,0 +1,183 @@
+import bisect
+import math
+import re
+import unicodedata
+
+# Búsqueda de texto en los mensajes del catálogo.
+# Índice invertido por párrafos: término normalizado (minúsculas y sin tildes)
+# -> {párrafo: apariciones}. Se construye una vez y se actualiza al añadir (o
+# volver a cargar) un mes. Una búsqueda solo recorre las listas de los términos
+# pedidos y puntúa con BM25; la última palabra vale también como prefijo, para
+# las consultas inline que llegan mientras se escribe.
+
+_PARRAFOS = re.compile(r"\n[ \t]*\n")
+_PALABRA = re.compile(r"\w+")
+K1 = 1.2
+B = 0.75
+MAX_EXPANSIONES = 20   # términos que puede cubrir el prefijo de la última palabra
+FRAGMENTO = 120        # caracteres del fragmento que se muestra
+
+
+class _TablaPlegado(dict):
+    # Tabla para str.translate que se rellena según aparecen caracteres:
+    # "Á" -> "a", "ñ" -> "n"... Siempre un carácter por carácter, así las
+    # posiciones del texto normalizado valen para el original.
+    def __missing__(self, codigo):
+        c = chr(codigo)
+        base = "".join(x for x in unicodedata.normalize("NFKD", c)
+                       if not unicodedata.combining(x)).casefold()
+        self[codigo] = base if len(base) == 1 else c
+        return self[codigo]
+
+
+_TABLA = _TablaPlegado()
+
+
+def normalizar(texto):
+    if texto.isascii():
+        return texto.lower()
+    return texto.translate(_TABLA)
+
+
+def terminos(texto):
+    return _PALABRA.findall(normalizar(texto))
+
+
+class Resultado:
+    def __init__(self, comando, parrafo, puntuacion, fragmento, texto):
+        self.comando = comando
+        self.parrafo = parrafo        # número de párrafo dentro del mes, desde 1
+        self.puntuacion = puntuacion
+        self.fragmento = fragmento
+        self.texto = texto            # párrafo completo
+
+
+class _Parrafo:
+    def __init__(self, comando, numero, texto):
+        self.comando = comando
+        self.numero = numero
+        self.texto = texto
+        self.plano = normalizar(texto)
+        self.frecuencias = {}
+        for termino in _PALABRA.findall(self.plano):
+            self.frecuencias[termino] = self.frecuencias.get(termino, 0) + 1
+        self.longitud = sum(self.frecuencias.values())
+
+
+class IndiceBusqueda:
+    def __init__(self):
+        self._parrafos = {}       # id -> _Parrafo
+        self._por_comando = {}    # comando en minúsculas -> [id, ...]
+        self._indice = {}         # término -> {id: apariciones}
+        self._vocabulario = []    # términos ordenados, para los prefijos
+        self._siguiente_id = 0
+        self._longitud_total = 0
+        self._normas = None       # id -> parte de BM25 que depende de la longitud
+
+    def indexar(self, comando, texto):
+        # Añade o sustituye los párrafos de un mes
+        self.quitar(comando)
+        ids = []
+        trozos = (p.strip() for p in _PARRAFOS.split(texto))
+        for numero, trozo in enumerate((p for p in trozos if p), 1):
+            parrafo = _Parrafo(comando, numero, trozo)
+            id_ = self._siguiente_id
+            self._siguiente_id += 1
+            self._parrafos[id_] = parrafo
+            self._longitud_total += parrafo.longitud
+            for termino, n in parrafo.frecuencias.items():
+                lista = self._indice.get(termino)
+                if lista is None:
+                    lista = self._indice[termino] = {}
+                    bisect.insort(self._vocabulario, termino)
+                lista[id_] = n
+            ids.append(id_)
+        self._por_comando[comando.lower()] = ids
+        self._normas = None
+
+    def quitar(self, comando):
+        for id_ in self._por_comando.pop(comando.lower(), ()):
+            parrafo = self._parrafos.pop(id_)
+            self._longitud_total -= parrafo.longitud
+            for termino in parrafo.frecuencias:
+                lista = self._indice[termino]
+                del lista[id_]
+                if not lista:
+                    del self._indice[termino]
+                    del self._vocabulario[bisect.bisect_left(self._vocabulario, termino)]
+        self._normas = None
+
+    def __contains__(self, comando):
+        return comando.lower() in self._por_comando
+
+    def _con_prefijo(self, prefijo):
+        i = bisect.bisect_left(self._vocabulario, prefijo)
+        encontrados = []
+        while (i < len(self._vocabulario) and len(encontrados) < MAX_EXPANSIONES
+               and self._vocabulario[i].startswith(prefijo)):
+            encontrados.append(self._vocabulario[i])
+            i += 1
+        return encontrados
+
+    def buscar(self, consulta, limite=5, prefijo=True):
+        palabras = list(dict.fromkeys(terminos(consulta)))
+        if not palabras or not self._parrafos:
+            return []
+        # Cada palabra pedida es un grupo de términos: ella misma y, si es la
+        # última, los que empiezan por ella. Un párrafo puntúa una vez por grupo.
+        grupos = [[p] for p in palabras]
+        if prefijo:
+            grupos[-1] = list(dict.fromkeys([palabras[-1]] + self._con_prefijo(palabras[-1])))
+
+        n_parrafos = len(self._parrafos)
+        if self._normas is None:
+            media = self._longitud_total / n_parrafos
+            self._normas = {id_: K1 * (1 - B + B * p.longitud / media) for id_, p in self._parrafos.items()}
+        normas = self._normas
+        puntuaciones = {}
+        for grupo in grupos:
+            del_grupo = {}
+            for termino in grupo:
+                lista = self._indice.get(termino)
+                if not lista:
+                    continue
+                idf = math.log(1 + (n_parrafos - len(lista) + 0.5) / (len(lista) + 0.5))
+                for id_, n in lista.items():
+                    valor = idf * n * (K1 + 1) / (n + normas[id_])
+                    if valor > del_grupo.get(id_, 0):
+                        del_grupo[id_] = valor
+            for id_, valor in del_grupo.items():
+                puntuaciones[id_] = puntuaciones.get(id_, 0) + valor
+
+        mejores = sorted(puntuaciones.items(), key=lambda x: (-x[1], x[0]))[:limite]
+        return [
+            Resultado(p.comando, p.numero, puntuacion, self._fragmento(p, grupos), p.texto)
+            for p, puntuacion in ((self._parrafos[id_], puntuacion) for id_, puntuacion in mejores)
+        ]
+
+    @staticmethod
+    def _fragmento(parrafo, grupos, ancho=FRAGMENTO):
+        # Trozo del párrafo alrededor de la primera palabra encontrada
+        posiciones = []
+        for grupo in grupos:
+            for termino in grupo:
+                m = re.search(r"\b" + re.escape(termino), parrafo.plano)
+                if m:
+                    posiciones.append(m.start())
+        texto = parrafo.texto
+        if len(texto) <= ancho:
+            return " ".join(texto.split())
+        inicio = max(0, min(posiciones, default=0) - ancho // 3)
+        fin = min(len(texto), inicio + ancho)
+        inicio = max(0, fin - ancho)
+        if inicio > 0:
+            # Sin cortar palabras por la mitad
+            espacio = texto.find(" ", inicio)
+            if espacio != -1 and espacio < fin:
+                inicio = espacio + 1
+        if fin < len(texto):
+            espacio = texto.rfind(" ", inicio, fin)
+            if espacio > inicio:
+                fin = espacio
+        fragmento = " ".join(texto[inicio:fin].split()).rstrip("…")
+        return ("…" if inicio > 0 else "") + fragmento + ("…" if fin < len(texto) else "")
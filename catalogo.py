@@ -0,0 +1,121 @@
+import os
+import re
+
+# Catálogo de mensajes mensuales.
+# Cada fichero <comando>.txt del directorio de mensajes es un comando: para
+# añadir un mes basta con añadir su fichero. Los textos se trocean una sola vez
+# al cargarlos, por párrafos y dentro del límite de Telegram (4096 unidades
+# UTF-16), y los handlers reutilizan siempre las mismas partes.
+
+LIMITE_TELEGRAM = 4096
+EXTENSION = ".txt"
+
+# De mayor a menor preferencia: párrafo, línea, frase, palabra
+_SEPARADORES = (
+    re.compile(r"\n[ \t]*\n"),
+    re.compile(r"\n"),
+    re.compile(r"(?<=[.!?…])\s+"),
+    re.compile(r"\s+"),
+)
+
+
+def longitud_utf16(texto):
+    return len(texto.encode("utf-16-le")) // 2
+
+
+def _cortar_duro(texto, limite):
+    # Último recurso: cortar por puntos de código, nunca a mitad de un carácter
+    partes, actual, n = [], [], 0
+    for c in texto:
+        ancho = 2 if ord(c) > 0xFFFF else 1
+        if n + ancho > limite:
+            partes.append("".join(actual))
+            actual, n = [], 0
+        actual.append(c)
+        n += ancho
+    if actual:
+        partes.append("".join(actual))
+    return partes
+
+
+def _trocear(texto, limite, nivel):
+    if longitud_utf16(texto) <= limite:
+        return [texto]
+    if nivel == len(_SEPARADORES):
+        return _cortar_duro(texto, limite)
+
+    # Trozos con su separador pegado al final, para poder reconstruir el texto
+    trozos, inicio = [], 0
+    for m in _SEPARADORES[nivel].finditer(texto):
+        trozos.append(texto[inicio:m.end()])
+        inicio = m.end()
+    trozos.append(texto[inicio:])
+
+    partes, actual = [], ""
+    for trozo in trozos:
+        if longitud_utf16(actual + trozo.rstrip()) <= limite:
+            actual += trozo
+            continue
+        if actual:
+            partes.append(actual)
+        if longitud_utf16(trozo.rstrip()) <= limite:
+            actual = trozo
+        else:
+            partes.extend(_trocear(trozo.rstrip(), limite, nivel + 1))
+            actual = ""
+    if actual:
+        partes.append(actual)
+    return partes
+
+
+def trocear(texto, limite=LIMITE_TELEGRAM):
+    partes = (p.strip() for p in _trocear(texto, limite, 0))
+    return tuple(p for p in partes if p)
+
+
+class CatalogoMensajes:
+    def __init__(self, directorio, limite=LIMITE_TELEGRAM, perezoso=False, al_añadir=None):
+        # perezoso: al cargar solo se listan los comandos; cada texto se lee y
+        # trocea la primera vez que se pide
+        # al_añadir(comando, texto): se llama cada vez que se lee un texto (p. ej.
+        # para indexarlo)
+        self.directorio = directorio
+        self.limite = limite
+        self.perezoso = perezoso
+        self.al_añadir = al_añadir
+        self._mensajes = {}   # comando en minúsculas -> (comando, partes o None)
+        self.cargar()
+
+    def cargar(self):
+        for nombre in sorted(os.listdir(self.directorio)):
+            if nombre.endswith(EXTENSION):
+                comando = nombre[:-len(EXTENSION)]
+                if self.perezoso:
+                    self._mensajes[comando.lower()] = (comando, None)
+                else:
+                    self.añadir(comando)
+
+    def añadir(self, comando):
+        ruta = os.path.join(self.directorio, comando + EXTENSION)
+        with open(ruta, encoding="utf-8") as f:
+            texto = f.read()
+        partes = trocear(texto, self.limite)
+        self._mensajes[comando.lower()] = (comando, partes)
+        if self.al_añadir is not None:
+            self.al_añadir(comando, texto)
+        return partes
+
+    def comandos(self):
+        return [comando for comando, _ in self._mensajes.values()]
+
+    def partes(self, comando):
+        # Los comandos de Telegram no distinguen mayúsculas
+        entrada = self._mensajes.get(comando.lower())
+        if entrada is None:
+            return ()
+        if entrada[1] is None:
+            return self.añadir(entrada[0])
+        return entrada[1]
+
+    def __contains__(self, comando):
+        return comando.lower() in self._mensajes
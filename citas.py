@@ -0,0 +1,91 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Citas por chat en SQLite (modo WAL).
+# Cada chat puede tener varias citas, identificadas por un nombre ("" es la
+# cita por defecto). Las conexiones son por hilo porque se usan desde el
+# executor.
+
+FORMATO_FECHA = "%Y-%m-%d %H:%M:%S"
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS citas (
+    chat_id INTEGER NOT NULL,
+    nombre  TEXT    NOT NULL DEFAULT '',
+    fecha   TEXT    NOT NULL,
+    PRIMARY KEY (chat_id, nombre)
+)
+"""
+
+
+class AlmacenCitas:
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._local = threading.local()
+        self._conexion()
+
+    def _conexion(self):
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None:
+            conexion = sqlite3.connect(self.ruta, timeout=30, isolation_level=None)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            conexion.execute(_ESQUEMA)
+            self._local.conexion = conexion
+        return conexion
+
+    def guardar(self, chat_id, fecha_str, nombre=""):
+        self._conexion().execute(
+            "INSERT INTO citas (chat_id, nombre, fecha) VALUES (?, ?, ?) "
+            "ON CONFLICT (chat_id, nombre) DO UPDATE SET fecha = excluded.fecha",
+            (chat_id, nombre, fecha_str),
+        )
+
+    def importar_json_legado(self, ruta_json, chat_id):
+        # Migra el antiguo cita.json ({"cita": "YYYY-MM-DD HH:MM:SS"}, sin chat)
+        # como cita por defecto de chat_id, sin pisar una que ya tenga. El
+        # archivo se renombra al importarlo: si dos workers compiten, solo uno
+        # lo encuentra. Devuelve la fecha importada o None.
+        migrado = ruta_json + ".migrado"
+        try:
+            os.replace(ruta_json, migrado)
+        except FileNotFoundError:
+            return None
+        with open(migrado) as f:
+            try:
+                fecha_str = json.load(f).get("cita")
+            except ValueError:
+                fecha_str = None
+        try:
+            datetime.strptime(fecha_str or "", FORMATO_FECHA)
+        except ValueError:
+            return None
+        self._conexion().execute(
+            "INSERT INTO citas (chat_id, nombre, fecha) VALUES (?, '', ?) "
+            "ON CONFLICT (chat_id, nombre) DO NOTHING",
+            (chat_id, fecha_str),
+        )
+        return fecha_str
+
+    def listar(self, chat_id):
+        # Devuelve ((nombre, datetime), ...) ordenado por fecha
+        filas = self._conexion().execute(
+            "SELECT nombre, fecha FROM citas WHERE chat_id = ? ORDER BY fecha",
+            (chat_id,),
+        ).fetchall()
+        return tuple((nombre, datetime.strptime(fecha, FORMATO_FECHA)) for nombre, fecha in filas)
+
+    def version(self):
+        # Cambia cuando otra conexión (de este u otro proceso) confirma cambios.
+        # Cada hilo tiene su conexión y su contador: solo se comparan valores
+        # leídos desde el mismo hilo.
+        return self._conexion().execute("PRAGMA data_version").fetchone()[0]
+
+    def todas(self):
+        # Recorre todas las citas: (chat_id, nombre, datetime)
+        for chat_id, nombre, fecha in self._conexion().execute(
+                "SELECT chat_id, nombre, fecha FROM citas"):
+            yield chat_id, nombre, datetime.strptime(fecha, FORMATO_FECHA)
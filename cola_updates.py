@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+# Cola acotada entre los hilos de Flask y el loop del bot.
+# El webhook solo valida el update, lo deja aquí y responde 200 al momento; una
+# tarea en el loop del bot va sacando updates y los procesa.
+#
+# Políticas cuando la cola está llena:
+#   "rechazar"          -> no se acepta; el webhook responde 503 y Telegram lo reenvía más tarde
+#   "descartar_nuevo"   -> se responde 200 pero el update se pierde
+#   "descartar_antiguo" -> se tira el update más viejo de la cola y se acepta el nuevo
+
+POLITICAS = ("rechazar", "descartar_nuevo", "descartar_antiguo")
+TAMAÑO_MAXIMO = 1000
+MAX_CONCURRENTES = 32
+
+
+class ColaUpdates:
+    def __init__(self, tamaño_maximo=TAMAÑO_MAXIMO, politica="rechazar"):
+        if politica not in POLITICAS:
+            raise ValueError(f"Política de cola desconocida: {politica}")
+        self.tamaño_maximo = tamaño_maximo
+        self.politica = politica
+
+        self._lock = threading.Lock()
+        self._items = deque()
+        self._loop = None
+        self._hay_items = None
+        self._tareas = set()   # el loop solo guarda referencias débiles a las tareas
+
+        self.aceptados = 0
+        self.descartados = 0
+        self.rechazados = 0
+        self.procesados = 0
+        self.errores = 0
+        self.profundidad_maxima = 0
+
+    def poner(self, item):
+        # Se llama desde cualquier hilo. Devuelve False si el update no entra.
+        with self._lock:
+            if len(self._items) >= self.tamaño_maximo:
+                if self.politica == "rechazar":
+                    self.rechazados += 1
+                    return False
+                if self.politica == "descartar_nuevo":
+                    self.descartados += 1
+                    return True
+                self._items.popleft()
+                self.descartados += 1
+            self._items.append(item)
+            self.aceptados += 1
+            self.profundidad_maxima = max(self.profundidad_maxima, len(self._items))
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._hay_items.set)
+        return True
+
+    def profundidad(self):
+        with self._lock:
+            return len(self._items)
+
+    def estado(self):
+        with self._lock:
+            return {
+                "profundidad": len(self._items),
+                "tamaño_maximo": self.tamaño_maximo,
+                "politica": self.politica,
+                "aceptados": self.aceptados,
+                "descartados": self.descartados,
+                "rechazados": self.rechazados,
+                "procesados": self.procesados,
+                "errores": self.errores,
+                "profundidad_maxima": self.profundidad_maxima,
+            }
+
+    def _sacar(self):
+        with self._lock:
+            return self._items.popleft() if self._items else None
+
+    async def consumir(self, procesar, max_concurrentes=MAX_CONCURRENTES):
+        # Bucle del lado del bot: saca items y llama a `procesar` (una corrutina)
+        # con como mucho max_concurrentes en marcha a la vez.
+        self._loop = asyncio.get_running_loop()
+        self._hay_items = asyncio.Event()
+        limite = asyncio.Semaphore(max_concurrentes)
+
+        async def ejecutar(item):
+            try:
+                await procesar(item)
+                self.procesados += 1
+            except Exception:
+                self.errores += 1
+                log.exception("Error procesando update")
+            finally:
+                limite.release()
+
+        while True:
+            item = self._sacar()
+            if item is None:
+                self._hay_items.clear()
+                # Puede haber llegado algo entre _sacar y clear
+                item = self._sacar()
+                if item is None:
+                    await self._hay_items.wait()
+                    continue
+            await limite.acquire()
+            tarea = asyncio.create_task(ejecutar(item))
+            self._tareas.add(tarea)
+            tarea.add_done_callback(self._tareas.discard)
@@ -0,0 +1,63 @@
+import contextlib
+import fcntl
+import os
+
+# Coordinación entre procesos (varios workers de gunicorn) con flock.
+# Los bloqueos se liberan solos si el proceso muere.
+
+
+@contextlib.contextmanager
+def bloqueo_archivo(ruta, esperar=True):
+    # Con esperar=False devuelve False al momento si otro proceso lo tiene
+    f = open(ruta, "a")
+    try:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | (0 if esperar else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+    finally:
+        f.close()
+
+
+class Lider:
+    # Elección de líder: el proceso que consigue el flock lo mantiene mientras
+    # viva. Los demás pueden volver a intentarlo para relevarle si muere.
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._f = None
+
+    def intentar(self):
+        if self._f is not None:
+            return True
+        f = open(self.ruta, "a")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            f.close()
+            return False
+        f.truncate(0)
+        f.write(f"{os.getpid()}\n")
+        f.flush()
+        self._f = f
+        return True
+
+    def soltar(self):
+        if self._f is not None:
+            fcntl.flock(self._f, fcntl.LOCK_UN)
+            self._f.close()
+            self._f = None
+
+
+def proceso_vivo(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
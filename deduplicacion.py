@@ -0,0 +1,144 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Caché de update_id ya recibidos, para ignorar los reenvíos de Telegram.
+# Es un LRU acotado con ventana de tiempo: comprobar y marcar es O(1). Si se
+# le da una ruta, los ids se apuntan en un fichero (una línea por id) para que
+# sobrevivan a un reinicio.
+
+CAPACIDAD = 10000
+VENTANA = 24 * 3600   # Telegram no reintenta un update más allá de 24 h
+
+
+class CacheUpdates:
+    def __init__(self, capacidad=CAPACIDAD, ventana=VENTANA, ruta=None):
+        self.capacidad = capacidad
+        self.ventana = ventana
+        self.ruta = ruta
+
+        self._lock = threading.Lock()
+        self._vistos = OrderedDict()   # update_id -> instante en que llegó
+        self._f = None
+        self._lineas = 0
+        self.repetidos = 0
+
+        if ruta:
+            self._cargar()
+            self._f = open(ruta, "a")
+
+    def _cargar(self):
+        if not os.path.exists(self.ruta):
+            return
+        limite = time.time() - self.ventana
+        with open(self.ruta) as f:
+            for linea in f:
+                try:
+                    update_id, instante = linea.split()
+                    update_id, instante = int(update_id), float(instante)
+                except ValueError:
+                    continue
+                self._lineas += 1
+                if instante >= limite:
+                    self._vistos[update_id] = instante
+                    self._vistos.move_to_end(update_id)
+                else:
+                    # Caducado u olvidado (instante 0, ver olvidar)
+                    self._vistos.pop(update_id, None)
+        while len(self._vistos) > self.capacidad:
+            self._vistos.popitem(last=False)
+
+    def ya_visto(self, update_id):
+        # Devuelve True si el update ya había llegado; si no, lo marca
+        if update_id is None:
+            return False
+        ahora = time.time()
+        with self._lock:
+            instante = self._vistos.get(update_id)
+            if instante is not None and ahora - instante < self.ventana:
+                self.repetidos += 1
+                return True
+            self._vistos[update_id] = ahora
+            self._vistos.move_to_end(update_id)
+            if len(self._vistos) > self.capacidad:
+                self._vistos.popitem(last=False)
+            if self._f is not None:
+                self._f.write(f"{update_id} {ahora}\n")
+                self._f.flush()
+                self._lineas += 1
+                if self._lineas > 2 * self.capacidad:
+                    self._compactar()
+            return False
+
+    def olvidar(self, update_id):
+        # Si el update no se pudo procesar, dejamos que el reenvío entre
+        with self._lock:
+            if self._vistos.pop(update_id, None) is not None and self._f is not None:
+                # Instante 0: al cargar el fichero anula la línea anterior
+                self._f.write(f"{update_id} 0\n")
+                self._f.flush()
+                self._lineas += 1
+
+    def _compactar(self):
+        # Se llama con self._lock adquirido: reescribe el fichero solo con los
+        # ids que siguen en memoria
+        temporal = self.ruta + ".tmp"
+        with open(temporal, "w") as f:
+            for update_id, instante in self._vistos.items():
+                f.write(f"{update_id} {instante}\n")
+        self._f.close()
+        os.replace(temporal, self.ruta)
+        self._f = open(self.ruta, "a")
+        self._lineas = len(self._vistos)
+
+    def __len__(self):
+        return len(self._vistos)
+
+
+class CacheUpdatesCompartida:
+    # Misma interfaz que CacheUpdates pero en SQLite, para que varios procesos
+    # (workers de gunicorn) vean los mismos update_id: un reenvío puede llegar
+    # a un worker distinto del que recibió el original.
+    def __init__(self, ruta, ventana=VENTANA):
+        self.ruta = ruta
+        self.ventana = ventana
+        self._local = threading.local()
+        self._ultima_purga = 0.0
+        self.repetidos = 0
+        self._conexion()
+
+    def _conexion(self):
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None:
+            conexion = sqlite3.connect(self.ruta, timeout=30, isolation_level=None)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            conexion.execute("CREATE TABLE IF NOT EXISTS updates_vistos "
+                             "(update_id INTEGER PRIMARY KEY, instante REAL NOT NULL)")
+            self._local.conexion = conexion
+        return conexion
+
+    def ya_visto(self, update_id):
+        if update_id is None:
+            return False
+        ahora = time.time()
+        conexion = self._conexion()
+        if ahora - self._ultima_purga > 60:
+            self._ultima_purga = ahora
+            conexion.execute("DELETE FROM updates_vistos WHERE instante < ?", (ahora - self.ventana,))
+        # INSERT OR IGNORE es atómico entre procesos: solo uno lo inserta
+        cursor = conexion.execute(
+            "INSERT OR IGNORE INTO updates_vistos (update_id, instante) VALUES (?, ?)",
+            (update_id, ahora))
+        if cursor.rowcount == 0:
+            self.repetidos += 1
+            return True
+        return False
+
+    def olvidar(self, update_id):
+        self._conexion().execute("DELETE FROM updates_vistos WHERE update_id = ?", (update_id,))
+
+    def __len__(self):
+        return self._conexion().execute("SELECT COUNT(*) FROM updates_vistos").fetchone()[0]
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+# Despacho de updates: en paralelo entre chats y en orden dentro de cada chat.
+# Cada chat con updates pendientes tiene su cola y una tarea que la vacía de
+# uno en uno; un semáforo global limita cuántos updates se procesan a la vez.
+# Como el semáforo se suelta tras cada update, un chat con muchos pendientes
+# o con un handler lento no acapara las plazas: los demás chats se van
+# intercalando. max_pendientes acota lo que puede esperar en total; al
+# llenarse, poner() espera y la presión llega hasta quien entrega los updates.
+
+MAX_CONCURRENTES = 32
+MAX_PENDIENTES = 1000
+
+
+def clave_chat(update):
+    # Orden por chat; lo que no tiene chat (consultas inline), por usuario
+    if update.effective_chat is not None:
+        return update.effective_chat.id
+    if update.effective_user is not None:
+        return ("usuario", update.effective_user.id)
+    return ("update", update.update_id)
+
+
+class DespachadorChats:
+    def __init__(self, procesar, max_concurrentes=MAX_CONCURRENTES, max_pendientes=MAX_PENDIENTES):
+        # procesar(item): corrutina que atiende un item
+        self.procesar = procesar
+        self.max_concurrentes = max_concurrentes
+        self.max_pendientes = max_pendientes
+        self._colas = {}   # clave -> deque de (item, futuro o None)
+        self._limite = None
+        self._plazas = None
+        self._tareas = set()   # el loop solo guarda referencias débiles a las tareas
+        self.procesados = 0
+        self.errores = 0
+
+    def _iniciar(self):
+        # Los semáforos se crean dentro del loop del bot
+        if self._limite is None:
+            self._limite = asyncio.Semaphore(self.max_concurrentes)
+            self._plazas = asyncio.Semaphore(self.max_pendientes)
+
+    async def poner(self, clave, item, futuro=None):
+        # Encola sin esperar a que se procese (solo a que haya plaza)
+        self._iniciar()
+        await self._plazas.acquire()
+        cola = self._colas.get(clave)
+        if cola is None:
+            cola = self._colas[clave] = deque()
+            tarea = asyncio.create_task(self._vaciar(clave, cola))
+            self._tareas.add(tarea)
+            tarea.add_done_callback(self._tareas.discard)
+        cola.append((item, futuro))
+
+    async def ejecutar(self, clave, item):
+        # Encola y espera a que se procese; propaga su excepción
+        futuro = asyncio.get_running_loop().create_future()
+        await self.poner(clave, item, futuro)
+        return await futuro
+
+    async def _vaciar(self, clave, cola):
+        try:
+            while cola:
+                item, futuro = cola.popleft()
+                try:
+                    async with self._limite:
+                        resultado = await self.procesar(item)
+                except Exception as e:
+                    self.errores += 1
+                    if futuro is None:
+                        log.exception("Error procesando update")
+                    elif not futuro.done():
+                        futuro.set_exception(e)
+                else:
+                    self.procesados += 1
+                    if futuro is not None and not futuro.done():
+                        futuro.set_result(resultado)
+                finally:
+                    self._plazas.release()
+        finally:
+            del self._colas[clave]
+
+    def pendientes(self):
+        return sum(len(cola) for cola in self._colas.values())
+
+    def chats_activos(self):
+        return len(self._colas)
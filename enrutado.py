@@ -0,0 +1,67 @@
+import json
+
+try:
+    import orjson
+except ImportError:   # opcional: con json de la stdlib funciona igual, algo más lento
+    orjson = None
+
+# Enrutado previo de los updates del webhook.
+# Antes de construir el Update (Update.de_json es lo caro) miramos el JSON en
+# crudo: si ningún handler lo va a atender (ediciones sin comando, stickers,
+# altas en grupos, texto normal, comandos que no existen...) el webhook
+# responde 200 sin crear objetos ni pasar por el loop del bot.
+#
+# Replica las comprobaciones de CommandHandler: mensaje o mensaje editado con
+# una entidad bot_command en la posición 0, comando registrado y, si viene
+# "/comando@bot", que el bot sea este.
+
+TIPOS_MENSAJE = ("message", "edited_message")
+
+
+def cargar_json(datos):
+    # bytes -> objeto; ValueError si no es JSON válido
+    if orjson is not None:
+        return orjson.loads(datos)
+    return json.loads(datos)
+
+
+class Enrutador:
+    def __init__(self, comandos, inline=False):
+        self.comandos = frozenset(c.lower() for c in comandos)
+        self.inline = inline
+        self.usuario_bot = None   # se rellena al inicializar el bot
+        self.aceptados = 0
+        self.ignorados = 0
+
+    def relevante(self, update):
+        try:
+            relevante = self._relevante(update)
+        except (AttributeError, TypeError, IndexError):
+            # Forma inesperada: que lo decida el camino normal
+            relevante = True
+        if relevante:
+            self.aceptados += 1
+            return True
+        self.ignorados += 1
+        return False
+
+    def _relevante(self, update):
+        if self.inline and "inline_query" in update:
+            return True
+        for tipo in TIPOS_MENSAJE:
+            mensaje = update.get(tipo)
+            if mensaje is not None:
+                break
+        else:
+            return False
+        texto = mensaje.get("text")
+        entidades = mensaje.get("entities")
+        if not texto or not entidades:
+            return False
+        primera = entidades[0]
+        if primera.get("type") != "bot_command" or primera.get("offset") != 0:
+            return False
+        comando, _, destinatario = texto[1:primera.get("length", 0)].partition("@")
+        if destinatario and self.usuario_bot and destinatario.lower() != self.usuario_bot.lower():
+            return False
+        return comando.lower() in self.comandos
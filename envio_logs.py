@@ -0,0 +1,112 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+# Cliente para enviar los logs al webhook de Google Apps Script por lotes.
+# Reutiliza una sesión keep-alive, limita cuántas peticiones van en paralelo y
+# reintenta cada lote con backoff exponencial. Un 4xx (salvo 429) no se
+# reintenta: el lote se da por rechazado y quien llama decide qué hacer con él.
+#
+# Cada lote se envía como {"logs": [{"usuario": ..., "comando": ..., "fecha": ...}, ...]}
+
+TAMAÑO_LOTE = 200
+MAX_PARALELO = 4
+REINTENTOS = 3
+BACKOFF = 0.5
+TIMEOUT = 15
+
+# Resultado de cada lote
+ENVIADO = "enviado"
+FALLIDO = "fallido"       # 5xx, 429 o error de red: se puede reintentar más tarde
+RECHAZADO = "rechazado"   # 4xx: reenviarlo daría el mismo error
+
+
+def en_lotes(eventos, tamaño):
+    it = iter(eventos)
+    while True:
+        lote = list(islice(it, tamaño))
+        if not lote:
+            return
+        yield lote
+
+
+class ClienteEnvioLogs:
+    def __init__(self, url, tamaño_lote=TAMAÑO_LOTE, max_paralelo=MAX_PARALELO,
+                 reintentos=REINTENTOS, backoff=BACKOFF, timeout=TIMEOUT):
+        self.url = url
+        self.tamaño_lote = tamaño_lote
+        self.max_paralelo = max_paralelo
+        self.reintentos = reintentos
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self.sesion = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=max_paralelo)
+        self.sesion.mount("http://", adaptador)
+        self.sesion.mount("https://", adaptador)
+
+    def _enviar_lote(self, lote):
+        for intento in range(self.reintentos + 1):
+            try:
+                r = self.sesion.post(self.url, json={"logs": lote}, timeout=self.timeout)
+                if r.status_code < 500 and r.status_code != 429:
+                    r.raise_for_status()
+                    return ENVIADO
+                error = f"HTTP {r.status_code}"
+            except requests.HTTPError as e:
+                # 4xx: reintentar no va a arreglarlo
+                log.error("Google Sheets rechazó un lote de %d logs: %s", len(lote), e)
+                return RECHAZADO
+            except requests.RequestException as e:
+                error = e
+            if intento < self.reintentos:
+                time.sleep(self.backoff * 2 ** intento)
+        log.error("Error enviando lote de logs a Google Sheets tras %d intentos: %s",
+                  self.reintentos + 1, error)
+        return FALLIDO
+
+    def enviar(self, eventos):
+        # Envía un iterable de eventos (se consume en streaming) y devuelve
+        # (eventos_enviados, lotes_fallidos, lotes_rechazados). Las listas de
+        # lotes son de (índice, lote), ordenadas por índice; el lote i lleva los
+        # eventos [i * tamaño_lote, (i + 1) * tamaño_lote).
+        enviados = 0
+        fallidos = []
+        rechazados = []
+        # Como mucho max_paralelo lotes en vuelo y otros tantos en espera, para
+        # no cargar en memoria todo el buffer.
+        en_vuelo = threading.BoundedSemaphore(self.max_paralelo * 2)
+        resultados_lock = threading.Lock()
+
+        def tarea(indice, lote):
+            nonlocal enviados
+            try:
+                resultado = self._enviar_lote(lote)
+                with resultados_lock:
+                    if resultado == ENVIADO:
+                        enviados += len(lote)
+                    elif resultado == RECHAZADO:
+                        rechazados.append((indice, lote))
+                    else:
+                        fallidos.append((indice, lote))
+            finally:
+                en_vuelo.release()
+
+        with ThreadPoolExecutor(max_workers=self.max_paralelo) as pool:
+            for indice, lote in enumerate(en_lotes(eventos, self.tamaño_lote)):
+                en_vuelo.acquire()
+                pool.submit(tarea, indice, lote)
+
+        fallidos.sort(key=lambda x: x[0])
+        rechazados.sort(key=lambda x: x[0])
+        return enviados, fallidos, rechazados
+
+    def cerrar(self):
+        self.sesion.close()
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import time
+
+from telegram.error import BadRequest, NetworkError, RetryAfter, TimedOut
+
+log = logging.getLogger(__name__)
+
+# Planificador de envíos salientes a Telegram.
+# Cada chat tiene su cola y su tarea, así que las partes de un mensaje salen en
+# orden dentro del chat y los chats distintos se envían en paralelo. Dos
+# cubetas de tokens (una por chat y otra global) mantienen el ritmo por debajo
+# de los límites de la API, y un RetryAfter pausa todos los envíos el tiempo
+# que pida Telegram antes de reintentar.
+#
+# Las cubetas son por proceso: con varios workers de gunicorn el bot reparte
+# el ritmo global entre ellos (ver WORKERS en bot.py). El límite por chat no se
+# reparte, así que un chat atendido por varios workers puede pasarse y acabar
+# en RetryAfter.
+
+GLOBAL_POR_SEGUNDO = 25      # Telegram permite ~30 mensajes/s por bot
+CHAT_POR_SEGUNDO = 1.0       # ~1 mensaje/s sostenido por chat
+RAFAGA_CHAT = 3
+REINTENTOS_RED = 3
+
+
+class CubetaTokens:
+    def __init__(self, por_segundo, capacidad):
+        self.por_segundo = por_segundo
+        self.capacidad = capacidad
+        self.tokens = capacidad
+        self._ultimo = time.monotonic()
+
+    def _rellenar(self):
+        ahora = time.monotonic()
+        self.tokens = min(self.capacidad, self.tokens + (ahora - self._ultimo) * self.por_segundo)
+        self._ultimo = ahora
+
+    def llena(self):
+        self._rellenar()
+        return self.tokens >= self.capacidad
+
+    def intentar(self, coste=1):
+        # Sin esperar: gasta coste fichas si las hay
+        self._rellenar()
+        if self.tokens >= coste:
+            self.tokens -= coste
+            return True
+        return False
+
+    def espera(self, coste=1):
+        # Segundos hasta tener coste fichas
+        self._rellenar()
+        return max(0.0, (coste - self.tokens) / self.por_segundo)
+
+    async def adquirir(self):
+        while True:
+            self._rellenar()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.por_segundo)
+
+
+class _Chat:
+    def __init__(self, por_segundo, capacidad):
+        self.cola = asyncio.Queue()
+        self.cubeta = CubetaTokens(por_segundo, capacidad)
+        self.tarea = None
+
+
+class PlanificadorEnvios:
+    def __init__(self, bot, global_por_segundo=GLOBAL_POR_SEGUNDO,
+                 chat_por_segundo=CHAT_POR_SEGUNDO, rafaga_chat=RAFAGA_CHAT):
+        self.bot = bot
+        self.chat_por_segundo = chat_por_segundo
+        self.rafaga_chat = rafaga_chat
+        # Con muchos workers el ritmo puede bajar de 1/s: al menos una ficha
+        self._global = CubetaTokens(global_por_segundo, max(1, global_por_segundo))
+        self._chats = {}
+        self._pausa_hasta = 0.0
+
+        self.enviados = 0
+        self.reintentos = 0
+        self.fallidos = 0
+
+    def enviar(self, chat_id, texto, **kwargs):
+        # Encola un mensaje y devuelve un future con el Message enviado.
+        # No hace falta esperarlo: los errores se registran aquí.
+        chat = self._chats.get(chat_id)
+        if chat is None:
+            chat = self._chats[chat_id] = _Chat(self.chat_por_segundo, self.rafaga_chat)
+        futuro = asyncio.get_running_loop().create_future()
+        chat.cola.put_nowait((texto, kwargs, futuro))
+        if chat.tarea is None:
+            chat.tarea = asyncio.create_task(self._trabajador(chat_id, chat))
+        return futuro
+
+    def pendientes(self):
+        return sum(chat.cola.qsize() for chat in self._chats.values())
+
+    async def _esperar_pausa(self):
+        while True:
+            restante = self._pausa_hasta - time.monotonic()
+            if restante <= 0:
+                return
+            await asyncio.sleep(restante)
+
+    async def _trabajador(self, chat_id, chat):
+        try:
+            while True:
+                try:
+                    # Seguimos vivos hasta que la cubeta del chat se recarga,
+                    # para que un chat no consiga ráfagas extra por reaparecer.
+                    espera = self.rafaga_chat / self.chat_por_segundo
+                    texto, kwargs, futuro = await asyncio.wait_for(chat.cola.get(), espera)
+                except asyncio.TimeoutError:
+                    if chat.cola.empty() and chat.cubeta.llena():
+                        return
+                    continue
+                await self._enviar_uno(chat_id, chat, texto, kwargs, futuro)
+        finally:
+            chat.tarea = None
+            if chat.cola.empty() and self._chats.get(chat_id) is chat:
+                del self._chats[chat_id]
+
+    async def _enviar_uno(self, chat_id, chat, texto, kwargs, futuro):
+        errores_red = 0
+        while True:
+            await chat.cubeta.adquirir()
+            await self._esperar_pausa()
+            await self._global.adquirir()
+            try:
+                mensaje = await self.bot.send_message(chat_id=chat_id, text=texto, **kwargs)
+            except RetryAfter as e:
+                self.reintentos += 1
+                self._pausa_hasta = max(self._pausa_hasta, time.monotonic() + e.retry_after)
+                log.warning("Telegram pide esperar %ss", e.retry_after, extra={"chat": chat_id})
+                continue
+            except BadRequest as e:
+                # Subclase de NetworkError en PTB, pero permanente ("chat not
+                # found", "message is too long"...): reintentar no sirve
+                self._fallo(chat_id, futuro, e)
+                return
+            except (TimedOut, NetworkError) as e:
+                errores_red += 1
+                if errores_red <= REINTENTOS_RED:
+                    self.reintentos += 1
+                    await asyncio.sleep(2 ** errores_red)
+                    continue
+                self._fallo(chat_id, futuro, e)
+                return
+            except Exception as e:
+                self._fallo(chat_id, futuro, e)
+                return
+            self.enviados += 1
+            if not futuro.done():
+                futuro.set_result(mensaje)
+            return
+
+    def _fallo(self, chat_id, futuro, error):
+        self.fallidos += 1
+        log.error("Error enviando mensaje: %s", error, extra={"chat": chat_id})
+        if not futuro.done():
+            futuro.set_exception(error)
+            # Nadie está obligado a esperar el future: evitamos el aviso de
+            # "exception was never retrieved"
+            futuro.exception()
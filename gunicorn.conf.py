@@ -0,0 +1,24 @@
+import os
+import sys
+
+# Despliegue con varios procesos:
+#   gunicorn -c gunicorn.conf.py main:app
+#
+# Cada worker importa main.py después del fork, así que tiene su propio loop y
+# su propio hilo del bot (por eso no se usa preload_app). MULTIPROCESO=1 hace
+# que el almacenamiento compartido sea seguro entre workers.
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", 2))
+threads = int(os.getenv("GUNICORN_THREADS", 8))
+preload_app = False
+raw_env = ["MULTIPROCESO=1"]
+
+
+def worker_exit(server, worker):
+    # Sin esto, al reiniciar un worker se pierden los contadores agregados que
+    # aún no se habían volcado al buffer de logs. gunicorn también lo llama
+    # desde el máster, que no carga la app: ahí no hay nada que parar.
+    main = sys.modules.get("main")
+    if main is not None:
+        main.parar_bot()
@@ -1,554 +1,198 @@
-from flask import Flask, request
-from telegram import Update
-from telegram.ext import Application, CommandHandler, ContextTypes
-from datetime import datetime, timedelta
-import json
+from arranque import fases
+from flask import Flask, jsonify, request
 import os
 import asyncio
+import atexit
+import concurrent.futures
+import logging
 import threading
-import requests
+import time
 
-TOKEN = os.getenv("BOT_TOKEN")
-DATA_FILE = "cita.json"
-GOOGLE_SCRIPT_WEBHOOK = "https://script.google.com/macros/s/AKfycbwMrvIWmTHWzGp0UYlu1d0NcSXZT_8Bc3d_ZGbq-h2bLUJ7phsjTwjb7koyCIj56ptD/exec"
-LOG_BUFFER_FILE = "log_buffer.json"
-lock = threading.Lock()
-
-def añadir_log_buffer(usuario, comando, fecha=None):
-    lock.acquire()
-    try:
-        if os.path.exists(LOG_BUFFER_FILE):
-            with open(LOG_BUFFER_FILE, "r") as f:
-                data = json.load(f)
-        else:
-            data = []
-
-        log = {"usuario": usuario, "comando": comando, "fecha": fecha or datetime.now().isoformat()}
-        data.append(log)
-
-        with open(LOG_BUFFER_FILE, "w") as f:
-            json.dump(data, f)
-    finally:
-        lock.release()
-
-def guardar_cita(fecha_str):
-    with open(DATA_FILE, "w") as f:
-        json.dump({"cita": fecha_str}, f)
-
-def cargar_cita():
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE) as f:
-            return json.load(f).get("cita")
-    return None
-
-def registrar_evento(usuario, comando):
-    try:
-        requests.post(GOOGLE_SCRIPT_WEBHOOK,
-                      json={"usuario": usuario, "comando": comando},
-                      timeout=5)
-    except Exception as e:
-        print(f"Error enviando log a Google Sheets: {e}", flush=True)
-
-async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    user = update.effective_user.first_name if update.effective_user else "Usuario desconocido"
-    añadir_log_buffer(user, "/start")
-    print(f"[{user}] Inició el bot con /start", flush=True)
-    await update.message.reply_text(
-        "¡Hola! Soy un bot creado para Valentina y Adrià. A partir de ahora, cada 24 podrás escribir / + el nombre del mes para poder revisar mensajes bonitos, por ejemplo escribe /Junio para disfrutar el de este mes. Además puedes recordar bonitos momentos con /mes y el numero de mes que quieras leer 🤍"
-    )
-
-
-async def set_cita(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    user = update.effective_user.first_name if update.effective_user else "Usuario desconocido"
-    if not context.args:
-        print(f"[{user}] Usó /set sin argumentos", flush=True)
-        await update.message.reply_text("Usa el formato: /set YYYY-MM-DD HH:MM")
-        return
-
-    fecha_str = " ".join(context.args)
-    try:
-        dt = datetime.strptime(fecha_str, "%Y-%m-%d %H:%M")
-        cita_str = dt.replace(second=0).strftime("%Y-%m-%d %H:%M:%S")
-        guardar_cita(cita_str)
-        añadir_log_buffer(user, "/set", fecha=cita_str)  # <- Añades fecha de la cita al log
-        print(f"[{user}] Guardó una cita: {cita_str}", flush=True)
-        await update.message.reply_text(f"Cita guardada para: {cita_str}")
-    except ValueError:
-        print(f"[{user}] Usó /set con formato inválido: {fecha_str}", flush=True)
-        await update.message.reply_text("Formato incorrecto. Usa: /set 2025-06-15 20:00")
-
-async def cuanto_falta(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    user = update.effective_user.first_name if update.effective_user else "Usuario desconocido"
-    añadir_log_buffer(user, "/falta")
-    cita_str = cargar_cita()
-    if not cita_str:
-        print(f"[{user}] Usó /falta pero no hay cita guardada.", flush=True)
-        await update.message.reply_text("No hay ninguna cita guardada.")
-        return
-
-    cita = datetime.strptime(cita_str, "%Y-%m-%d %H:%M:%S")
-    ahora = datetime.now() + timedelta(hours=2)
-    diferencia = cita - ahora
-
-    if diferencia.total_seconds() <= 0:
-        print(f"[{user}] Usó /falta: la cita ya pasó o es ahora mismo.", flush=True)
-        await update.message.reply_text("¡La cita ya pasó o es ahora mismo! Divertíos")
-    else:
-        total_segundos = int(diferencia.total_seconds())
-        dias = total_segundos // 86400
-        horas = (total_segundos % 86400) // 3600
-        minutos = (total_segundos % 3600) // 60
-        segundos = total_segundos % 60
-        print(f"[{user}] Usó /falta: faltan {dias}d {horas}h {minutos}m {segundos}s", flush=True)
-        await update.message.reply_text(
-            f"Faltan {dias} días, {horas} horas, {minutos} minutos y {segundos} segundos para la cita. ⏳"
-        )
-
-async def mes_mensaje(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Hola, Chocolatet. Hoy hace un mes que empezamos a hablar. Y para hoy me ha apetecido contarte cómo he vivido este último mes.
-
-    Este último mes ha sido en el que más cosas he sentido en mi vida. Ha habido momentos en los que pensaba que el mundo se me iba a comer y momentos en los que he estado más feliz que nunca. Pero en todos ellos has estado tú.
-
-    Cuando empezamos a hablar, sinceramente, no sabía ni por dónde tirar 😂, pero me encantaba poder leerte todos los días. Al levantarme, mientras trabajaba, mientras comía, mientras descansaba, mientras hacía cosas, mientras no hacía nada, y antes de irme a descansar mientras alargábamos nuestras conversaciones hasta horas adentradas en la madrugada.
-
-    Entonces, justo el mismo día que quedé contigo para vernos por primera vez, volvió mi pesadilla más recurrente, y de la manera más intensa en la que ha ocurrido nunca: todo el tema de la hospitalización de mi padre. Tenía tantas incertezas en ese momento, pero tantas, que me costaba hasta vivir. No podía concentrarme en la oficina, no dormía bien, temblaba casi constantemente, y tenía que ir varias veces al cuarto de baño por tener amagos de vómitos.
-
-    Pero, durante todos esos días, tenía un gran escape que fuiste tú. Que, aunque sin saberlo, me apoyabas solo con hablarme, me relajabas y me ponías contento. Aunque las inseguridades me atacaran durante esos días, tú las rebatías constantemente. Yo pensaba: ¿cómo puede ser que esta chica quiera verme? Si mírame cómo soy. Pero tú me hablabas a pesar de que habías visto mi perfil y las fotos que te enviaba. ¿Cómo puede ser que esta chica no se aburra de hablar conmigo? Pero tú me seguías escribiendo todos los días al momento.
-
-    Entonces llegó el día de verte. Iba nervioso, no te voy a mentir, y al verte dije: *wow, realmente nos vamos a ver JAJAJ*. Al subirnos al coche y empezar a hablar contigo se me pasaron todos los nervios, porque estuvimos hablando justo como lo esperaba. Luego seguimos charlando en la terraza, que fue un rato en el que estuve súper a gusto. Y luego fuimos a la cama... No te voy a mentir, tenía muchas ganas de ese momento, pero entonces los nervios de mi primera vez, sumados a los de la situación de mi padre, pudieron conmigo...
-
-    Yo en ese momento tenía la mezcla de emociones más fuerte que he tenido en mi vida. Por un lado, agradecía que mi padre ese día ya estuviese mejor, y agradecía el haber podido pasar esa noche contigo. Pero por el otro, sentía que la estrella de las desgracias reposaba sobre mis hombros... Pero estuviste ahí. Fuiste la primera de mi círculo que se enteró de lo de mi padre, y luego tuvimos una cena muy agradable y, antes de que se hiciera más tarde, volvimos a Oliva. Te acompañé a tu casa y me sentí muy feliz de haber estado contigo y de sentir que seguiríamos estándolo.
-
-    Cuando volví al coche de Hugo y le conté cómo había vivido esa semana, no pude evitar derrumbarme. Lloré toda la tensión que tenía acumulada. Y tras eso fui contándoselo poco a poco al resto de mis amigos, y todos me dieron su apoyo. Menos mal que os tenía a todos. Me podría haber vuelto loco de vivir eso solo...
-
-    A partir de ahí me relajé bastante. Pasé mucho tiempo hablando contigo, en el hospital con mi padre, con mi familia y con mis amigos. Desde entonces, cada vez que nos hemos visto solo me han dado más ganas de verte y más ganas de conocerte.
-
-    En nuestra segunda cita tú tenías tu graduación, y como quería que nuestra cita fuera una gran parte de tu día especial, me esforcé en que nuestra cena fuera buena. Compré los ingredientes con antelación, invité a mis amigos para practicar y me salió bastante bien. Qué amarga sorpresa me llevé al descubrir que eso se convertiría en el fallo que no nos permitiría cenar pasta carbonara esa noche. La verdad es que me agobié bastante en ese momento, pero tú me alegraste la noche al intentar tirar para adelante e, incluso en esa situación, preparar un plato de pasta... El abrazo que tuvimos en la cocina mientras esperábamos a que se terminara de cocer el bacon no lo voy a olvidar, igual que tampoco voy a olvidar el apagón que tuvimos JAJAJ. Menos mal que pude compensarlo con un kebab que nos comimos mientras caminábamos por la playa.
-
-    Luego, en nuestro tercer encuentro, la verdad es que ya estaba muy cómodo contigo, y me apetecía bastante ver *Mamma Mia!* contigo, la verdad. Pero lo que terminó pasando a mitad de película también lo disfruté mucho. Que no te engañen las lágrimas que solté esa noche y que tú muy hábilmente supiste acallar con tu apoyo... Eran lágrimas de frustración conmigo mismo, que cada vez sufro menos cuando estoy contigo...
-
-    En nuestra cuarta cita, la verdad es que ya entendí que estaba verdaderamente cómodo contigo. Solamente al charlar y reír juntos era suficiente para llenarme, aunque me puso súper feliz el que pudiésemos por fin cenar la maldita pasta carbonara JAJAJA... Que por poco fue atacada por la superpolilla gigante 😂. Verdaderamente, siempre tiene que haber un momento memorable cuando nos vemos...
-
-    Y hablando de memorable, nuestra quinta cita la verdad es que fue especial. Me encantó charlar contigo, me encantó reír a carcajadas contigo, me encantó hacerlo contigo, me encantó cocinar contigo, y me encantaron los patacones... Para mí, todo en esa noche fue genial.
-
-    Y aunque recientemente estés pasando por un mal momento, espero que este texto pueda aportar un granito de arena para que recuerdes que los momentos valiosos y memorables se escriben a diario y que en esta vida nada duele para siempre. Que estaré contigo, ya sea física o telefónicamente, siempre que lo necesites (no solo te lo digo, sino que también te lo demostraré), y que sepas lo especial que ha sido este último mes para mí.
-
-    Si has leído todo el texto hasta el final, te lo agradezco de corazón. Nunca había escrito un mensaje tan largo para una persona.
-
-    Por último, tengo que decirte que espero que este mes no sea algo esporádico que vaya a recordar con cariño, sino que sea algo que se alargue en el tiempo y que pueda preparar contigo más recetas, pueda escribirte más textos y que pueda vivir más contigo, Chocolatet.
-
-    Muchas gracias 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensaje2(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Segundo mes y segundo mensaje. Este mes ha sido de muchos pensamientos. No te miento si te digo que este ha sido uno de los mejores meses que he vivido nunca. Ha estado lleno de regocijos, fiestas, conciertos, y de algo que ha estado ocupando mi mente de una manera demasiado intensa. Tú, tú has estado rondando en mi mente todos los días desde el día 1 al levantarme hasta hoy, mientras escribo este texto, has estado presente en cada momento de cada día. Al levantarme ya no puedo no intentar mirar el móvil por eso que dicen que es mala su luz muy de mañana, pues lo único que deseo al levantarme es darte los buenos días.
-    
-    Luego entro a trabajar y sigo pensando en ti, dejo el móvil en la mesa y todas las notificaciones de este me aturden, pues cualquiera de ellas podría ser tuya y eso me emociona. Luego, durante cualquier tarea, necesito más concentración que antes, pues no desviar mi atención a tu imagen me es complicado y requiere de un esfuerzo mental adicional, pero que me encanta no realizar. Entonces es cuando vienen los reajustes de pantalones y pensamientos más intensos. Pero no pasa nada, pues es algo que me encanta al pensarte.
-    
-    Al salir de trabajar pienso en verte y en lo que me gustaría tener un vehículo para ir a verte. Cualquier día es bueno para hacerlo, ya haga sol o nubes, pues con cualquier clima tú me iluminas el día. Y durante todos estos días cuento las horas, los minutos y los segundos que faltan para verte, Coret. Muy contento de haber hecho ese cálculo de manera automática con nuestro bot de Telegram. Pero estar deseoso de verte es un efecto que no tiene solución, la única manera de acallar ese grito es estando contigo, porque cada viaje de vuelta desde Oliva a mi casa se me hace cuesta arriba. ¿Cuándo la volveré a ver?, me pregunto. ¿Cuándo será ese genial día que repita las maravillas de lo que ha pasado en este? ¿Cuándo llegará, Señor?
-    
-    Luego, al llegar a casa, te sigo pensando, te sigo imaginando, te sigo soñando y te sigo sintiendo. Como esto siga así... Voy a terminar siendo el hombre más feliz que pueda haber. Tenerte siempre en mi cabeza es una sensación de lo más agradable.
-    
-    Este mes ha estado marcado por los festivales, no cabe duda. Primero en el Pirata, mano a mano con Izan, y luego con Hugo en el Zevra, menudos conciertazos nos dimos. Pero desde el primer día, desde ese miércoles en el que te tuve que despedir antes de salir hacia allí hasta el último día del Zevra, ese bonito domingo de arepas, ya sabía que me faltaba un componente importante para estar contento y ese eres tú. De verdad, te veía en todos los lados: en la música, en las diferentes parejas que revoloteaban por allí, en mis ojos cuando miraban a mi alrededor buscándote para poderte abrazar... En todos lados, y esas ganas solo se curaban al verte, mi vida.
-    
-    Siento cosas, siento muchas cosas, siento cosas que nunca había sentido, siento cosas cuando te pienso, siento cosas cuando te veo, siento cosas cuando no te veo y siento cosas cuando te siento. Esas cosas son... mágicas, agradables, poderosas e increíbles. Yo no sabía lo que era el amor. De verdad que no. Pero es que ahora es lo que más siento, es mi sentimiento principal, desde que me levanto hasta que me duermo, e incluso en mis sueños.
-    
-    Qué sentimiento más maravilloso, eso que revolotea en mi estómago cada vez que te pienso, ese sentimiento que me da ganas de decirte cosas bonitas, de hacerte regalos, de preocuparme por ti, de desearte, de querer verte, de querer hablar contigo, de querer hacer el amor contigo, de querer comer contigo, de querer dormir contigo... En definitiva, de querer vivir contigo, Coret.
-    
-    Y quiero que lo sepas: me gustas, me gustas de verdad. No pensaba que alguien me pudiese gustar hasta tal nivel. Yo también me sorprendo cuando recapitulo mi día antes de dormir y solo apareces tú, pero es algo muy bonito, la verdad, lo mas bonito que he tenido el placer de sentir.
-    
-    Creo que puedo resumir este mes en dos palabras, y son: Te quiero. *Te quiero* es la cosa más bonita que he oído a nadie decirme, y es la cosa más bonita que se me ocurre decirte. Y quiero que lo sepas y no se te olvide.
-    
-    Te quiero, te quiero, te quieeeero.
-    
-    Me haces muy feliz, me ha hecho muy feliz este mes, y me harás muy feliz el siguiente mes. Estoy seguro de eso.
-    
-    Muchas gracias por volverte a leer el mensaje hasta el final, Coret. De verdad que lo aprecio mucho. Espero que te hayan gustado mucho los detalles que te he hecho este mes, incluido este, y quién sabe, puede que los siguientes también te gusten. Mantente a la espera de ellos y lo podrás comprobar. Jajajaja.
-    
-    ¿Cómo puede ser tan bonita?, le pregunté a Dios. Y no me respondió, parece que hasta ni él lo sabe...
-    
-    Te quiero, Coret 🤍. 1912 por siempre"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensaje3(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Tercer mes y aunque, por desgracia, las tragedias nos rodeen, no puedo evitar el escribirte. Sabes, no sé cómo he podido soportar estos últimos meses, bueno, sí lo sé, porque habéis estado conmigo: mis amigos, mi familia... Y tú, creo que no llegas a hacerte una idea de lo importante que es tu presencia, tus mensajes, tu paciencia, tus ganas, tu amor, tus cumplidos, tus fotos, tú, tú no eres consciente de cuánto significas para mí... Este mes ha empezado con fuerza, un precioso día, cuyo número ya no voy a poder olvidar, con un cielo precioso, una luna espectacular y la mejor chica que hay conmigo. Después de una más que agradable velada, con una rosa y con una de las mayores ilusiones que he tenido nunca, te pedí salir. Y con ello, me convertí en lo que llevaba meses con ansia de ser: tu novio...
-
-Desde ese día, desde el día en el que puedo considerarme el oficial, el con el que quieres estar, y el que quiere estar contigo, no pasa un día en el que no piense en mi novia, la más preciosa (aunque a veces ella no lo considere así, es un hecho irrefutable). Me encanta verte y decir: "wow, esta es mi novia", la persona que me hace tan feliz, la que me ilumina las mañanas, los días, las tardes y las noches, mi novia, la que se preocupa por mí, la que enseño fotos de ella con orgullo, la que quiero presentar, la que quiero que me presente a sus parientes, la que quiero que pase los días conmigo, la que me hace sonreír con cada notificación y mensaje bonito, la que quiero cuidar siempre, la que quiero abrazar en los días grises y celebrar en los días soleados, la que me inspira a ser mejor, la que me da motivos para soñarla y fuerzas para seguir. Eres tú, mi amor, la que da sentido a cada instante y convierte lo cotidiano en algo extraordinario.
-
-Aunque hayan pasado cosas malas, que han pasado y muchas, has estado ahí, te he notado cerca, te he notado presente, y aunque creas que no, de verdad que haces mucho por mí. No te infravalores nunca. Todo lo que haces pensando en mí, en todo lo que pones el corazón, en todo lo que pones amor por mí, se nota, y tanto que se nota, yo lo noto, y te quiero por cada una de esas cosas que haces y que me hacen sentir tan bien en momentos tan necesarios como este, no creas que no.
-
-Quiero animarnos a que esto siga así, a que lo hablemos todo, a que disfrutemos cada día de nuestra confianza y cercanía, a que disfrutemos de nuestra compañía y a que aprovechemos cada uno de esos planes que tenemos pendientes, pero que pronto se convertirán en recuerdos bonitos.
-
-Quiero seguir haciéndote detalles bonitos. Tengo la cabeza llena de ideas, llena de cosas que quiero hacer contigo, llena de recuerdos aún no realizados y llena de sueños por compartir con mi persona favorita.
-
-Me encantó ir a verte a Oliva, me emocioné un poco al verte en el trabajo, con ese traje que te queda de fábula. Sabes, cuando estaba caminando al Telepizza, estaba nervioso, nervioso de poder volver a verte, de saber que ese día iba a poder charlar contigo y que íbamos a salir con mis amigos de una manera ya formal y bonita, y vaya que no defraudó ese día. Me encantaron las pizzas, la compañía y, sobre todo, el paseo a tu casa que fue de lo más bonito, estar en una noche agradable, con la brisa, nuestros comentarios y tu compañía, es algo que no quiero que cambie y que disfruto muchísimo. Me encantan tus besos, aunque los de despedida sean más tristes, no puedo negar que agradezco muchísimo el tener a alguien que me haga sentir verdaderamente lo que es echar de menos. De verdad que sí.
-
-Hay una cosa que me apena, y de verdad que me rompe el corazón, y es el pensar que puede que no vuelva a escuchar a mi padre hablar, o hablar bien. Sé que no tengo la culpa y que las cosas pasan como pasan, pero, ¿y si hubiésemos salido antes? ¿Y si le hubieses podido conocer cuando estaba mejor? Es algo que ahora mismo me martiriza y con lo que voy a tener que vivir toda la vida, y cuando me falte de verdad, cuando me falte su presencia, si no ha podido darse ese encuentro, eso será algo que me atormentará el resto de mi vida. Pero bueno, intento no ser demasiado duro conmigo mismo y no pensarlo demasiado. Es duro, de verdad que lo es.
-
-Y para no terminar con un mal sabor de boca este mensaje, quiero que sepas algo: eres todos los momentos que he pasado contigo, desde el primer mensaje de Tinder, pasando por todas las veces que hemos quedado hasta la última videollamada. Aunque esté en situaciones difíciles, siempre voy a estar para ti como tú has estado para mí. Eres mi Coret, y te quiero muchísimo, aunque no lo creas, más que tú. 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-app = Flask(__name__)
-
-async def mes_mensaje4(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Hola, mi Vida. Ya han pasado 4 meses desde nuestra primera interacción, y desde entonces la verdad he sentido que hemos ido cada vez a más: más cariño, más amor, más apego, hasta el día de hoy que nos considero absolutamente inseparables. No puedes creer la ilusión que me hace cada vez que vamos a vernos: las mariposas en el estómago, las cosas que pienso que van a pasar y las que acaban sucediendo, que siempre superan mis expectativas. Cuando pienso en ti pienso en la caseta, en sonrisas, en días preciosos y en lunas increíbles de ver. Cuánto amor tenemos preparado y cuántos planes vamos a realizar en los que estos 4 meses se queden en absolutas y triviales anécdotas en comparación. Te amo, mi Vida.
-
-Por todo lo que te amo y por todo lo que me has demostrado, te quiero escribir unas memorias de este mes que, aunque a todas luces fatídico, no lo he podido pasar mejor acompañado. Desde el principio del último mes, en que vernos se convirtió en una tarea más que ardua, el no poder dejar solo a mi padre y la responsabilidad de no solo cuidarme a mí mismo sino también al resto de mi familia hicieron de mí un zombi hospitalario, el cual solo tenía una ventana por la que escapar de ahí: su teléfono, la herramienta que más alegrías me ha brindado entre todo ese barullo de emociones negativas. Desde que empezamos a hablar, charlar contigo por mensajes ha sido muy especial, pero nunca tanto como lo ha sido durante este mes, en el cual cada “te quiero” contaba, cada foto contaba, cada reel, y todos esos mensajes bonitos al despertarse y al irse a dormir… todos han sido especialmente agradables para mí.
-
-A decir verdad, no solo estos mensajes que he mencionado han sido lo que ha destacado entre nosotros, también un cambio importantísimo y del que a lo mejor no damos tanta importancia como deberíamos: el paso del “te quiero” al “te amo”, dos palabras similares pero con conceptos diferentes en la raíz. No es para nada lo mismo querer que amar. Querer se pueden querer muchas cosas y es un sentimiento individual, lo que significa que lo siente uno por cosas ajenas a él para sí mismo. Pero amar… Amar es muy diferente. Cuando se ama, no se ama para uno mismo, se ama para el otro. Cuando alguien dice “te amo” no solo está diciendo que le gustas y que te quiere, sino que lo dice de una manera mucho más profunda. Un “te amo” refleja comprensión, entrega, preocupación y sacrificio. Un “te amo” nos enseña lo mucho que estamos dispuestos a dar de manera desinteresada por el otro, y en nuestro caso no podría ser más así. El amar es algo que nos define a la perfección y que estoy seguro de que lo seguirá haciendo.
-
-Pasaron los días y la situación no mejoraba. Fuimos a Valencia y con eso nuestras esperanzas de vernos bajaron, cosa que fue absolutamente devastadora. A partir de ahí la verdad es que las desgracias se sucedieron unas a otras: mi hermano dejó de poder acompañarnos, mi madre se puso tan enferma que también tuvo que dejar su posición en Valencia, y solo me quedé en una habitación de la que no podía salir y con unas responsabilidades que cargaba en mis hombros, a las que nadie me había enseñado y de las que tenía que aprender a afrontar sin previo aviso y en tiempo récord. Pero durante todo ese tiempo que pasé de manera solitaria no estuve solo, estuve acompañado; estuve acompañado por nada menos que la mejor novia del mundo: mi pareja y mi escape virtual, mi Vida. Muchas gracias por estar ahí, muchas gracias por acompañarme en mis momentos más tristes, en los peores momentos y en los que peor me he llegado a sentir en mi vida. De verdad que no sé qué hubiese pasado de lo contrario, pero estoy seguro de que nada bueno. Por eso, y por todo lo que este texto no alcanza a redactar, gracias de corazón.
-
-Al final no se pudo hacer nada más que acabar. Creo que es una escena a la que nadie estamos preparados para afrontar, pero desde las 5 de la mañana de ese mismo día hasta el final estuve muy bien arropado: por mi familia, por mis amigos y por ti, mi Vida. Llenasteis mi corazón como lo hicisteis con el tanatorio, entero, a rebosar. Y aunque no es el momento más idóneo para reunirse, pudiste conocer a toda mi familia y a todos mis amigos, en una de las escenas más bonitas que he podido presenciar y de la que estoy seguro mi padre se quedó encantado al verla desde el cielo. Y aunque ya no esté, y aunque las lágrimas recorran mis mejillas al escribir esto, y aunque las pesadillas me aterroricen por la noche, yo sé que él ha sido feliz, que lo ha dejado todo en orden, y que debemos amar su recuerdo tanto como lo amábamos a él y él nos ha amado en vida, que ha sido muchísimo. Así que, mi Vida, como mi padre me enseñó, voy a amarte tanto como pueda, más de lo que se cree posible, y de verdad que me esforzaré para que esté orgulloso de ello. Te amo, mi Vida.
-
-Aunque los días no se han hecho más fáciles a partir de ese punto, al menos recuperamos ese punto de normalidad y de tranquilidad que habíamos perdido y que ahora sé que es de tanto valor. Los días son largos y las noches también, pero al menos pude volver a verte, en el culmen de una espera que no podía demorar más. Creo que ahora, aunque triste, estoy feliz, porque estoy y estamos como deberíamos estar: juntos, contentos y amándonos mucho, como quiero y deseo y como me esforzaré para que continúe siendo así. Ahora las esperas se hacen larguísimas y todos los días espero que sea uno de esos días de la semana en los que te puedo ver y disfrutar de tu presencia, que ya es la que más disfruto. Nos quedan muchas cosas por hacer y muchas experiencias por vivir, pero no dudes que eres la persona con la que quiero hacerlas, y si durante todo el tiempo que estemos juntos puedo al menos devolverte la mitad de todo el amor que he recibido durante este tiempo, no te va a caber en el cuerpo. Quiero seguir contigo y lo necesito para seguir siendo tan feliz como estoy ahora. Quiero que hagamos todo lo que nos gusta juntos y que descubramos nuevas cosas que nos gusten juntos. Por lo que ha sido este mes y por los que vendrán te dedico estas palabras. TE AMO 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-
-async def mes_mensajeOctubre(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Octubre, mes de otoño, y en el que, aunque todavía haya un sol abrasador, nos hemos podido ver mucho y muy bien. Primero, me gustaría destacar un evento que para mí fue muy especial, y fue el día que viniste a cenar a casa. Jopé, en serio, la pasé súper bien, y me encantó enseñarte la terraza, que era una de las ilusiones que tenía y por lo que, cada vez, de las muchas veces que subía al terrat a ayudar, me motivaba para hacerlo lo mejor posible, pues sabía que algún día compartiría ese espacio contigo en una agradable cita. Y como tal, aquel día llegó: el día de presentarte a mi madre y, de paso, a mi abuela jsjajaja. Aunque esa noche me llevara algunos palos, nunca la olvidaré, porque al final pudiste comprobar de primera mano que mi madre te aprecia y que le caes bien. Que bueno, al final se hubiese tenido que acostumbrar, porque te verá mucho más.
-
-Y hablando de verte más, creo que ya es buen momento de empezar a hablar del tema principal que creo que ha rodeado este mes, y ha sido el saber y comprobar entre los dos que esta, nuestra relación, no es cualquier cosa, sino la relación. Nuestra relación, y la que tendremos hoy, mañana y nuestro último día aquí. Creo que voy a empezar a hablar de este tema con algo simple, solo con cosas que me van a gustar: me va a gustar verte la cara todos los días, me va a gustar darte un beso de buenos días todos los días en persona, me va a gustar prepararte el desayuno o disfrutar del súper desayuno que algún día me prepararás. Me va a gustar decirte “ya vuelvo a casa” al terminar de trabajar, me va a gustar ver cada outfit con el que salgas de casa conmigo, me va a gustar sacar a pasear al perro contigo (es muy bonito el golden retriever), me va a gustar mucho quejarnos de nuevo de que el gato ha roto algo en la casa, y me va a gustar muchísimo dormir abrazadito a ti cada día de los días que me queden.
-
-Hoy he escuchado una reflexión que me ha gustado. Puede que, leyendo las cosas que me van a gustar, hayas pensado que al final eso son cosas bastante cotidianas, pero, como he escuchado hoy, las relaciones sanas de verdad no son las relaciones peliculeras, con muchísimo drama y con montañas rusas de emociones cada día. Las relaciones sanas de verdad son esas en las que te levantas tranquilo, disfrutas de tu día tranquilo y terminas tu día tranquilo, porque sabes que has elegido bien, que tuviste muchísima suerte el día que conociste a esa persona, y que cada día que pasas a su lado no lo cambiarías por nada. Y creo que nosotros ya hemos cumplido con eso, así que lo que nos queda es disfrutarnos. Disfrutarnos al 100%, disfrutar de las miradas, disfrutar de los saludos, de las caritas de amor, de los juegos, de los momentos inolvidables, de las caricias y de los cariños, que nos recuerdan cada día que lo que sentimos el uno por el otro es lo único realmente importante en esta vida, y es el amor.
-
-Creo que hay una idea que quiero expresar con claridad. Desde que empecé a salir contigo, mi vida, sé que no voy a poder vivir sin ti. Es que tengo una seguridad en mis palabras absoluta: simplemente eres todo lo que quiero. No sé si te habrá pasado alguna vez, pero ha habido más de una vez que, reflexionando, me he parado a pensar, y como buena mente de científico, la curiosidad por saber las posibilidades me ataca. ¿Cuántas posibilidades hay de encontrar algo perfecto? ¿Cuántas posibilidades hay de encontrar una persona que te va a acompañar y que es perfecta para hacerlo? ¿Cuántas posibilidades hay de que la persona con la que vas a compartir el resto de tus días sea todo lo que necesitas, tenga todo lo que quieres y sea a la persona que más amas en este mundo? Pues, a día de hoy, sigo sin poder resolver esos cálculos estadísticos, pero lo que sí sé con seguridad es que ni el mayor premio de la lotería podría igualar esta suerte. Mi vida, no puedo dejar que te vayas de mi lado, no puedo relajarme contigo, no puedo dejar que la persona con la que estoy seguro de que quiero pasar el resto de mis días pase uno solo pensando que no la amo con locura. Sé que soy el hombre más afortunado del mundo, lo SÉ.
-
-Me ha emocionado un poco escribir el último párrafo, la verdad, pero las lágrimas de alegría me las retiraré con mucho orgullo de la cara, hoy y todos los días que vuelva a ocurrir. Quiero recordar la última vez que nos vimos, ¿sabes?, cuando te miré y sonó la música, y me emocioné de la alegría mirándote. Esas lágrimas transportaban el mensaje más sincero que he podido transmitir en mi vida. Cada una de esas lágrimas escribía un poema que describía cada uno de los días que pasan por mi mente pensando en el futuro contigo. Joder, lloré por la alegría que me aporta pensar en una vida contigo. Mi vida, te amo muchísimo y no puedo parar de llorar, porque es que la felicidad rebosa mi cuerpo y produce en él un ansia de estar contigo, una necesidad de compartir contigo todo lo que pueda, unas ganas de vivir contigo el resto de mi vida. Joder, de verdad, nunca dejaré de recordar lo afortunado que soy.
-
-Nos queda tanto por vivir, nos quedan tantas cosas por vivir juntos, nos queda toda una vida. Y si algo me ha enseñado mi padre, si una es la lección que tengo que sacar de él, es la verdadera naturaleza del éxito. Mi padre fue la persona más exitosa que he conocido en mi vida, ¿y sabes por qué triunfó en vida? Porque tuvo todo lo que quería, consiguió lo que le hacía feliz y lo vivió al máximo, que fue una familia con mi madre y con nosotros. Y yo he aprendido bien lo que es el éxito realmente, y puedes estar segura de que las enseñanzas de mi padre no se van a perder: voy a triunfar en la vida, Coret. VOY A SER EXITOSO CONTIGO. Voy a vivir todas las cosas que quiero vivir contigo. Vas a ser la fuente de mi felicidad, y todo lo que nos va a rodear nos va a hacer ser los más ricos del mundo. Mi vida, vamos a ser muy felices, y voy a asegurarme de que así sea.
-
-Creo que, con todas las emociones y lágrimas que he volcado en este texto, ha quedado bastante claro, pero quiero jurar algo en este código de Python que estoy escribiendo: mi corazón es el que ha escrito esto, la sinceridad es la que ha escrito por mí, todo lo que he dicho es cierto o lo terminará siendo. Que no te quepa ninguna duda de que estos son mis más reales sentimientos, y que mis emociones me llevan a amarte con una intensidad mayúscula. Si tengo que resumir este mes en algunas pocas palabras serían: quiero compartir mi vida con mi Vida. Te amo, Coret 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-
-async def mes_mensajeNoviembre(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Hoy es 24 de noviembre, y como cada mes, dedico un tiempo a recordar, a expresar, y sobre todo a sentir mientras te escribo. Hoy hace 6 meses desde que nos conocimos; en 6 meses la Tierra da media vuelta al Sol, es decir, estamos viendo la cara opuesta del Sol a la que vimos cuando empezamos a salir. En estos 6 meses han florecido un total de 30 tipos de flores y 28 tipos de frutas diferentes, y hemos sido lo suficientemente afortunados como para poder observar el crecimiento de muchas de ellas, lo cual ha sido maravilloso. Pero lo mejor de estos últimos 6 meses, sin duda, ha sido que esta, nuestra relación, se ha afianzado y consolidado enormemente, pasando a ser el tema principal de mis días: por las mañanas tú, por las tardes tú y por las noches tú. Te has convertido en mi razón: razón para soñar, razón para pensar, imaginar, sentir, amar. Todo, absolutamente todo lo que hago, lo hago pensando en ti. Hablo de ti con mi madre, hablo de ti con mi hermano, con mis amigos; de lo feliz que me haces, de lo contento que me pones y de lo mucho que te amo. Y es que esta es mi nueva realidad, una que nunca dejaré que se pierda: amar.
-
-El mes empezó con una muy buena fiesta de Halloween que me hubiese encantado disfrutar contigo, mi Vida. De verdad que me hubiese gustado mucho, porque ibas preciosísima. Aunque mi madre dijese que no dabas miedo, tu tía tenía razón: ibas de guapa. Qué preciosa eres. Espero que, cuando tenga los ánimos más altos, pueda ir contigo a muchas de estas fiestas y celebraciones, porque quiero disfrutar muchísimo de ti, mi Vida. Es algo que, la verdad, me ilusiona mucho: Navidad, San Valentín, Falles, cumpleaños, aniversario, reuniones familiares… Quiero pasar tantas cosas contigo, quiero crear tantos recuerdos, quiero dejarte grabada en mi retina. Agradezco muchísimo todo lo que hemos vivido ya juntos, pero agradeceré muchísimo también todo lo que nos queda por vivir. Quiero estar a tu lado en todas estas experiencias y agradecer cada segundo de ellas, como hago cada vez que te veo.
-
-No sabes cuánto me hiciste feliz al regalarle algo a mi madre, que la verdad lo está pasando mal. Sabiendo cómo estoy yo, no quiero ni imaginarme cómo debe de sentirse ella; debe de ser durísimo. Y el saber que la persona que tengo a mi lado no solo se da cuenta, sino que dentro de sus capacidades se esfuerza por hacerla sentir mejor y por animarla, Coret, me hizo sentir de putísima madre. Me hizo sentir que me ha tocado la lotería, porque de verdad que son gestos de una persona que es un sol, que eres genial, y que muchísimas gracias por apoyarnos a todos. Te amo por todas esas cosas que haces y me haces sentir. Eres la persona que quiero que mi familia quiera como una más, porque lo mereces, porque sé que vamos a ser todos más felices y porque sé que nosotros también podemos intentar hacerte lo más feliz posible, tratándote lo bien que siempre has merecido ser tratada. Eres un tesoro, de verdad.
-
-Siempre vas a tener un refugio, siempre. Quiero ser la persona que te anime cuando tengas problemas, la persona que está ahí incondicionalmente, la persona que, pase lo que pase, va a tratar de sacarte una sonrisa entre las lágrimas. Mi Vida, no puedes llegar a imaginar, pero ni por asomo, lo que significó para mí verte aquel día en la pizzería. Temblaba como un flan, porque aunque sabía que necesitaba transmitirte seguridad y cariño, estaba súper nervioso por hacerlo bien, y por verte, por hacerte sentir acompañada, y porque supieras que estaba ahí para ti, como quiero que sepas siempre. Que voy a estar a tu lado en cada momento brillante de tu carrera —que sé que serán muchísimos—, pero también en cada momento oscuro o más peliagudo. No soy una persona que está solo en las buenas: yo quiero compartir mi vida contigo, toda ella, y eso incluye todo lo malo que pueda pasarnos. Nunca vas a estar sola, nunca.
-
-Caminar se siente ligero, descansar se siente cómodo, hablar se siente divertidísimo, pensar se siente agradable, soñar se siente placentero, tocar se siente suave, ver se siente armonioso, oír se siente reconfortante, saborear se siente delicioso, sentir se siente amoroso, llorar se siente de alegría, abrazar se siente calmante; tenerte se siente como un lujo.
-
-De verdad, no puedes salir de mi Vida. Necesito que mi abuela te siga saludando, necesito que mi madre te siga conociendo, necesito que mi hermano siga hablando contigo. Como he dicho antes, quiero compartir mi Vida contigo, y no solo las festividades o los buenos momentos, sino también todos esos momentos duros que la vida nos tiene preparados, que sé que vamos a afrontar de la mejor manera; que vamos a ser un equipo, una pareja maravillosa; que vamos a poder solucionarlo todo porque de verdad sé que sentimos un amor puro, un amor que lo vale todo y que vale su peso en oro. Tú vales tu peso en oro. Eres una persona maravillosa, que se esfuerza muchísimo, y por la que doy gracias todos los días. Vales más que un diamante, y no te cambio por nada en el mundo porque eres lo mejor que tengo, mi Vida. Comparte la vida conmigo, ¿de acuerdo? Te amo, Coret. Espero que te haya gustado este mensaje y pequeño resumen de Noviembre. Sé que mi padre está sonriendo desde arriba viéndome escribir esto. Te amo de corazón, mi Chocolatet 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensajeDiciembre(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Holaa mi vida, ya termina el año y para mí esta es una fecha doblemente especial: primero porque es nuestro mesversario y después porque es Nochebuena, que, aunque se prevé dura, intentaré disfrutar lo máximo y no forzarme ni a mí ni a mi familia a hacer nada que no nos apetezca, juntarnos con la familia e intentar disfrutar como mejor sepamos hacer.
-
-Pero no estoy aquí para hablar de las fiestas, estoy aquí para hablar de lo más bonito que conozco, que somos nosotros. Este mes, la verdad, ha sido absolutamente genial. Primero que nada quería felicitarte por las súper buenas notas que has sacado. De verdad te digo que me haces sentir súper orgulloso y me alegra mucho tener al lado a una persona que está sacando su carrera adelante de una manera tan buena. No sé si alguien más te habrá felicitado, pero yo siempre estaré para destacar todas y cada una de las victorias de tu vida, porque para eso voy a estar en ella el resto de la mía: para cuidarte, para mimarte, para premiarte y para recompensarte por todas las cosas buenas y bonitas que haces. Eres una crack.
-
-Ahora me apetecía mucho hablar del día en el que viniste a casa a comer. Por primera vez te sentaste en una mesa con mi familia a charlar y a disfrutar de una agradable comida hecha por nosotros, y no sabes lo bien que me lo pasé. De verdad que fue magnífico, desde el ratito que pasamos juntos codo con codo haciendo el pollo y la ensalada hasta el estallido de risas que fue hablar de la casa de los gemelos JSJAJAJAJ. Quiero agradecerte mucho que vinieras porque era un momento importante para mí y, como estaba claro, fue muy especial. Es que estos momentos me hacen pensar en todos los que vendrán: las comidas familiares en las que participarás, el cariño que te va a coger mi hermano y mi madre, la pasión y el amor que vamos a compartir en familia. Es una sensación increíble que me encanta. Sinceramente, eres parte de mi familia y terminaremos creando una nosotros dos juntos, estoy seguro.
-
-Te amo muchísimo. Es una frase que no puedo dejar de decirte porque no la puedo evitar. No puedo dejar de sentir que me amas cuando me acaricias, cuando me abrazas, cuando me miras, cuando me besas. No puedo dejar de sentir que me amas cuando compartes tantos momentos bonitos conmigo y también cuando compartes tus momentos más duros, cuando me cuentas cosas sobre las personas que te han hecho daño y sobre aquellas cosas en las que eres vulnerable. ¿Sabes por qué? Porque eso no se comparte con cualquiera. Saber que soy de tu confianza, saber que el amor que sientes por mí es tan y tan suficiente como para compartir conmigo esas experiencias vitales tan amargas me hace sentir demasiado bien, y te agradezco mucho que lo hagas. Te amo porque veo un pasado precioso contigo, te amo porque amo el presente que me brindas cada día y te amo porque el futuro que nos espera es absolutamente brillante. Los tres espíritus de la Navidad nos enseñarían maravillas a ambos y todos los días doy gracias por ello. Eres increíblemente buena contigo y el amor que me das me llena hasta salirme por las orejas. Te amo, mi vida, y siempre lo haré.
-
-También quería hablar, como no podría ser de otra manera, de tu cumple. Veinte añitos jsjjajj, que sinceramente no podría haber salido mejor. Te tengo que ser sincero: cuando me dijiste que a lo mejor no terminabas celebrándolo me asusté bastante, porque no quería que tu día, el día en el que se celebra tu nacimiento y el más bonito del año bajo mi parecer, no lo disfrutaras. Tenía miedo de no estar a la altura de brindarte la felicidad que te mereces en tu cumpleaños, pero al final no fue así. Tomaste tarta con tus compañeras de clase, soplaste las velas con tu familia y apagaste unos encendedores conmigo JSJAJAJAJ.
-
-No, pero hablando en serio, cada maldito momento de ese día fue especial para mí en todos los sentidos: porque estabas preciosa, porque la noche era súper agradable dándote la mano y porque sentía que podía hacerte feliz, que tenía la capacidad de hacerte sentir bien, y eso me relajó y me puso contento.
-
-Primero dimos un paseíto por el paseo, nos acercamos al árbol de Navidad y la verdad es que me quedé maravillado, pero no solo por el árbol, sino porque estaba con mi novia en un sitio tan bonito como ese, compartiendo un momento tan bonito. Aaaay, es que me derrito de amor escribiendo esto, jopé. Y nos sacamos una bonita foto, aunque tenemos que sacarnos más JSJAJAJA. Luego seguimos caminando por el paseo y te conté algunas cosas que aprendí hacía poquito y que me parecieron muy interesantes. Otra de las cosas que quiero agradecerte es que te intereses por todas estas frikeces que suelto muchos días y que me sienta súper en compañía cuando las comentamos juntos y noto que me escuchas. Es que te amo demasiado. Solo imaginarte a mi lado escuchándome hablar de cualquier historia científica que me guste me pone de súper buen humor, jopé.
-
-Luego nos adentramos en un mercadillo sin saber lo que nos íbamos a encontrar y terminamos probándonos ropa y sacándonos fotitos, incluso llevándonos un par de prendas súper bonitas. Qué divertido fue, y ¿sabes qué? Esa experiencia solo me dio muchas más ganas de salir de compras contigo y divertirme otra vez a tu lado.
-
-Al terminar fuimos al Begin tras hacer un par de paraditas y, madre mía, qué sitio tan hermoso, tan acogedor y tan cómodo. No sabes lo que disfruté a tu lado, de la comida y de la compañía. Tenerte sentadita a mi vera es algo por lo que siempre voy a dar gracias. Mirar al techo y vernos reflejados, rodeados de plantas bonitas y muebles de madera hermosos… Pero ¿sabes qué fue lo más maravilloso de esa cena? Sentir que estabas disfrutando. Me realiza como pareja sentir que disfrutas a mi lado, y sin duda quiero que se repita. Quiero que probemos ese curry con arroz japonés.
-
-Al terminar nos asomamos al Piko Rico a por unas empanadas y terminamos pillando un par de cosas típicas que, tengo que serte sincero, estaban absolutamente deliciosas. La manzana y los quipitos estaban súper ricos y los disfruté mucho, y las empanadillas… madre mía, qué delicias, por favor. Estaban buenísimas. Ahora quiero muchas más y las quiero contigo. Luego volvimos a la caseta y creo que fue de los viajes en coche que más he disfrutado.
-
-En la caseta ya pudimos disfrutarnos a solas. Tú sabes las ganas que tenía de que entraras al cuarto y vieras mi regalo. Eran muchas, porque quería que vieras todo lo bonito que siento por ti: una cesta de color blanco con regalitos como Chocolatet, en la que me inspiré en los peluches de la feria; mi camiseta de Palermo, que también era la de tu graduación, una camiseta muy especial para mí; dulces, flores y una cartita que tenía muchas ganas de que leyeras. Por si no te habías dado cuenta, me encanta escribirte. Espero que te gustara tu regalo porque me esforcé en pensar cosas especiales y que te gustasen. Lo hice con mucho amor. Te amo, tesoro.
-
-Además pudiste soplar las velas y probar la tarta de frutos rojos que querías para tu cumple. Cómo la disfruté y cómo disfruté viéndote probarla. La verdad es que es de las recetas de las que más orgulloso estoy de haber hecho, porque era para ti. Tenía que salir bien y terminó siendo un éxito total. Luego pasamos la nochecita juntitos y abrazaditos y creo que no he pasado una noche tan agradable nunca, y todo gracias a tu calor humano y a tus abracitos.
-
-Al despertarnos estaba a tu lado y te pude dar los buenos días en persona. ¿Te lo puedes creer? Cuánto tiempo llevaba esperando ese momento y no defraudó para nada. Fue muy especial y bonito. Y hablando de cosas buenas, qué riquísimas que estaban las arepas, por Dios, aunque si te digo la verdad me gustaron más las tuyas. Esas dieron para tener una comida bajo el sol muy bonita.
-
-Me siento orgulloso, muy orgulloso, de haber conseguido lo que conseguí: tener un cumpleaños memorable y bonito contigo. Nunca se me olvidará, pero ten por seguro que el año que viene repetiremos e intentaré que sea aún mejor.
-
-Una vez terminado de hablar de tu cumple quería hablarte de otro día muy bonito e importante: Navidad. Aunque estas no vayamos a pasarlas juntos, no te preocupes, porque el sábado 27 las disfrutaremos por todo lo alto. Pero no venía a hablar de eso. Lo que quería es describirte un 24 y 25 de diciembre cualquiera en un futuro…
-
-Hay risas en el salón, el pollo está riquísimo, la tele canta y la Navidad se siente. El humo de la cocina calienta a las personas que queremos mientras tomamos un aperitivo. Llevamos sombreros rojos y hay pasos rápidos. Sentimos el amor de todos y el cariño entre nosotros. Terminamos, recogemos y vamos a la cama. El árbol estaba bonito…
-
-Alguien nos está despertando. Qué guapos que son nuestros hijos, deben de haber salido a ti… ¿Qué? ¿Que era justo el regalo que queríais? Me alegro mucho de que Santa haya acertado este año, preciosos. Disfrutad de ellos…
+import bitacora
+from enrutado import cargar_json
+from metricas import TIPO_CONTENIDO, registro
 
-Me encanta mi familia y me encanta haberla formado contigo.
-Firmado: los nosotros del futuro.
+bitacora.configurar()
+log = logging.getLogger(__name__)
 
-Una promesa. Nosotros somos una promesa, y una muy bonita 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensajeEnero(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """2026, ya con 23 años pero con el mismo amor, y creo que esto es algo increíble, un enorme privilegio, algo que no se debe dar por sentado y por lo que hay que mirar atrás y dar gracias. Y de eso van estos mensajes, de echar la vista ligeramente atrás, recordando y reviviendo experiencias que nos han hecho estar donde estamos, que es en el de una grandísima felicidad.
-    
-Quiero empezar diciendo algo importante: que mientras mire a mi alrededor, todo lo que vea a mi alrededor me recuerde a ti es un lujo; que cuando me ponga a pensar tú aparezcas en ellos es un lujo, pero sobre todo, lo que más es un lujo es poder compartir mis días y el resto de mi vida contigo, Tesoro.
-
-Quiero que pienses en una cosa, quiero que te imagines como mejor puedas algún momento en el que te hayas sentido un poco mal o desanimada, y aunque sean cosas de uno mismo con su cabeza, quiero que te imagines que te doy un abrazo en esos momentos, que te acaricio la cabeza y que te susurro que todo estará bien, juntos todo estará bien siempre… Puede que no siempre esté físicamente contigo, pero quiero que recuerdes que siempre tendrás a alguien a tu lado, siempre.
-
-Pero bueno, tras hablar un poquito en esta introducción, ¿por qué no nos volvemos a finales de diciembre? Justo al día de Nochebuena, en el que comimos un montón y, aunque separados, estábamos bien acompañados por nuestras familias y nuestro amor. ¿Sabes una cosa que recuerdo con claridad de ese día? Que acompañaste a tu tío a dar una vuelta con el frío que hace, solo por acompañarle y hacerle sentir mejor. Eso es precioso, sinceramente. Puede que parezca una tontería o algo sin importancia, pero realmente, ¿qué nos hace querer al resto de personas que nos rodean si no estas pequeñas cosas que demuestran afecto, cariño y preocupación? No me equivocaba al decir que uno de tus mejores atributos es el querer bien, y me lo demuestras a diario.
-
-Al día siguiente, Navidad, que sé que es una fecha importante y muy querida por ti, y creo que nunca le había dado un significado tan profundo como el de este año. Tanto por la falta de mi padre, que aunque no quiera me pesa todos los días, como por la ilusión y el amor que me transmitías en estas fechas. Valores de compromiso, compartir y amor son cosas que no siempre he tenido tan claras, pero que surgen facilísimamente cuando son contigo, porque son y siempre serán sentimientos que voy a tener contigo. Mi corazón está en deuda contigo por un tratamiento tan intensivo de terapia amorosa, que ha hecho en muchas más ocasiones de las que crees que no se desmorone. Y en este momento me gustaría que recordases el epílogo que hice en mi anterior mensaje, “mensajeDiciembre”, porque está dedicado a un 24 y 25 cualquiera como esos.
-
-Quiero pasar el resto de las Navidades contigo, quiero tenerte a mi lado, quiero sentir que estamos unidos, que estamos reforzando una construcción en la que trabajamos a diario y de la que estamos orgullosísimos de mostrar a los demás. Quiero mirarte a los ojos cuando te diga feliz Navidad, y quiero seguir mirándolos, llenos de ilusión, cuando recibas tus regalos; quiero mirarlos cuando nos acostemos a dormir juntos y quiero mirarlos cuando nos despertemos; quiero mirarlos cuando me digas te amo y cuando me recuerdes que no puedo rendirme; quiero mirarlos siempre y por siempre.
-
-Al poco tiempo de las Navidades llega mi día, el día de mi cumpleaños, en el que se celebra mi nacimiento con las personas que amo, en el que tenía muchísima ilusión metida, ya que iba a ser una de las primeras veces en las que mis amigos de varios grupos y tú ibais a coincidir en un ambiente distendido y amigable, y no decepcionó, ni lo más mínimo. Disfruté de cada segundo de ese día, desde que me levanté hasta que me acosté, y todo fue gracias a mis amigos y a ti, porque fuisteis los que me llenasteis de ilusión y amor. Me encantó charlar contigo, me encantó compartir risas con todos y me sentí súper apreciado. Qué bonitos regalos, desde el proyector hasta la sudadera, el llavero y el cuadro. De verdad te digo, y te hablo desde el corazón, cuando digo que los tuyos son los mejores regalos que me han hecho nunca, no solo porque noto que los hiciste pensando mucho en mí y porque llevan un trabajo enorme, sino porque en cada uno de ellos hay una huella de tu amor grabada en lo más profundo de mi corazón 🤍.
-
-Además, quiero hablar de la preciosa carta que me hiciste, porque sí, lo bordaste. No sé si sabes una cosa chula: cuando estoy desanimado o no tan bien, me encanta ir a nuestro chat y ver fotos nuestras, pero también leer mi carta. Está tan cargada de amor, tan cargada de cariño, me hace sentir tan bien que siento que me muero de afecto. Muchísimas gracias por la carta y por todo lo bonito que escribiste en ella, que es muchísimo. La tengo en favoritos y la releo a menudo. Gracias por ella y por todo el amor que me diste ese día.
-
-Otra cosa de la que quiero hablar fue el rato que estuvimos en el hospital, que no voy a negar que fueron horas bastante angustiantes, pero, aunque no te lo creas, no cambiaría esos momentos por ningún otro. No había otro lugar en el mundo en el que deseara estar que en tus brazos. Cuando recuerdo mi cumpleaños, una sonrisa viene a mi cara en parte porque pude estar a tu lado en un momento en el que lo estabas pasando mal, y eso es el amor. Que eso me haga feliz me dice, sin temor a equivocarme, que estoy enamoradísimo de ti a más no poder, porque es el preocuparse y el sentir por la otra persona lo que nos hace humanos de carne y hueso que amamos. Pero yo soy muy diferente al resto y lo recuerdo todos los días, porque yo tengo la suerte de que me ames tú, la mejor persona del mundo entero y la que va a acompañarme el resto de mis días.
-
-Y ya por último quería hablar un poco de lo mal que lo has pasado a partir de ese día y de lo que está costando tu recuperación. Hay una cosa que quiero que sepas y es que si en algún momento no he estado a la altura de la compañía que necesitabas, lo siento, porque mientras escribo esto siento que podría haber hecho más que estar a tu lado por teléfono. Sé que la situación era difícil, pero no sé, no dejo de pensar que a lo mejor podría haber hecho algo más y por eso lo siento. Lo que sí quiero que tengas claro es que siempre estaré cuando me lo pidas y te acompañaré a todo, porque eres mi persona favorita y que cuando vivamos juntos no pasarás ni un mal día sin mi compañía, porque no te me podrás quitar de encima JSJAJAJA, dándote cariños, mimándote, cocinándote y haciendo cualquier cosa que necesite mi Reina para que pueda descansar y recuperarse. Eres muy valiente y paciente con esto y es una de las cosas que más admiro de ti. Estoy seguro de que para el mensaje del mes que viene estarás mucho más que perfecta.
-
-No sé si es algo que tengas por seguro o no, pero nuestro futuro, que aunque no nos demos cuenta lo vivimos a diario, es absolutamente brillante, tanto que me alumbra e impresiona cada vez que lo imagino. Viviremos juntos, tendremos una familia preciosa; puede que no lleguemos a ser mega multimillonarios, pero seguro que nunca nos faltará de nada y, sobre todo, lo que nunca nos faltará será amor. Soy un exitoso que todavía tiene todo el éxito del mundo por vivir y quiero que sepas que tú también, que formas parte y eres la razón de ese éxito. Eres mi persona favorita y con la que voy a vivir el resto de mis días, que estoy seguro de que el día que vistas de blanco será el mejor de todos ellos. Te amo, mi Vida, eres lo mejor que me ha pasado y no quiero nunca dejar de mirar hacia atrás y volverme loco de lo feliz que soy estando contigo. Un besazo y recupérate, Hermosa 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensajeFebrero(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Hola, Chocolatet, otro 24 y otro mes en el que dedico un poco de mi tiempo en permitir que mi corazón se exprese con libertad total. Hoy hace 9 meses desde que nos conocimos y, como siempre, este ha sido un mes muy especial para mí, no solo porque he podido compartir nuevas experiencias contigo, sino porque, como siempre, has seguido demostrando lo maravillosamente genial que eres, como persona y como pareja. Eres la mejor, Coret.
-
-Esta vez me gustaría empezar hablando de algo que, aunque siempre he sabido, quiero que tú también seas consciente de ello. Eres ideal para mí, pero hablo en serio, es que siento que toda tú me encajas a la perfección, y quiero contarte unas cuantas de esas piezas que tienes que forman un puzzle precioso junto a mí. Además, quiero que sepas que siempre que he pensado en una relación son cosas que inconscientemente siempre he buscado y que tienes, mi amor. Cariño, miradas cómplices, cuando me das la mano, que me preguntes qué tal estoy, regalos, detalles, que me digas que me amas, que me digas que me quieres, que te guste compartir tiempo conmigo, que te parezca interesante, que me escuches y me comprendas, que me acompañes, que sientas cuando no estoy tan bien, que te preocupes por mí, que me empujes a ser mejor, que me animes, que me motives, que premies mis esfuerzos y que me acompañes en mis caídas, que seas tú misma… Todo esto y todo lo demás que te hace ser tú es lo que me mantiene enamorado de ti hoy y lo que seguirá haciéndolo, porque es lo que te hace ser tú y lo que siempre me seguirá haciendo ser tuyo.
-
-Una vez terminado este pequeño preludio quería hablarte un poco de nuestro mes juntos, que en mi honesta opinión ha estado increíble, y por qué no empezar por el principio. ¿Sabes una cosa? Me ha hecho muchísima ilusión que te hayas ido incorporando a nuestros planes en familia; poco a poco ahora eres una parte muy importante de nosotros. Por ejemplo, el día en el que viniste junto a nosotros a Ondara, en el que pudimos probarnos ropa juntos y comer junto a mi familia mientras reíamos y nos spoileábamos sobre Dexter JSJAJAJAJA. Pero, hablando en serio, fue un día muy especial para mí, y aunque a lo mejor no surgiera de la manera más agradable del mundo, sí que es un día que voy a atesorar en mi corazón porque es realmente especial.
-
-También he tenido la gran suerte de poder acompañarte en los momentos en los que el dolor ha hecho algo de mella en ti, y quiero que sepas que siempre voy a estar ahí para ti. Quiero que puedas contar conmigo cuando enfermes, cuando necesites transporte o simplemente alguien que te acaricie el pelo. Por desgracia no tengo la cura de tus males, pero te puedo jurar que estaré junto a ti para hacerlos lo más llevaderos posibles siempre: acompañarte al médico, hablar con enfermeros, cuidarte en casa cuando vivamos juntos, servirte y mimarte como te mereces. Déjame cuidarte el resto de tu vida mejor de como lo he hecho hasta ahora, mi vida, y eso me hará más feliz que nada en este mundo.
-
-Y otro día que estuvo súper bien para mí, y que es de esos días que realmente son los que hacen una pareja bonita, fue ese pequeño almuerzo que nos dimos, aunque no quisieran darnos la fórmula secreta de los bocadillos especiales JSJAJAJAJA. No, pero realmente fue un día muy agradable, como todos los que comparto contigo, y agradezco mucho que me acompañes en una de las experiencias que más disfruto, como son los almuerzos. Gracias por hacerlos divertidos, cómodos y amorosos, y pensar que antes de conocerte pensaba que nada podía hacer mejor un almuerzo, y ahí estás haciendo que cada segundo de ellos se sienta increíble. Te amo, mi vida, y amo pasar tiempo a tu lado.
-
-Pero ahora vamos al plato fuerte de este mes, que ha sido sin duda tu santo, San Valentín, una fecha que hasta hace poco no tenía la menor importancia para mí. Ahora se ha convertido en un recuerdo precioso gracias a ti. La verdad es que me emocionaba mucho preparar la habitación, y aunque sabía que luego sería mucha limpieza, no podía parar de repartir pétalos de rosa y corazones por doquier, decorando la habitación que nos recibiría más tarde y que tendría que estar a la altura de tal fecha, el Día de los Enamorados. Junto a los olores agradables que pude añadir y los pequeños detalles de regalos que te di, me encantó pasar ese día junto a ti, pero sobre todo quería darte las gracias aquí y ahora por tus regalos. No sabes lo emocionado que estaba viendo cómo esa cajita, que se notaba tan trabajada, me daba un recorrido mental por los mejores recuerdos que tengo contigo, además de los preciosos mensajes que dejaste en cada uno de los besos que sentí como si fuesen tus propios labios. Gracias por ello, y espero que, aunque la cena no fue como esperábamos y tuvieses algo de dolor, ese día fuera tan especial como lo fue para mí, que ya te digo que lo fue muchísimo.
-
-Mi vida, eres lo mejor que tengo y espero que este mensaje te recuerde que cada día contigo es un tesoro más que almaceno y con los que me reencuentro cuando escribo o leo estos mensajes. Por último, admitir que tengo debilidad por imaginar tener hijos contigo, la verdad; este mes lo he pensado muchísimo y sé que va a ser la experiencia que me complete como persona, incluso si lo tengo que llevar con una correa JSJAJAJAJAJ. No, pero en serio, amo la vida que tengo contigo y seguiré trabajando para que el resto de vida que nos quede juntos sea tan buena que solo tengamos buenos recuerdos cuando miremos atrás. Gracias por todo lo que me has dado en febrero y espero haberte correspondido adecuadamente.
-
-Atentamente, el amor de tu vida 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensajeMarzo(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Hola mi Tesoro, hoy 24 de marzo, hace 300 días que empezamos a hablar, 300 días que han estado llenos de risas, alegrías y sentimientos increíbles, gracias a cómo somos y a la química que hay entre nosotros esos 300 días han pasado como un suspiro, como un parpadeo, y cuánta razón tienen las personas que dicen que el tiempo es relativo, porque cada momento contigo pasa rapidísimo y los ratos que me faltas se amontonan como paredes de una cárcel, la verdad que la distancia es molesta, hay muchos momentos en los que me digo ¿por qué no estás ahí con ella? ¿Por qué no estás cuidando de ella en este momento? Incluso me castigo mentalmente así algunas veces, pero sé que algún día no tendremos ninguno de esos problemas, sé que algún día todo lo que haremos será compartir, reír, apoyarnos y amarnos como hacemos ahora cada vez que nos vemos, sé que ese tiempo será perfecto porque cada momento que paso ahora contigo ya lo es, te amo mi Vida.
-
-La verdad que marzo ha sido un mes tranquilo, pero aun así quiero contarte cosas y abrirme contigo como cada mes, este ha sido otro mes frío y lluvioso, maldita lluvia, con ella se me ha complicado ir a repartir hasta el Mc Donalds, es broma, sé que no te hizo gracia ese comentario, pero en serio me ha sabido mal no poder verte tanto como desearía, pero ya que estamos quiero contarte un poco cómo vivo los días que voy a verte. Me despierto pronto, normalmente con un bonito mensaje ya de tu parte recibido y me preparo cambiándome y pensando en qué llevarte, luego bajo, cojo la bici y paso por el cementerio a ver a mi padre, sí, él me acompaña cada vez que voy a verte, luego cruzo un puente hasta Rafelcofer y de ahí directo a Oliva, pensando hacia dentro, qué buen día, qué buen sol y qué bien me lo voy a pasar con ella, es que es maravillosa, mira Adrí, una cosa te voy a decir, ¿has visto esa mirada en alguien? ¿Has visto cómo te miran esos ojos? ¿Cómo consigue hacerte reír? ¿Cómo se preocupa por ti mucho más de lo que lo haces tú mismo? ¿A que no? ¿A que nunca has tenido algo así? Algo tan mono y a la vez tan increíble, hazlo bien, pedalea, esfuérzate y cada momento de tus viajes lo sentirás como nada comparado con poder ver al amor de tu vida, y así es, un gusto y un placer el poder contemplar lo que sé que es mi mujer 🤍
-
-De otra cosa de la que quería hablarte es de las súper notazas que sé que estás sacando en clase, son una maravilla, aunque a día de hoy no las tengas todas, sé que son muy buenas y deberías estar muy orgullosa de ti misma porque te has esforzado en sacarlas y ahí se ve en los resultados, quiero que sepas que es algo que admiro de ti, si vieras las notas que sacaba yo en la universidad solo te decepcionarías JSJAJAJAJ, pero eso no importa, lo importante es que lo estás sacando de maravilla y aunque hayas tenido un poquito de ayuda de mis velitas y mis rezos todo el mérito es tuyo y quiero que te sientas orgullosa de ti misma como yo lo estoy de ti, además pronto empezarás en el ayuntamiento y ya no tendrás que aguantar a las bratz ni las actividades de tus profesores, así que un buen punto por ahí.
-
-Otra de las cosas de las que quería hablarte es de los carnets de conducir, porque puede que para el próximo mensaje ya tenga carnet y quiero que sepas que lo primero que pienso hacer con mi carnet es ir a verte, tengo unas ganas de poder quedar contigo con libertad sin depender de mi familia, que aunque se preste de gracia, no quiero sentir que tienen esa responsabilidad, quiero llevarte al cine, a ver las fallas, las fiestas de mi pueblo, el mercado navideño, a ver una lluvia de estrellas, a una cena romántica, a cualquier cosa que sea contigo, tengo ganas de tenerlo por ti y por mí para poder verte a ti, así que deseemos que este mensaje sea un avatar de la suerte para mi examen del 1, si es así el próximo mensaje estará lleno de historias interesantes y bonitas, además tú ahora tienes un tiempo de prácticas intensivas que estoy seguro te harán aprobar el práctico a la primera y a tiempo antes de que se caduque el teórico, tengamos fe y dejemos que este mensaje sea una manifestación de nuestros deseos.
-
-¿Sabes? Siento nuestro amor como natural, como algo destinado a ser, algo bonito y tranquilo, como las cosas que encajan por su forma, y creo que nosotros encajamos bien, además de que dejamos que el pegamento de nuestro amor nos una de una forma inseparable, me gusta estar entregado, me gusta estar comprometido contigo, me encanta esa seguridad de saber que deseamos lo mismo, me encanta nuestra relación, que es algo cariñoso, calmado, alegre y divertido, y siempre me esforzaré porque siga siendo así.
-
-Quiero estar sentado frente a un lago, con flores, margaritas, rosas, tulipanes, jazmines, lavandas, y quiero que donde esté haya dos sillas, quiero que donde sea que esté haya una sombra que nos proteja de la cálida tarde, quiero que suenen los pájaros y que la hierba sea verde, quiero estar cómodo y que la brisa me acaricie, quiero muchas cosas para mi futuro, pero lo que tengo claro que necesito en él es esa calma, eso que he descrito es estar junto a ti, eso que he descrito es cómo se siente mi corazón a tu lado, déjame acurrucarme a tu lado y no irme nunca, déjame besarte la frente para siempre, mirarte a los ojos para toda la vida, y besarte por toda la eternidad, quiero que seamos felices y comamos perdices, y todo eso lo quiero junto a ti, gracias por tomarte un tiempo otro mes más en leer este mensaje y espero que te haya gustado, es que eres el amor de mi vida, es que estoy enamoradísimo, quiero todo contigo y nunca voy a dejar de quererlo, puede que repita mucho lo que siento por ti pero es porque quiero que lo tengas claro, hoy y siempre seré tuyo, ojalá te tuviese delante para besarte, pero te debo uno cuando te vea, te amo Chocolatet, eres la que produce todos estos sentimientos y la que me permite escribirlos con las ganas que lo hago, gracias por todo este marzo y gracias por todo en estos diez meses, vamos a ser muy felices 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensajeAbril(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Corazón de melón, te escribo hoy, 24 de abril, para rememorar algunos de los mejores momentos que he pasado a tu lado este mes y los cuales me han hecho sentir tan bien como siempre. Pero antes de nada quería empezar hablando un poco de cómo eres. Eres cómoda, y con cómoda no me refiero a como un cojín, que también, sino que eres una persona con la que es agradable interactuar, eres una persona que intenta hacer sentir mejor con sus palabras, que reconforta y acompaña. Eres encantadora, no podría contar las veces que te he visto sonriendo a una persona que conoces o a algún desconocido mientras hacías algo mundano como comprar, y que con esa sonrisa se ilumine la interacción, es algo muy bonito de ver y que me pasa mucho contigo. Eres valiosa, aportas muchísimo a mi vida, y no solo a la mía, a la de toda la gente que tienes alrededor y con la que hablas, charlas, recuerdas, ayudas, etc... Son algunas cualidades que me gusta destacar de ti porque me parecen cosas buenísimas y que no quiero que pierdas nunca.
-
-También quería contarte un sueño que tengo, y es el de tener hijos contigo, es un deseo, un amor que tengo tan grande por ti que quiero, necesito, ver un reflejo nuestro en una personita pequeñita y adorable. Estoy seguro de que tenerlo supondrá muchos más problemas de los que me puedo llegar a imaginar ahora mismo, pero es que simplemente pensar en todas esas situaciones monas y cariñosas que espero tener con vosotras dos me llena de alegría y no sabes cuánto. Imagínanos, estás volviendo del trabajo, entras por la puerta y ves una pintada en la pared que pone "No ha sido Lara" y luego, cuando investigas más dentro de casa, te la encuentras con unos colores pintándome toda la cara, como la artista que es. Sé que luego tendríamos que limpiar bastante, pero ¿no crees que eso, un recuerdo que tienes tuyo de pequeña, es increíblemente adorable plasmarlo en tu propia hija? Para mí, los recuerdos que todavía no tengo con vosotras dos son los mejores, y quiero y necesito hacer realidad ese sueño, cuidar de una persona, educarla, pensar en su futuro, esforzarme plenamente por ella y desear de todo corazón que triunfe en la vida como sé que haremos nosotros.
-
-Empezamos el mes súper bien, con una escapada a Gandía, al cine a celebrar mi examen, que aunque al final no consiguiera aprobarlo, la recompensa de estar contigo fue maravillosa. Tanto que es uno de los días que recuerdo con mayor cariño de todas las veces que hemos quedado. No sé, hubo algo en ese día que me hizo sentirme tan bien, tener tantos recuerdos bonitos, incluso tener unas fotos maravillosas nuestras en la estantería, que es simplemente wow, qué día tan maravilloso. Cenamos súper bien, tenía muchas ganas de por fin cenar KFC contigo, pero de verdad te lo digo, me lo pasé increíble, y la película estuvo muy muy bien la verdad, la disfruté muchísimo y estuve muy cómodo a tu lado. Era una de las citas que esperaba con más ansia porque es algo como muy de pareja ir al cine juntos y todavía tenía esa espinita clavada por no haber podido tenerla, pero ahora que lo hemos hecho solo quiero tener más, quiero ver muchas películas contigo, quiero disfrutar del cine contigo, es que lo que me pasa es que quiero disfrutar de todo contigo. Te amo, y voy a disfrutar de todas y cada una de las citas que tengamos siempre.
-
-Luego otro momento que quería destacar fue el día que viniste a compartir una comida familiar con nosotros en aquel restaurante tan chulo, sí, aquel de las piedritas JSJAJAJ, era otra de las cosas que tenía muchísimas ganas de hacer contigo, que mi familia nos viera juntos y que disfrutáramos el uno del otro con la diversión y las emociones de mi familia. Ya has visto que tampoco es perfecta, y que a veces gritamos o nos reímos muy fuerte, pero sé que es una familia en la que nos podremos apoyar siempre, tanto yo como tú, y tenlo por seguro de que van a estar de nuestro lado siempre, como yo estaré del tuyo, del tuyo y de la familia que creemos nosotros, tú y yo.
-
-Antes de terminar quería también hablar de una cosa que creo que ha sido súper importante, y que quiero que cuando termines de leer este mensaje reflexiones conmigo. A principios de este mes, y puede que desde antes, cambié un poco mi actitud sobre cómo afrontaba las relaciones íntimas contigo. Durante un tiempo, el simple hecho de dudar sobre tu comodidad en la conversación o interés era suficiente para mí como para que mi mente se ennegreciera y un vórtice de dudas me llevara a intentar detener la interacción, de hecho también evitaba empezarlas, porque el pensar que podía incomodarte, que podría llegar a no gustarte, me asustaba tanto. Tampoco era algo que tuviese en la mente todo el rato, pero no sé, me sentía incómodo, incómodo con esas interacciones, conmigo y con mi libido. Pero gracias a la conversación que tuvimos, a la comunicación abierta que nos esforzamos por tener, creo que está claro que ese bloqueo no nos estaba ayudando a ninguno. Sé que no estuvo bien y por eso te pido mil disculpas, siento si en algún momento te hice sentir mal o no deseada, pero quiero que sepas que es justo lo contrario, me daba miedo que mi deseo tan grande por ti se volviese algo incómodo o que fuese demasiado, así que simplemente lo borré, pero ahora estoy intentando encontrar un mejor equilibrio y espero que se haya notado. Si quieres, ahora cuando termines de leer el mensaje me podrías decir cómo te parece que lo estoy haciendo y si crees que deberíamos cambiar algo o que vamos por buen camino, porque para mí es muy importante hacer esto bien, porque me gustan tanto, me gustan tanto nuestros encuentros íntimos telemáticos que no quiero perderlos nunca.
-
-También quería agradecerte lo comprensiva y amigable que fuiste en ese momento de debilidad, ya sé que puedes estar pensando "claro, soy tu novia, es lo que tengo que hacer", pero en serio, muchísimas gracias, porque para mí en ese momento atajar eso era un mundo, y ahora lo veo como una tontería, y todo gracias a ti. De nuevo, te amo.
-
-Y nada, con esto terminaría un poco de hablar de nuestro mes, es una pena que este mensaje no llegue a mañana porque estoy seguro de que vamos a tener un día increíble, pero bueno, en el próximo mensaje lo hablaremos, que además el próximo mensaje va a ser especial, pues es el mensaje número 12 que te hago, un año entero dedicando mi corazón a abrirme y expresar mis sentimientos por ti en forma de resumen mensual. Lo que empezó siendo una tontería de informático para saber cuánto tiempo exacto nos quedaba para vernos se ha convertido en una auténtica biblioteca de sentimientos, recuerdos y palabras bonitas, y estoy súper orgulloso de ello. Muchas gracias por leer atentamente este mensaje y recuerda que estoy muy ilusionado por nosotros, por nuestra vida y por nuestros hijos. Gracias, mi amor 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensajeMayo(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Hola Chocolatet, me gusta usar Chocolatet, me recuerda al principio, a nuestro principio, el principio de algo precioso, de algo especial, valioso y que, con cada vistazo al pasado, deslumbra un brillo de cariño, de pasión y de amor. Hoy, exactamente hoy, hace 365 días que hablamos por primera vez y, cuando pasó un mes de ese día, la verdad es que no tenía claro del todo qué podría regalarte. Sabía que quería darte algún detalle, aunque fuese pequeño. Nunca había hecho regalos a una pareja, así que no lo tenía claro del todo. Pensé en flores, en una cestita, que luego la hice para tu cumple, incluso en alguna joya, pulsera o collar bonito, pero había algo de todas esas cosas que no me encajaba en ese momento. Nos estábamos conociendo, hablábamos mucho, había muchas muestras de cariño, y yo sentía que tenía que destacar. No podía limitarme a hacer un regalo genérico, como podría haber hecho cualquier otra persona con la chica a la que está conociendo. Yo tenía que destacar, tenía que superar cualquier otro regalo que se me ocurriera. No podían haber medias tintas ni detalles al azar. Y cuando pensé en todo lo que habíamos hablado, en todas las conversaciones que habíamos tenido y en cómo era nuestra relación hasta ese momento, entonces me vino, me vino la idea de algo bonito, personal y en lo que consideraba que era bueno, que es escribirte. Pero no podía ser una nota cualquiera, no, tenía que ser algo especial, algo nuestro, de los dos para disfrutar, de los dos para recordar. Y vaya si recordé. Intenté resumir nuestro primer mes juntos y me pareció tan buena idea, una idea tan maravillosa, que no dejé de hacerlo. Ya no puedo dejar de hacerlo porque nunca voy a querer olvidarte, nunca voy a poder desechar la idea de ti de mi cabeza. Tanto como necesitaba hacerte un regalito, necesitaba dejar memoria de ti, de nosotros, y te lo escribí. Y aquí estamos, un año después, con 12 mensajes recordándolo todo y que cuentan la mejor historia de todas, la mejor historia de la que nunca hubiese esperado ser coprotagonista, y esa es nuestra historia de amor, que es absolutamente maravillosa.
-
-Si hoy voy a hablar de todo este año, creo que tengo que empezar desde el principio, cuando te vi por primera vez. Me acuerdo de que llegué al sitio donde quedamos, nervioso y esperando verte. Me había puesto un outfit refinadamente seleccionado para la ocasión y tenía muchas ganas de ver el tuyo. Entonces, al poco tiempo, apareciste caminando por la calle hacia mí, con una preciosa sonrisa, una de esas que solo ves en las personas que están contentas. Al final llegaste a mi lado, te saludé y salimos hacia la caseta. La verdad es que hasta ahí seguía un poco nervioso, pero entonces empezamos a hablar, a hablar como lo hacíamos todos los días, y me encantó. Me gustó muchísimo, hasta tal punto que perdí todo el miedo y el nerviosismo, y empecé a charlar de una manera más tranquila y genuina. Al final terminamos llegando y seguimos hablando de una manera muy agradable. Todo ese rato estaba pensando y deseando que estuvieses cómoda, quería que fuese agradable para ti y no quería fallar. Por eso llevé varios tipos de bebidas, incluyendo la que habíamos acordado, y varias cenas, porque no quería que no acertar en alguna de estas cosas te echara para atrás, pues eras y eres súper importante para mí. Continuamos muy bien y terminamos con uno de los momentos más especiales para mí y que conservo en el corazón, pese al claro problema que hubo y que me hizo sentir bastante mal. De cualquier modo, es un día que recuerdo con un montón de cariño y que no cambiaría por nada, puesto que fue un principio precioso.
-
-También recuerdo mucho el día de San Juan. Ese día recuerdo pasarlo un poco intranquilo por lo que venía pasándote. Al final conseguí hablar contigo por teléfono. Eso para mí ya fue un gran logro porque ahora, conociéndote más, sé que fue un gran esfuerzo para ti abrirte y dejar que entrara en esa situación tan vulnerable. No sé si lo sabías, pero me esforcé mucho, muchísimo esa noche. Estaba todo el rato pendiente de elegir las palabras correctas, de transmitir los mensajes que importaban de verdad sin ser insensible y sin tampoco pasarme. La verdad es que no terminé de quedarme satisfecho con cómo lo hice, pero al menos creo que pude aliviar, aunque fuese un poco y solo durante ese rato, algo de dolor, y con eso la verdad es que yo me quedé más tranquilo. Fue una temporada dura, pero yo estaba feliz porque pude estar ahí, pude apoyarte, enviarte ánimos y distraerte. Puede que no lo hiciera de maravilla, puede que incluso ni siquiera lo hiciese bien, pero me gustó hacerlo y fue una experiencia de la que he aprendido un montón y de la que seguiré haciéndolo para poder ser cada vez mejor compañero de vida para ti.
-
-Otro día de los nuestros que recuerdo a menudo fue la noche que te pedí salir, pero, antes de ello, quiero hablar de unos meses antes, cuando hablamos del objetivo de nuestra relación. Ese día, cuando lo hablamos, yo estaba muy emocionado porque pensaba que, cuando supieses mis intenciones, cuando supieras lo que sentía, empezaríamos a ser una pareja oficialmente. Y cuando me dijiste que querías que esperáramos algo más de tiempo, por una parte lo entendí, era algo que tenía sentido. Es importante conocerse bien antes de empezar algo así, pero por otra me sentí un poco decepcionado porque, la verdad, yo ya quería ser tu novio. Quería enviarte reels en los que pusiera que era tu novio sin ningún problema y quería esa vida en pareja. Fue en ese momento en el que empecé a pensar ya en pedirte la mano de una forma bonita. Dejé que pasara el tiempo, nos seguimos viendo, queriendo y besando, hasta que ya lo tenía claro. No quería aguantar más, no quería pasar más tiempo sin ser tu novio y me decidí a pedírtelo. Y bajo la luz de la luna, con una flor en la mano, te lo pedí. No sabes lo feliz que fui en el momento en que oí tu respuesta. Era un sí, un sí rotundo, con ilusión y con ganas. Fue genial, algo para recordar siempre, para conservar en el corazón y no soltarlo por nada en el mundo. Ojalá el resto de personas del mundo lleguen algún día a ser tan felices como lo fui yo esa noche, que fue muchísimo. Gracias por aceptar, gracias por tener tanta ilusión y gracias por cuidar una pareja tan bonita que estábamos empezando a formar. Ahora, siempre que me miro la muñeca, tengo un precioso recordatorio de lo bonita que fue la luna que nos alumbraba esa noche de agosto.
-
-El problema vino al poco tiempo. Todo se complicó mucho y rápido. La verdad, siento mucho que fuese así, siento que el principio de algo tan bonito como es lo nuestro tuviese esa traba tan grande. Sé que no es culpa mía ni de nadie, hicimos lo que pudimos, hice lo que pude. Me esforcé por nunca arrepentirme de las decisiones que tomé esos días. Ahora tengo imágenes recurrentes que me aterran, son cosas horribles, me hacen sentir mal, me hacen recordar mal y no me dejan en paz. Pero sabes una cosa, estoy completamente orgulloso de tenerlas. Soy feliz con mi dolor, abrazo esta situación porque fueron mis decisiones. Yo elegí ver todo lo que vi, acompañar todo lo que acompañé y dar todo de mí por no volverme loco en el proceso. Puede que haya sido la tarea más complicada que nunca Dios me ha encomendado, pero terminamos cumpliéndola. Y, por supuesto, no fue todo por valentía, ni muchísimo menos. No podría haber hecho nada de lo que hice si no fuese por ti, mi amor. En una época tan mala todavía tuviste que aguantar malas actitudes mías y falta de presencia. Sé que fue duro para ti porque, además, tú no estabas pasándolo mucho mejor. Sé que durante esa época tuviste tus problemas e inquietudes y que incluso llegaste a dudar de si esto era lo que querías, pero al final lo sacamos todo, con muchísimo coraje y, por fin, al final, se terminó, con una ceremonia preciosa, rodeado de la gente a la que quiero y al lado de la que amo. Me encantó ese día, aunque fuese el final, no estuvo para nada mal gracias a ti y al resto de personas que teníamos. Gracias por todo lo que hiciste, afrontaste, tragaste, soportaste y superaste. No es para nada algo fácil y quiero que sepas que estoy súper orgulloso de ti, de mí y de nosotros. Un reto así, en un momento como ese, no era para nada algo trivial, pero soy feliz de que pasáramos una prueba tan grande juntos. No podría serlo más.
-
-Luego vinieron una retahíla de días maravillosos, tu cumpleaños, Navidad, mi cumpleaños, Año Nuevo, Reyes Magos, todos esos días en los que nos llenamos de ilusión, decoraciones, recetas y momentos bonitos. Sabías que uno de mis días favoritos de todo el invierno fue cuando tomamos chocolate caliente, con churros quemados y vimos una película malísima de Navidad? Parece broma, pero hacer todo eso junto a ti ha creado un recuerdo del que nunca me voy a poder separar. Fue súper bonito, me encantaba estar abrazado a ti, me encantaba sentir tu calor en el invierno y me encantó disfrutar de tu compañía, de verdad que fue especial. Pero no tanto como el día de tu cumple, ese sí que fue un día especial. Aunque al principio tenía un poco de miedo de que terminaras por no querer hacer nada, terminó siendo un día espectacular, una cena muy romántica. Incluso teníamos a mi abuela de testigo y con comida colombiana para rematar. Qué más le podemos pedir a la vida? Yo lo tengo claro, absolutamente nada. Después de eso terminamos llegando a la caseta y ahí sí que nos lo pasamos bien. Tenía unas ganas de dormir contigo que no podía ni creer que estuviese pasando. Todos los días que no lo hago pienso en lo bien que estaría poder hacerlo y, por supuesto, no defraudó. Cómo podía hacerlo si era contigo con la que iba a dormir? Mi preciosidad, me fascinó esa noche contigo, todo era especial, todo era bonito y todo era cómodo. Había preparado los regalos de antemano, te gustaron y pudiste leer la cartita que te preparé y que tanto querías. Gracias por disfrutar tanto de mi compañía ese día y por traer arepas, que no sabes lo que gocé comiéndolas. Gracias a ti, tu cumpleaños fue súper especial. Luego vino Navidad, que, aunque no la pasamos juntos, hablamos mucho, estábamos conectados, incluso cenamos lo mismo. Aunque no te voy a mentir, sigo con la ilusión de que alguno de los dos días lo pases con nosotros, con tu otra familia, porque eso es lo que somos, tu segunda familia. Nunca dudes de ello, siempre te van a querer y apreciar. Por último llegó mi cumple, siempre el último, y cómo no, fue estupendo. Pude disfrutar de un muy buen arroz al horno, de una compañía maravillosa, risas, cotilleo. Mira si fue intenso que tuvimos hasta una baja, JSJAJAJAJAJ, pero bueno, continuamos. Y cuando te di tus regalos de Navidad me encantó ese momento, pero no tanto como tus regalos, amor. No hay día que no mire el cuadro que me hiciste y que flipe del trabajo, esfuerzo y ganas que le pusiste, es increíble. Lo mismo va con la sudadera, no sabes lo que me gusta, no sabes lo que la aprecio. Aprecio muchísimo el esfuerzo, pero también la atención. Sabías que me hacía falta una sudadera y sabías que me encanta Spiderman, y lo juntaste con una cantidad de besos que son incluso menos de los que pienso darte la próxima vez que te vea. Gracias por ellos, por el llavero con el muñequito, también por la pulsera, la cajita, los calcetines, las fotos, las pulseras y por todos los otros detalles que has tenido conmigo. Todos los guardo en mi corazón, todos son súper especiales para mí y todos me han hecho ser súper feliz. Gracias por todo durante estos días.
-
-Ha pasado tiempo desde esos días, han pasado más historias, hemos quedado más veces, hemos reído mucho, hemos disfrutado mucho. También lo hemos pasado mal, ha habido veces que no hemos coincidido emocionalmente, pero estas cosas son la vida, son la vida en pareja, y son las que hacen que me emocione tanto. Me emociona sentir que tengo una relación tan profunda como para tratar todos estos temas, que son normales y reales en todas las relaciones. No siempre vamos a estar al 100 % con el otro, es imposible, pero sé que los dos vamos a estar encantados de poner el porcentaje que le falte al otro. Sé que siempre vamos a estar para sumar al otro, en los momentos difíciles y en los momentos buenos. Sé que no siempre ha sido bonito, pero eso es muy bonito a la vez. Suena paradójico, pero, si te paras a pensarlo, lo es, porque somos a pesar de las adversidades, y me encanta que seamos así. Amor, Chocolatet, Coret, gracias por este primer año, gracias por cada momento, cada cumplido, cada foto, cada beso, cada detalle, cada recuerdo, cada mirada, cada abrazo, cada sonrisa y por todo lo que has aportado a mi vida. A partir de ahora ya nos conocimos hace un año y x meses, y sé que voy a estar súper feliz de contárselo a los demás y alardear de ti. Algún día celebraremos estos aniversarios en nuestra casa, algún día celebraremos estos aniversarios con una escapada y dejando a nuestros hijos a cargo de alguien para poder disfrutar a solas del otro, y algún día podremos disfrutar del otro siendo viejitos. Sé que va a ser así y me emociona tanto pensarlo que quiero vivir todas esas experiencias ya. Quiero pasar la vida contigo, quiero disfrutar de todas las facetas de ti y de tu amor, quiero vivir contigo, triunfar contigo, compartir contigo y disfrutar contigo. Te amo, te amo con locura, eres todo para mí, la única cosa con la que sé que no podría vivir, y eso es todo lo que siempre he querido. Gracias por aparecer en mi vida cuando no lo esperaba y cambiarla de una manera tan drástica que ahora ni siquiera recuerde cómo vivía antes de ti, y no quiero hacerlo, pues sé que no se compara a esta. Espero que te haya gustado el mensaje resumen del año. No he podido hablar de todo, pero sé que tenemos todos esos recuerdos en la mente y que nunca se nos van a ir. Te debo todo mi amor, gracias 🤍. Te debo todo mi amor. Gracias 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensajeJunio(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Coreet, hoy vengo, con retraso eso sí, a escribirte de nuevo, como todos los meses, a contarte de una manera narrada las cositas que hemos estado haciendo este mes, que la verdad ha estado lleno de experiencias chulas y por las que tengo ansias de hablar. Pero antes de eso, quería recordarte una cosa: no importa cuánto escriba, no importa cuántas cosas bonitas te diga, no importa cuánto demuestre por ti y por nuestro amor, siempre voy a amarte más de lo que piensas, siempre. Porque no importa lo bien que lo haga, nunca, y digo nunca, terminaré de expresar con mi cerebro todo lo que mi corazón alberga por ti. Al menos, con estos mensajes dejo que mi cerebro vaya sacando todo ese amor poquito a poquito y dándotelo en forma de palabras bonitas y recuerdos lindos.
-
-Pero bueno, haré un esfuerzo por enseñarte cuánto amor hay aquí dentro y cuánto amor te mereces, solo y únicamente por ser la persona tan maravillosa que eres, que eres la mejor.
-
-Primero que nada debería empezar hablando de mi viaje a Madrid. En esos días la verdad es que me lo pasé bien, no lo puedo negar, ya que estuve haciendo cosas muy guays, pero lo que tampoco puedo negar es que no fue perfecto. Y no fue perfecto porque todo el rato sentía que faltaba algo, y sentía eso porque era cierto. Cualquier experiencia que tenga, por buena que sea, no es perfecta si no la comparto contigo, porque tú tienes la risa que quiero escuchar cuando pasa algo gracioso, tú tienes los ojos que quiero ver cuando haya algo bonito delante, tú eres la obra de arte que quería ver en el Reina Sofía y eres mis ojitos lindos en el concierto de cierto puertorriqueño.
-
-Qué ganas de que llegue el día en el que todas estas experiencias que tengamos, de cosas chulas, de viajes, conciertos y museos, las pasemos juntos y podamos tenerlas como recuerdo en pareja para acordarnos siempre de lo bonito que fue ese día que pasamos juntos disfrutando de la experiencia y del otro. Porque, si no lo comparto contigo, no lo disfruto igual.
-
-También quería hablarte del día que viniste a casa a cenar, en el que hicimos torrà. La verdad es que nos lo pasamos bien y cenamos de lujo, pero lo que de verdad me hace ilusión cuando pienso en ese día es que sigues formando una relación con mi familia. Cada vez conoces más a mi madre, habláis más y os reís más; también con mi hermano y con mi abuela, que espero pronto pueda ajustarte la falda. Y todo eso me emociona y me hace sentir tan increíble, porque tú eres mi familia también, eres mi pareja y, dentro de no tanto tiempo, serás mi mujer. Ver que os lleváis bien me pone súper feliz porque vamos a poder compartir nuestra vida con ellos y va a ser súper bonito. Me encanta eso.
-
-Otro día del que quería hablar es el del examen, que, aunque terminase no saliendo bien del todo, me encantó poder estar a tu lado antes de empezarlo y después de hacerlo. Poder abrazarte, sentirte y animarte me encantó, de verdad que fue increíble. Ahora ya tengo coche y es genial porque podemos vernos mucho más y, en cualquier situación, cualquier plan que tengamos, estoy ahí en un momento. Amo verte, amo estar en tu compañía y, no lo dudes, lo estaré siempre, porque es todo lo que quiero. Miro atrás el último año y solo te veo a ti, lo que he disfrutado, las historias que tengo para contar, todo lo que hemos comido y lo que nos hemos disfrutado los dos.
-
-Y ahora que tengo coche y que tú lo vas a tener pronto, nos vamos a seguir pudiendo disfrutar esto y mucho más. Sé que todos los viajes que tenemos planeados van a ser mágicos, sé que ver las luces de Vigo juntos va a estar espectacular y sé que Grecia, Puerto Rico y Colombia no me los voy a poder sacar de la cabeza hasta el día en que me muera, los disfrutemos solos tú y yo o ya con nuestros hijos o hijas, que seguro serán guapísimos.
-
-Más hacia el final del mes volvimos a salir juntos y esta vez nos fuimos hasta Valencia, la capital, como dice mi abuela. Vaya fotazas tenemos de ese sitio, que hasta mi prima se pensaba que estábamos de viaje JAJAJAJAJA. La verdad es que estuvo muy, muy bien y no te voy a mentir, no sé si te lo había llegado a contar, pero ese sitio me da escalofríos, porque por ese centro comercial es por el que íbamos normalmente cuando salíamos de la habitación del hospital de mi padre. Pero no sé, contigo se sintió bien, como una experiencia nueva, como algo cómodo y que no daba miedo. Vimos mucha ropa y compramos unas cuantas prendas, comimos comida colombiana riquísima y el día nos lo pasamos amándonos muchísimo y demostrándolo con besitos, palabras bonitas y cariño. Jope, de verdad que recuerdo ese día increíble. Lo único malo fue el calor, con eso lo digo todo JAJAJAJAJA. Pero bueno, ojalá muchos días más así, de disfrutarnos los dos, de vernos con poca ropa, de acompañarnos a hacer cosas importantes y de estar el uno para el otro siempre.
-
-Y ya para terminar quería hablarte de San Juan, que la verdad fue un día difícil. Fui con una mentalidad mala, la verdad, estaba negativo y por eso es por lo que las cosas me estaban saliendo tan regular: el golpe, lo de los mojitos y varias cosas con las que me emparanoiaba yo solo. Pero al final fue un día magnífico. Nos pudimos sentir mucho, cenamos de lujo, vimos las hogueras de San Juan, como dice Quevedo, y estuvimos juntos a las doce, demostrando que nos amamos muchísimo y que siempre va a ser así.
-
-Porque el fuego emite una luz que ilumina todo a su alrededor, pero la verdad es que a mí me gusta pensar que se mueve hacia la dirección de las cosas que le gustan, y nosotros dos seguro le enseñamos al fuego que somos la mejor pareja que había en esa playa, por todo lo que hemos vivido y hemos superado, pero también por todas las dificultades que vendrán, por todo el amor que tenemos guardado todavía por demostrar, porque estaremos para el otro en lo que haga falta y por toda esa pasión que albergamos hacia el otro. Ni siquiera con la noche en la cantera me satisfago de ti, solo quiero más, y te quiero solo a ti.
-
-Porque eres la única estrella en mi cielo, la acompañante de la solitaria luna. Quiero que sepas que mi amor será siempre eterno.
-
-Con muchísimo amor,
-
-Tu novio y futuro esposo. 🤍"""
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
-
-async def mes_mensajeJulio(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    mensaje_largo = """Amoor, te escribo de nuevo en este dia tan especial para, como todos los meses hablarte de las pequeñas cosas, de esas que no siempre se tienen en cuenta, de esas cosas que hacemos, que sabemos tu y yo, y que me parece especial guardarlas atemporalmente en estos mensajes para que puedan ser leidos en cualquier momento por nosotros. Y para mi eso es lo que los hace así, que sean nuestros, que sea las cosas que hacemos juntos y que todo sean recuerdos, si te das cuenta, esto es como todas esas veces que nos decimos que queremos crear recuerdos juntos, pues creo que eso es exactamente lo que hacemos cada mes y por eso vale la pena recordarlos por siempre, porque algún dia nos podrían preguntar algo nuestros hijos o familiares y lo tendremos todo apuntado aquí, la prueba inequivoca de nuestro amor desde el inicio.
-    
-    Quería empezar hablando de algo muy bonito que ha pasado y ha sido nuestras continuas salidas a comer, seguramente este sea el mes que mas nos hemos visto de todos, y es porque cada vez que has terminado de trabajar, en esa beca del ayuntamiento de la que tan orgulloso estoy de que con siguieras, nos vemos, comemos algo rico y compartimos un muy buen rato juntos, lo cual me encanta, desde el pollo frito en el merendero de la marjal, pasando por la ensalada de fruta en la font salà, y incluyendo cada ensalada, pasta y cosas ricas que nos hemos hecho muchos dias, y que se que va a seguir así por un buen tiempo, y esque estos momentos son muy bonitos, no solo por verte la carita preciosa casi todos los dias sinó porque me recuerda mucho a algo que todavía no ha pasado, me recuerda a cuando vivamos juntos y hagamos todas las comidas juntos, no se lo veo como un preview de lo que vamos a vivir y eso me encanta, porque de verdad que llevo muchisimo tiempo deseando vivir contigo y compartir cada minuto de mis dias a tu lado, esque va a ser increhíble compartir cada comida, cada tarde viendo series o haciendo cosas, cada ducha y cada vez que invitemos amigos a hacer cosas, me encanta pensar en eso y me hace muy muy feliz, tu compañía me hace muy muy feliz mi Amor, que lo sepas.
-    
-    """
-
-    partes = [mensaje_largo[i:i+4000] for i in range(0, len(mensaje_largo), 4000)]
-
-    for parte in partes:
-        await update.message.reply_text(parte)
+TOKEN = os.getenv("BOT_TOKEN")
+# Con ARRANQUE_PEREZOSO=1 el bot (telegram, handlers, mensajes...) no se carga
+# hasta la primera petición que lo necesita; "/" responde desde el principio.
+ARRANQUE_PEREZOSO = os.getenv("ARRANQUE_PEREZOSO") == "1"
 
 app = Flask(__name__)
 
-# Creamos la aplicación
-application = Application.builder().token(TOKEN).build()
-application.add_handler(CommandHandler("start", start))
-application.add_handler(CommandHandler("set", set_cita))
-application.add_handler(CommandHandler("falta", cuanto_falta))
-application.add_handler(CommandHandler("mes", mes_mensaje))
-application.add_handler(CommandHandler("mes2", mes_mensaje2))
-application.add_handler(CommandHandler("mes3", mes_mensaje3))
-application.add_handler(CommandHandler("mes4", mes_mensaje4))
-application.add_handler(CommandHandler("Octubre", mes_mensajeOctubre))
-application.add_handler(CommandHandler("Noviembre", mes_mensajeNoviembre))
-application.add_handler(CommandHandler("Diciembre", mes_mensajeDiciembre))
-application.add_handler(CommandHandler("Enero", mes_mensajeEnero))
-application.add_handler(CommandHandler("Febrero", mes_mensajeFebrero))
-application.add_handler(CommandHandler("Marzo", mes_mensajeMarzo))
-application.add_handler(CommandHandler("Abril", mes_mensajeAbril))
-application.add_handler(CommandHandler("Mayo", mes_mensajeMayo))
-application.add_handler(CommandHandler("Junio", mes_mensajeJunio))
-application.add_handler(CommandHandler("Julio", mes_mensajeJulio))
-
 loop = asyncio.new_event_loop()
 asyncio.set_event_loop(loop)
 
-@app.route("/procesar-logs", methods=["GET"])
-def procesar_logs():
-    lock.acquire()
-    try:
-        if not os.path.exists(LOG_BUFFER_FILE):
-            return "No logs", 200
-
-        with open(LOG_BUFFER_FILE, "r") as f:
-            logs = json.load(f)
-
-        if not logs:
-            return "No logs", 200
-
-        # Enviar logs uno a uno (o implementar envío en batch si Google Apps Script lo permite)
-        for log in logs:
-            try:
-                requests.post(GOOGLE_SCRIPT_WEBHOOK,
-                              json={
-                                  "usuario": log["usuario"],
-                                  "comando": log["comando"],
-                                  "fecha": log["fecha"]  # <-- enviar fecha del log (la cita si es /set)
-                              },
-                              timeout=5)
-            except Exception as e:
-                print(f"Error enviando log a Google Sheets: {e}", flush=True)
-
-        # Limpiar buffer
-        with open(LOG_BUFFER_FILE, "w") as f:
-            json.dump([], f)
-
-        return "Logs procesados", 200
-    finally:
-        lock.release()
-
-async def start_app():
-    await application.initialize()  # Inicializa internamente el bot también
-    await application.start()
+_bot = None
+_bot_lock = threading.Lock()
+_bot_parado = False
+bot_listo = threading.Event()
+_primera_respuesta = threading.Event()
+
+def cargar_bot(esperar=True):
+    # Importa el bot y arranca su hilo una sola vez; con esperar=True también
+    # espera a que application esté inicializada
+    global _bot
+    if _bot is None:
+        with _bot_lock:
+            if _bot is None:
+                with fases.medir("importar_bot"):
+                    import bot
+                threading.Thread(target=run_bot, args=(bot,), daemon=True).start()
+                _bot = bot
+    if esperar:
+        bot_listo.wait(timeout=30)
+    return _bot
+
+async def start_app(bot):
+    await bot.iniciar()
+    bot_listo.set()
+    fases.marcar("bot_listo")
     # Mantener vivo el loop para que el bot no cierre
     while True:
         await asyncio.sleep(3600)
 
-def run_bot():
-    loop.run_until_complete(start_app())
+def run_bot(bot):
+    loop.run_until_complete(start_app(bot))
+
+def parar_bot():
+    # Al terminar el proceso o el worker de gunicorn (worker_exit): vuelca los
+    # contadores agregados y cierra el buffer de logs. Idempotente.
+    global _bot_parado
+    with _bot_lock:
+        if _bot is None or _bot_parado:
+            return
+        _bot_parado = True
+    try:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(_bot.parar(), loop).result(timeout=15)
+        else:
+            # El bot no llegó a arrancar o su loop ya murió
+            _bot.volcar_agregados()
+            _bot.buffer_logs.cerrar()
+    except Exception:
+        log.exception("Error parando el bot")
+
+atexit.register(parar_bot)
+
+def bot_en_marcha(bot):
+    # Si application.initialize() falla (p. ej. sin red al arrancar), run_bot
+    # termina y el loop deja de correr: lo que se le mande no se procesa nunca
+    return loop.is_running() and bot.application.running
 
-threading.Thread(target=run_bot, daemon=True).start()
+@app.route("/procesar-logs", methods=["GET"])
+def procesar_logs():
+    return cargar_bot(esperar=False).vaciar_logs()
 
 @app.route(f"/webhook/{TOKEN}", methods=["POST"])
 def webhook_handler():
-    json_update = request.get_json(force=True)
-    update = Update.de_json(json_update, application.bot)  # Usar bot ya inicializado en application
-    future = asyncio.run_coroutine_threadsafe(application.process_update(update), loop)
+    bot = cargar_bot()
+    try:
+        json_update = cargar_json(request.get_data())
+    except ValueError:
+        return "Update inválido", 400
+    if not isinstance(json_update, dict) or not isinstance(json_update.get("update_id"), int):
+        return "Update inválido", 400
+    if not bot.enrutador.relevante(json_update):
+        # Nadie lo atiende: ni Update ni loop del bot
+        respuesta = "ok", 200
+    elif bot.WEBHOOK_MODO == "inmediato":
+        respuesta = webhook_inmediato(bot, json_update)
+    else:
+        respuesta = webhook_sincrono(bot, json_update)
+    if not _primera_respuesta.is_set():
+        _primera_respuesta.set()
+        fases.marcar("primera_respuesta_webhook")
+    return respuesta
+
+def webhook_sincrono(bot, json_update):
+    from telegram import Update
+
+    if bot.updates_vistos.ya_visto(json_update["update_id"]):
+        return "ok", 200
+    recibido = time.perf_counter()
+    update = Update.de_json(json_update, bot.application.bot)  # Usar bot ya inicializado en application
+    future = asyncio.run_coroutine_threadsafe(bot.despachar(recibido, update), loop)
     try:
         future.result(timeout=10)
-    except Exception as e:
-        print(f"Error procesando update: {e}")
+    except concurrent.futures.TimeoutError:
+        if not bot_en_marcha(bot):
+            # Nadie lo va a procesar: que Telegram lo reenvíe
+            future.cancel()
+            log.error("Update sin procesar: el bot no está en marcha", extra={"update_id": update.update_id})
+            bot.updates_vistos.olvidar(update.update_id)
+            return "Error", 500
+        # Sigue procesándose en el loop del bot: el id se queda marcado para
+        # que el reenvío de Telegram no lo atienda otra vez
+        log.warning("Update lento, se sigue procesando", extra={"update_id": update.update_id})
+        future.add_done_callback(bot.fallo_tardio(update.update_id))
+        return "ok", 200
+    except Exception:
+        log.exception("Error procesando update", extra={"update_id": update.update_id})
+        bot.updates_vistos.olvidar(update.update_id)
+        return "Error", 500
+    return "ok", 200
+
+def webhook_inmediato(bot, json_update):
+    from telegram import Update
+
+    # Encolamos y respondemos ya; el loop del bot lo procesa después
+    if bot.updates_vistos.ya_visto(json_update["update_id"]):
+        return "ok", 200
+    recibido = time.perf_counter()
+    update = Update.de_json(json_update, bot.application.bot)
+    if not bot_en_marcha(bot):
+        log.error("Update sin procesar: el bot no está en marcha", extra={"update_id": update.update_id})
+        bot.updates_vistos.olvidar(update.update_id)
         return "Error", 500
+    if not bot.cola_updates.poner((recibido, update)):
+        bot.updates_vistos.olvidar(update.update_id)
+        return "Cola llena", 503
     return "ok", 200
 
+@app.route("/estado-cola", methods=["GET"])
+def estado_cola():
+    return jsonify(cargar_bot(esperar=False).cola_updates.estado()), 200
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    return registro.exponer(), 200, {"Content-Type": TIPO_CONTENIDO}
+
+@app.route("/arranque", methods=["GET"])
+def arranque():
+    return jsonify({"perezoso": ARRANQUE_PEREZOSO, "bot_cargado": _bot is not None,
+                    "bot_listo": bot_listo.is_set(), "fases": fases.informe()}), 200
+
+@app.route("/admin/bloqueos", methods=["GET"])
+def admin_bloqueos():
+    # Bloqueos del loop del bot: los últimos y las pilas que más tiempo lo han parado
+    bot = cargar_bot(esperar=False)
+    if not bot.admin_autorizado(request.args.get("token")):
+        return "Prohibido", 403
+    return jsonify(bot.informe_bloqueos()), 200
+
 @app.route("/", methods=["GET"])
 def home():
     return "Bot de Valentina y Adrià está vivo 🤍", 200
 
 @app.route("/set-webhook", methods=["GET"])
 def set_webhook():
+    bot = cargar_bot()
     webhook_url = f"https://tu-dominio.com/webhook/{TOKEN}"
-    success = loop.run_until_complete(application.bot.set_webhook(url=webhook_url))
+    # El loop ya está corriendo en el hilo del bot: le pasamos la corrutina
+    future = asyncio.run_coroutine_threadsafe(bot.application.bot.set_webhook(url=webhook_url), loop)
+    success = future.result(timeout=10)
     return f"Webhook {'creado con éxito' if success else 'falló'}"
 
+fases.marcar("app_flask")
+if not ARRANQUE_PEREZOSO:
+    with _bot_lock:
+        with fases.medir("importar_bot"):
+            import bot as _bot
+        threading.Thread(target=run_bot, args=(_bot,), daemon=True).start()
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port)
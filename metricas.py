@@ -0,0 +1,198 @@
+import functools
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+# Métricas en memoria con exposición en formato de texto de Prometheus.
+# Sin dependencias: contadores, histogramas y medidores (estos últimos leen su
+# valor de una función en el momento de exponerlos).
+
+TIPO_CONTENIDO = "text/plain; version=0.0.4; charset=utf-8"
+CUBETAS_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _etiquetas(nombres, valores, extra=""):
+    partes = [f'{n}="{str(v)}"' for n, v in zip(nombres, valores)]
+    if extra:
+        partes.append(extra)
+    return "{" + ",".join(partes) + "}" if partes else ""
+
+
+class _Metrica:
+    tipo = None
+
+    def __init__(self, nombre, ayuda, etiquetas=()):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self._lock = threading.Lock()
+
+    def cabecera(self):
+        return [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} {self.tipo}"]
+
+
+class Contador(_Metrica):
+    tipo = "counter"
+
+    def __init__(self, nombre, ayuda, etiquetas=()):
+        super().__init__(nombre, ayuda, etiquetas)
+        self._valores = {}
+
+    def inc(self, *valores, cantidad=1):
+        with self._lock:
+            self._valores[valores] = self._valores.get(valores, 0) + cantidad
+
+    def exponer(self):
+        with self._lock:
+            valores = list(self._valores.items())
+        return self.cabecera() + [f"{self.nombre}{_etiquetas(self.etiquetas, k)} {v}"
+                                  for k, v in valores]
+
+
+class Histograma(_Metrica):
+    tipo = "histogram"
+
+    def __init__(self, nombre, ayuda, etiquetas=(), cubetas=CUBETAS_LATENCIA):
+        super().__init__(nombre, ayuda, etiquetas)
+        self.cubetas = tuple(cubetas)
+        self._series = {}   # valores de etiquetas -> [cuentas por cubeta..., suma, total]
+
+    def observar(self, valor, *valores):
+        with self._lock:
+            serie = self._series.get(valores)
+            if serie is None:
+                serie = self._series[valores] = [0] * (len(self.cubetas) + 2)
+            for i, limite in enumerate(self.cubetas):
+                if valor <= limite:
+                    serie[i] += 1
+            serie[-2] += valor
+            serie[-1] += 1
+
+    def cronometrar(self, *valores):
+        return _Cronometro(self, valores)
+
+    def exponer(self):
+        with self._lock:
+            series = [(k, list(v)) for k, v in self._series.items()]
+        lineas = self.cabecera()
+        for k, serie in series:
+            for limite, cuenta in zip(self.cubetas, serie):
+                le = 'le="%s"' % limite
+                lineas.append(f"{self.nombre}_bucket{_etiquetas(self.etiquetas, k, le)} {cuenta}")
+            le = 'le="+Inf"'
+            lineas.append(f"{self.nombre}_bucket{_etiquetas(self.etiquetas, k, le)} {serie[-1]}")
+            lineas.append(f"{self.nombre}_sum{_etiquetas(self.etiquetas, k)} {serie[-2]}")
+            lineas.append(f"{self.nombre}_count{_etiquetas(self.etiquetas, k)} {serie[-1]}")
+        return lineas
+
+
+class _Cronometro:
+    def __init__(self, histograma, valores):
+        self.histograma = histograma
+        self.valores = valores
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histograma.observar(time.perf_counter() - self.inicio, *self.valores)
+
+
+class Medidor(_Metrica):
+    # Valor leído de una función al exponer. Con tipo="counter" sirve para
+    # publicar contadores que ya lleva otro objeto.
+    def __init__(self, nombre, ayuda, funcion, tipo="gauge"):
+        super().__init__(nombre, ayuda)
+        self.funcion = funcion
+        self.tipo = tipo
+
+    def exponer(self):
+        try:
+            valor = self.funcion()
+        except Exception:
+            log.exception("Error leyendo la métrica %s", self.nombre)
+            return []
+        return self.cabecera() + [f"{self.nombre} {valor}"]
+
+
+class Registro:
+    def __init__(self):
+        self._metricas = []
+
+    def _añadir(self, metrica):
+        self._metricas.append(metrica)
+        return metrica
+
+    def contador(self, nombre, ayuda, etiquetas=()):
+        return self._añadir(Contador(nombre, ayuda, etiquetas))
+
+    def histograma(self, nombre, ayuda, etiquetas=(), cubetas=CUBETAS_LATENCIA):
+        return self._añadir(Histograma(nombre, ayuda, etiquetas, cubetas))
+
+    def medidor(self, nombre, ayuda, funcion, tipo="gauge"):
+        return self._añadir(Medidor(nombre, ayuda, funcion, tipo))
+
+    def exponer(self):
+        lineas = []
+        for metrica in self._metricas:
+            lineas.extend(metrica.exponer())
+        return "\n".join(lineas) + "\n"
+
+
+registro = Registro()
+
+comandos_total = registro.contador(
+    "bot_comandos_total", "Comandos recibidos", ("comando",))
+comandos_errores = registro.contador(
+    "bot_comandos_errores_total", "Comandos que terminaron con excepción", ("comando",))
+comandos_duracion = registro.histograma(
+    "bot_comando_duracion_segundos", "Duración de los handlers de comandos", ("comando",))
+
+
+def _comando(update, comandos):
+    # Comando del mensaje, solo si es uno de los del handler (cardinalidad acotada)
+    mensaje = update.effective_message  # también los comandos editados
+    texto = mensaje.text if mensaje and mensaje.text else ""
+    comando = texto.split(maxsplit=1)[0][1:].split("@", 1)[0].lower() if texto else ""
+    return f"/{comando}" if comando in comandos else "/desconocido"
+
+
+def instrumentar(application):
+    # Envuelve el callback de cada CommandHandler registrado para contar
+    # llamadas, errores y medir su latencia por comando (también queda una
+    # traza por comando con su latencia)
+    from telegram.ext import CommandHandler
+
+    for handlers in application.handlers.values():
+        for handler in handlers:
+            if isinstance(handler, CommandHandler):
+                handler.callback = _envolver(handler.callback, handler.commands)
+
+
+def _envolver(callback, comandos):
+    @functools.wraps(callback)
+    async def envuelto(update, context):
+        comando = _comando(update, comandos)
+        comandos_total.inc(comando)
+        inicio = time.perf_counter()
+        error = False
+        try:
+            return await callback(update, context)
+        except Exception:
+            comandos_errores.inc(comando)
+            error = True
+            raise
+        finally:
+            duracion = time.perf_counter() - inicio
+            comandos_duracion.observar(duracion, comando)
+            log.info("%s atendido", comando, extra={
+                "usuario_id": update.effective_user.id if update.effective_user else None,
+                "chat": update.effective_chat.id if update.effective_chat else None,
+                "comando": comando,
+                "latencia_ms": round(duracion * 1000, 2),
+                "fallo": error,
+            })
+    return envuelto
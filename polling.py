@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import time
+
+from telegram.error import NetworkError, RetryAfter
+
+import bot
+from bot import application, despachador
+from despachador import clave_chat
+
+log = logging.getLogger(__name__)
+
+# Modo long-polling: sin servidor web. El bot pide los updates a Telegram con
+# getUpdates y los pasa al mismo despachador que el webhook (en paralelo entre
+# chats, en orden dentro de cada chat).
+#
+#   python polling.py
+#
+# Telegram no entrega updates por getUpdates mientras haya un webhook puesto,
+# así que se borra al arrancar; para volver al webhook, /set-webhook.
+
+TIMEOUT = 30          # segundos que Telegram retiene cada getUpdates sin updates
+ESPERA_MAXIMA = 60
+# Telegram ya filtra lo que ningún handler atiende (como el enrutado del webhook)
+TIPOS = ["message", "edited_message", "inline_query"]
+
+
+async def sondear():
+    offset = None
+    espera = 1
+    while True:
+        try:
+            updates = await application.bot.get_updates(
+                offset=offset, timeout=TIMEOUT, allowed_updates=TIPOS)
+        except RetryAfter as e:
+            await asyncio.sleep(e.retry_after)
+            continue
+        except NetworkError as e:
+            log.warning("Error pidiendo updates, reintento en %ss: %s", espera, e)
+            await asyncio.sleep(espera)
+            espera = min(espera * 2, ESPERA_MAXIMA)
+            continue
+        espera = 1
+        for update in updates:
+            # El siguiente getUpdates con este offset confirma los anteriores
+            offset = update.update_id + 1
+            await despachador.poner(clave_chat(update), (time.perf_counter(), update))
+
+
+async def main():
+    await bot.iniciar()
+    await application.bot.delete_webhook()
+    try:
+        await sondear()
+    finally:
+        await bot.parar()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,153 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import re
+from datetime import datetime, timedelta
+
+log = logging.getLogger(__name__)
+
+# Recordatorios de citas con un único heap de temporizadores.
+# Por cada cita se programa un aviso para cada antelación configurada (por
+# ejemplo 1 día, 1 hora y a la hora exacta). Una sola tarea duerme hasta el
+# próximo aviso. Al cambiar una cita se le da una "generación" nueva y los
+# avisos antiguos que queden en el heap se ignoran al salir. Una cita sin
+# avisos por delante (ya salió el último, o es pasada) no se guarda en memoria.
+
+ANTELACIONES = "1d,1h,0"
+
+_UNIDADES = {"d": "days", "h": "hours", "m": "minutes", "s": "seconds"}
+
+
+def parsear_antelaciones(texto):
+    # "1d,1h,30m,0" -> [timedelta(days=1), timedelta(hours=1), ...]
+    antelaciones = []
+    for trozo in texto.split(","):
+        trozo = trozo.strip()
+        if not trozo:
+            continue
+        if trozo == "0":
+            antelaciones.append(timedelta(0))
+            continue
+        m = re.fullmatch(r"(\d+)([dhms])", trozo)
+        if not m:
+            raise ValueError(f"Antelación no válida: {trozo}")
+        antelaciones.append(timedelta(**{_UNIDADES[m.group(2)]: int(m.group(1))}))
+    return sorted(set(antelaciones), reverse=True)
+
+
+def describir(antelacion):
+    segundos = int(antelacion.total_seconds())
+    for unidad, singular, plural in ((86400, "día", "días"), (3600, "hora", "horas"),
+                                     (60, "minuto", "minutos"), (1, "segundo", "segundos")):
+        if segundos >= unidad and segundos % unidad == 0:
+            n = segundos // unidad
+            return f"{n} {singular if n == 1 else plural}"
+    return "0 segundos"
+
+
+class Recordatorios:
+    def __init__(self, enviar, zona, antelaciones):
+        # enviar(chat_id, texto): encola el mensaje (el planificador de envíos)
+        # zona: ZoneInfo en la que están expresadas las citas guardadas
+        self._enviar = enviar
+        self.zona = zona
+        self.antelaciones = antelaciones
+
+        self._heap = []
+        self._generaciones = {}   # (chat_id, nombre) -> generación actual, si quedan avisos
+        self._fechas = {}         # (chat_id, nombre) -> fecha programada, si quedan avisos
+        self._contador = itertools.count()
+        self._cambio = None
+        self._tarea = None
+
+    def programar(self, chat_id, nombre, fecha):
+        # fecha: datetime naive en self.zona. Sustituye los avisos anteriores
+        # de la misma cita. No hace nada si los recordatorios no están en marcha
+        # (con varios procesos solo los lleva el líder).
+        if self._cambio is None:
+            return
+        clave = (chat_id, nombre)
+        # Única entre todas las citas: aunque se olvide la clave, un aviso
+        # viejo no puede coincidir con la generación de una cita nueva
+        generacion = next(self._contador)
+
+        cita = fecha.replace(tzinfo=self.zona).timestamp()
+        ahora = datetime.now(self.zona).timestamp()
+        programados = 0
+        for antelacion in self.antelaciones:
+            instante = cita - antelacion.total_seconds()
+            if instante > ahora:
+                heapq.heappush(self._heap, (instante, next(self._contador), clave,
+                                            generacion, antelacion))
+                programados += 1
+        if programados:
+            self._fechas[clave] = fecha
+            self._generaciones[clave] = generacion
+        else:
+            self._fechas.pop(clave, None)
+            self._generaciones.pop(clave, None)
+        self._cambio.set()
+
+    def pendientes(self):
+        return len(self._heap)
+
+    def activo(self):
+        return self._tarea is not None
+
+    def iniciar(self, citas=()):
+        # citas: iterable de (chat_id, nombre, fecha) para reconstruir el heap
+        self._cambio = asyncio.Event()
+        self._tarea = asyncio.create_task(self._bucle())
+        self.sincronizar(citas)
+
+    def sincronizar(self, citas):
+        # Programa las citas nuevas o cambiadas (p. ej. guardadas por otro proceso)
+        for chat_id, nombre, fecha in citas:
+            if self._fechas.get((chat_id, nombre)) != fecha:
+                self.programar(chat_id, nombre, fecha)
+
+    def parar(self):
+        if self._tarea is not None:
+            self._tarea.cancel()
+            self._tarea = None
+        self._cambio = None
+
+    def _texto(self, nombre, antelacion):
+        cita = f"la cita «{nombre}»" if nombre else "la cita"
+        if not antelacion:
+            return f"¡Es la hora de {cita}! Divertíos 🤍"
+        cuanto = describir(antelacion)
+        verbo = "queda" if cuanto.startswith("1 ") else "quedan"
+        return f"Recordatorio: {verbo} {cuanto} para {cita} ⏳"
+
+    async def _bucle(self):
+        while True:
+            self._cambio.clear()
+            if not self._heap:
+                await self._cambio.wait()
+                continue
+            espera = self._heap[0][0] - datetime.now(self.zona).timestamp()
+            if espera > 0:
+                try:
+                    # Nos despertamos antes si se programa algo nuevo
+                    await asyncio.wait_for(self._cambio.wait(), espera)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, clave, generacion, antelacion = heapq.heappop(self._heap)
+            if self._generaciones.get(clave) != generacion:
+                continue  # la cita cambió después de programar este aviso
+            if antelacion == self.antelaciones[-1]:
+                # El último aviso de la cita (el de menor antelación, que sale
+                # siempre que haya salido alguno)
+                del self._generaciones[clave]
+                del self._fechas[clave]
+            chat_id, nombre = clave
+            try:
+                self._enviar(chat_id, self._texto(nombre, antelacion))
+            except Exception:
+                log.exception("Error enviando recordatorio", extra={"chat": chat_id})
+            # Cedemos el loop entre avisos aunque venzan muchos a la vez
+            await asyncio.sleep(0)
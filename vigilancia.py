@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+# Vigilante de bloqueos del event loop.
+# Una tarea del loop late cada INTERVALO y apunta cuándo lo hizo; un hilo aparte
+# comprueba el último latido. Si el loop lleva más de umbral sin latir es que
+# algo lo está bloqueando (E/S síncrona, CPU...): el hilo saca en ese momento
+# la pila del hilo del loop con sys._current_frames(), que apunta a la llamada
+# culpable. Cuando el loop vuelve, el latido pone la duración al bloqueo.
+#
+# Se guardan los últimos bloqueos (un buffer circular) y un resumen por pila
+# con los peores, para consultarlo en /admin/bloqueos.
+
+INTERVALO = 0.05
+UMBRAL = 0.1
+MAX_BLOQUEOS = 50     # últimos bloqueos guardados
+MAX_PILAS = 50        # pilas distintas en el resumen
+PROFUNDIDAD = 25      # marcos de pila que se guardan
+MARCOS_FIRMA = 3      # marcos más internos que identifican una pila
+
+
+class VigilanteLoop:
+    def __init__(self, umbral=UMBRAL, intervalo=INTERVALO, max_bloqueos=MAX_BLOQUEOS,
+                 al_latir=None):
+        # al_latir(retraso): opcional, p. ej. para un histograma
+        self.umbral = umbral
+        self.intervalo = intervalo
+        self.al_latir = al_latir
+        self._lock = threading.Lock()
+        self._recientes = deque(maxlen=max_bloqueos)
+        self._por_pila = {}       # firma -> resumen
+        self._hilo_loop = None
+        self._ultimo = None       # time.monotonic() del último latido
+        self._captura = None      # pila sacada durante el bloqueo en curso
+        self._tarea = None
+        self._parar = threading.Event()
+        self.bloqueos = 0
+        self.retraso_maximo = 0.0
+
+    def iniciar(self):
+        # Desde el loop que se quiere vigilar
+        self._hilo_loop = threading.get_ident()
+        self._ultimo = time.monotonic()
+        self._parar.clear()
+        self._tarea = asyncio.create_task(self._latir())
+        threading.Thread(target=self._vigilar, name="vigilante-loop", daemon=True).start()
+
+    def parar(self):
+        self._parar.set()
+        if self._tarea is not None:
+            self._tarea.cancel()
+            self._tarea = None
+
+    async def _latir(self):
+        while True:
+            antes = time.monotonic()
+            await asyncio.sleep(self.intervalo)
+            ahora = time.monotonic()
+            self._ultimo = ahora
+            retraso = ahora - antes - self.intervalo
+            self.retraso_maximo = max(self.retraso_maximo, retraso)
+            if self.al_latir is not None:
+                self.al_latir(retraso)
+            with self._lock:
+                captura, self._captura = self._captura, None
+            if captura is not None:
+                self._apuntar(captura, retraso)
+
+    def _vigilar(self):
+        while not self._parar.wait(self.intervalo / 2):
+            if time.monotonic() - self._ultimo < self.umbral:
+                continue
+            with self._lock:
+                if self._captura is not None:
+                    continue   # ya tenemos la pila de este bloqueo
+            marco = sys._current_frames().get(self._hilo_loop)
+            if marco is None:
+                continue
+            pila = traceback.extract_stack(marco)[-PROFUNDIDAD:]
+            with self._lock:
+                self._captura = (time.time(), pila)
+
+    def _apuntar(self, captura, retraso):
+        cuando, pila = captura
+        lineas = [f"{m.filename}:{m.lineno} en {m.name}: {m.line}" for m in pila]
+        firma = tuple((m.filename, m.lineno, m.name) for m in pila[-MARCOS_FIRMA:])
+        duracion_ms = round(retraso * 1000, 1)
+        with self._lock:
+            self.bloqueos += 1
+            self._recientes.append({"cuando": cuando, "duracion_ms": duracion_ms, "pila": lineas})
+            resumen = self._por_pila.get(firma)
+            if resumen is None:
+                if len(self._por_pila) >= MAX_PILAS:
+                    # Sitio para la nueva: fuera la que menos tiempo ha bloqueado
+                    del self._por_pila[min(self._por_pila, key=lambda f: self._por_pila[f]["total_ms"])]
+                resumen = self._por_pila[firma] = {"veces": 0, "total_ms": 0.0, "max_ms": 0.0, "pila": lineas}
+            resumen["veces"] += 1
+            resumen["total_ms"] = round(resumen["total_ms"] + duracion_ms, 1)
+            resumen["max_ms"] = max(resumen["max_ms"], duracion_ms)
+        log.warning("Loop bloqueado %.1f ms en %s", duracion_ms, lineas[-1] if lineas else "?",
+                    extra={"duracion_ms": duracion_ms})
+
+    def informe(self):
+        with self._lock:
+            return {
+                "umbral_ms": self.umbral * 1000,
+                "bloqueos": self.bloqueos,
+                "retraso_maximo_ms": round(self.retraso_maximo * 1000, 1),
+                "peores": sorted(self._por_pila.values(), key=lambda r: -r["total_ms"]),
+                "recientes": list(reversed(self._recientes)),
+            }